@@ -0,0 +1,52 @@
+"""Decode time of every league fixture with each installed json decoder
+
+The bodies are decoded straight from bytes, the way the transports do.
+
+Usage: python -m benchmarks.decoders [repeat]
+"""
+
+import glob
+import os
+import sys
+import timeit
+
+from yfantasy_api.api.transport import DECODERS, load_decoder
+
+
+def available_decoders():
+    decoders = {}
+    for name in DECODERS:
+        try:
+            decoders[name] = load_decoder(name)
+        except ImportError:
+            print(f"{name} is not installed, skipping")
+    return decoders
+
+
+def main(repeat=50):
+    decoders = available_decoders()
+    print(f"{'fixture':<32} {'KB':>6} " + " ".join(f"{n:>10}" for n in decoders))
+
+    totals = dict.fromkeys(decoders, 0.0)
+    for fixture in sorted(glob.glob("tests/resources/league/*.json")):
+        with open(fixture, "rb") as f:
+            body = f.read()
+
+        timings = []
+        for name, decode in decoders.items():
+            elapsed = min(timeit.repeat(lambda: decode(body), number=1, repeat=repeat))
+            totals[name] += elapsed
+            timings.append(f"{elapsed * 1000:8.3f}ms")
+
+        name = os.path.basename(fixture)
+        print(f"{name:<32} {len(body) / 1024:6.0f} " + " ".join(timings))
+
+    stdlib = totals["json"]
+    print(
+        f"{'total (speedup)':<39} "
+        + " ".join(f"{stdlib / t:9.1f}x" for t in totals.values())
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
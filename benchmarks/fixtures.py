@@ -0,0 +1,204 @@
+"""Replay every recorded fixture through the full client stack
+
+Each fixture in `tests/resources/{game,league,team,user}` is served by a
+transport that never touches the network, then decoded and turned into
+models by the same builder chain a user would call. For every resource
+the latency, the memory allocated while parsing (tracemalloc), the
+memory retained by the resulting model and the number of objects it
+holds on to are reported.
+
+The results can be written to a JSON file and compared with the results
+of a previous release, any resource whose allocations or objects grew
+past the threshold is reported as a regression. Both are deterministic,
+unlike timings which are only gated when a latency threshold is given.
+
+Usage: python -m benchmarks.fixtures [--repeat N] [--output FILE]
+           [--compare FILE] [--threshold PCT] [--latency-threshold PCT]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import requests
+
+from benchmarks.stub_server import make_api
+from yfantasy_api.api.transport import Transport
+
+SCENARIOS = {
+    "game/game": lambda api: api.game(),
+    "game/game_weeks": lambda api: api.game().game_weeks(),
+    "game/games": lambda api: api.games(),
+    "game/old": lambda api: api.game(),
+    "game/position_types": lambda api: api.game().position_types(),
+    "game/roster_positions": lambda api: api.game().roster_positions(),
+    "game/stat_categories": lambda api: api.game().stat_categories(),
+    "league/draftresults": lambda api: api.league().draft_results(),
+    "league/meta": lambda api: api.league().meta(),
+    "league/players": lambda api: api.league().players(),
+    "league/players_empty": lambda api: api.league().players(),
+    "league/players_with_draft_analysis": lambda api: (
+        api.league().players().draft_analysis()
+    ),
+    "league/players_with_ownership": lambda api: api.league().players().ownership(),
+    "league/players_with_percent_owned": lambda api: (
+        api.league().players().percent_owned()
+    ),
+    "league/players_with_stats": lambda api: api.league().players().stats(),
+    "league/scoreboard": lambda api: api.league().scoreboard(),
+    "league/scoreboard_nfl": lambda api: api.league().scoreboard(),
+    "league/settings": lambda api: api.league().settings(),
+    "league/settings_nfl": lambda api: api.league().settings(),
+    "league/standings": lambda api: api.league().standings(),
+    "league/teams": lambda api: api.league().teams(),
+    "league/transactions": lambda api: api.league().transactions(),
+    "league/transactions_empty": lambda api: api.league().transactions(),
+    "team/matchups": lambda api: api.team(1).matchups(),
+    "team/meta": lambda api: api.team(1).meta(),
+    "team/roster": lambda api: api.team(1).roster(),
+    "team/roster_with_stats": lambda api: api.team(1).roster().stats(),
+    "team/standings": lambda api: api.team(1).standings(),
+    "team/standings_with_divisions": lambda api: api.team(1).standings(),
+    "team/stats": lambda api: api.team(1).stats(),
+    "team/teams_standings": lambda api: api.teams([1, 2]).standings(),
+    "user/games": lambda api: api.user().games(),
+    "user/meta": lambda api: api.user().meta(),
+    "user/teams": lambda api: api.user().teams(),
+}
+
+# The compared metrics and the smallest absolute change that counts as
+# a regression, so that noise on tiny fixtures isn't reported
+METRICS = {"min_ms": 0.01, "allocated_kb": 1.0, "objects": 1}
+
+
+class ReplayTransport(Transport):
+    """A Transport that answers every GET with the same recorded body"""
+
+    def __init__(self, decoder="auto"):
+        super().__init__(decoder=decoder)
+        self.body = b""
+
+    def get(self, url, params=None, headers=None):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = self.body
+        return response
+
+
+def measure(api, build, repeat):
+    """Replay one fixture, returning its latency and memory figures"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(api).get()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    gc.disable()
+    objects = len(gc.get_objects())
+    tracemalloc.start()
+    model = build(api).get()
+    retained, allocated = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.enable()
+    gc.collect()
+    objects = len(gc.get_objects()) - objects
+    del model
+
+    return {
+        "min_ms": round(min(timings) * 1000, 4),
+        "median_ms": round(statistics.median(timings) * 1000, 4),
+        "allocated_kb": round(allocated / 1024, 1),
+        "retained_kb": round(retained / 1024, 1),
+        "objects": objects,
+    }
+
+
+def run(repeat, decoder="auto"):
+    transport = ReplayTransport(decoder)
+    api = make_api("http://replay", timeout=0, transport=transport)
+
+    results = {}
+    for name, build in SCENARIOS.items():
+        with open(f"tests/resources/{name}.json", "rb") as f:
+            transport.body = f.read()
+        results[name] = {"kb": round(len(transport.body) / 1024, 1)}
+        results[name].update(measure(api, build, repeat))
+    return {
+        "python": platform.python_version(),
+        "decoder": transport.decode.__module__,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def report(run):
+    print(f"python {run['python']}, decoder {run['decoder']}, {run['repeat']} runs")
+    print(
+        f"{'resource':<36} {'KB':>6} {'min ms':>8} {'median ms':>10} "
+        f"{'alloc KB':>9} {'kept KB':>8} {'objects':>8}"
+    )
+    for name, r in run["results"].items():
+        print(
+            f"{name:<36} {r['kb']:6.0f} {r['min_ms']:8.3f} {r['median_ms']:10.3f} "
+            f"{r['allocated_kb']:9.1f} {r['retained_kb']:8.1f} {r['objects']:8d}"
+        )
+
+
+def compare(baseline, current, threshold, latency_threshold=None):
+    """Print the change of every metric and return the regressed resources"""
+    thresholds = dict.fromkeys(METRICS, threshold)
+    thresholds["min_ms"] = latency_threshold
+    regressions = []
+    print(f"\n{'resource':<36} " + " ".join(f"{m:>14}" for m in METRICS))
+    for name, r in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        changes = []
+        for metric in METRICS:
+            delta = r[metric] - before[metric]
+            change = delta / (before[metric] or 1) * 100
+            changes.append(f"{change:+13.1f}%")
+            if thresholds[metric] is None or delta <= METRICS[metric]:
+                continue
+            if change > thresholds[metric]:
+                regressions.append(f"{name} {metric}")
+        print(f"{name:<36} " + " ".join(changes))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--decoder", default="auto")
+    parser.add_argument("--output", help="write the results to a JSON file")
+    parser.add_argument("--compare", help="a JSON file of a previous run")
+    parser.add_argument("--threshold", type=float, default=5.0)
+    parser.add_argument("--latency-threshold", type=float)
+    args = parser.parse_args()
+
+    current = run(args.repeat, args.decoder)
+    report(current)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(
+                json.load(f), current, args.threshold, args.latency_threshold
+            )
+        for regression in regressions:
+            print(f"regression: {regression}")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Parse time and memory footprint of the models built from the fixtures
+
+The models of the working tree are compared with the models of a git
+revision, each measured in a fresh interpreter so that neither run can
+skew the other. The parse time covers building the model and every
+sub-resource it holds, the construct time only building the model with
+its sub-resources left unread. The footprint is the memory still held
+by the model once the decoded json it was built from has been released.
+
+Usage: python -m benchmarks.models [revision]    (default: HEAD)
+"""
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+FIXTURES = [
+    "league/draftresults",
+    "league/standings",
+    "league/transactions",
+    "team/roster_with_stats",
+]
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse(fixture, content, read=True):
+    from yfantasy_api.models import League, Team
+
+    resource, _ = fixture.split("/")
+    model = {"league": League, "team": Team}[resource]
+    model = model(content["fantasy_content"][resource])
+    if read:
+        for name in ("draft_results", "players", "standings", "transactions"):
+            getattr(model, name, None)
+    return model
+
+
+def best_time(fixture, body, read, repeat):
+    timings = []
+    for _ in range(repeat):
+        content = json.loads(body)
+        start = time.perf_counter()
+        parse(fixture, content, read)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def measure(fixture, repeat=50):
+    with open(os.path.join(ROOT, f"tests/resources/{fixture}.json")) as f:
+        body = f.read()
+
+    parse_ms = best_time(fixture, body, True, repeat)
+    construct_ms = best_time(fixture, body, False, repeat)
+
+    gc.collect()
+    tracemalloc.start()
+    content = json.loads(body)
+    model = parse(fixture, content)
+    del content
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del model
+
+    return {
+        "min_ms": parse_ms,
+        "construct_ms": construct_ms,
+        "retained_kb": retained / 1024,
+    }
+
+
+def run(tree):
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--measure"],
+        env={**os.environ, "PYTHONPATH": tree},
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(revision="HEAD"):
+    with tempfile.TemporaryDirectory() as tree:
+        archive = subprocess.run(
+            ["git", "archive", revision, "yfantasy_api"],
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+        ).stdout
+        subprocess.run(["tar", "-x", "-C", tree], input=archive, check=True)
+        old = run(tree)
+    new = run(ROOT)
+
+    print(
+        f"{'fixture':<24} {revision:>22} {'working tree':>22} "
+        f"{'saved':>8} {'speedup':>8}"
+    )
+    for fixture in FIXTURES:
+        o, n = old[fixture], new[fixture]
+        saved = (1 - n["retained_kb"] / o["retained_kb"]) * 100
+        speedup = o["min_ms"] / n["min_ms"]
+        print(
+            f"{fixture:<24} {o['retained_kb']:9.0f} KB {o['min_ms']:6.2f} ms "
+            f"{n['retained_kb']:9.0f} KB {n['min_ms']:6.2f} ms "
+            f"{saved:7.1f}% {speedup:7.2f}x"
+        )
+
+    print(
+        f"\n{'construct only':<24} {revision:>12} {'working tree':>12} {'speedup':>8}"
+    )
+    for fixture in FIXTURES:
+        o, n = old[fixture], new[fixture]
+        speedup = o["construct_ms"] / n["construct_ms"]
+        print(
+            f"{fixture:<24} {o['construct_ms']:9.2f} ms {n['construct_ms']:9.2f} ms "
+            f"{speedup:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--measure"]:
+        print(json.dumps({fixture: measure(fixture) for fixture in FIXTURES}))
+    else:
+        main(*sys.argv[1:])
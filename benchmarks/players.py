@@ -0,0 +1,86 @@
+"""Wall-clock time to fetch a whole player pool, sequentially versus in parallel
+
+The stub server answers every page after a fixed latency to mimic the
+round trip to Yahoo.
+
+Usage: python -m benchmarks.players [latency_ms] [workers]
+"""
+
+import copy
+import json
+import sys
+import time
+
+from benchmarks.stub_server import StubServer, make_api
+
+FIXTURE = "tests/resources/league/players.json"
+
+
+def pool_responder(size, latency):
+    with open(FIXTURE) as f:
+        template = json.load(f)
+
+    pages = {}
+    for start in range(0, size + 25, 25):
+        page = copy.deepcopy(template)
+        players = page["fantasy_content"]["league"][1]["players"]
+        count = max(0, min(25, size - start))
+        for i in range(count):
+            players[str(i)]["player"][0][0]["player_key"] = f"nhl.p.{start + i}"
+        for i in range(count, 25):
+            del players[str(i)]
+        players["count"] = count
+        pages[start] = json.dumps(page).encode()
+
+    def respond(path):
+        time.sleep(latency)
+        start = int(path.split(";start=")[1].split(";")[0])
+        return 200, pages.get(start, pages[max(pages)])
+
+    return respond
+
+
+def sequential(api):
+    players, start = [], 0
+    while True:
+        page = api.league().players(start=start).get().players
+        players += page
+        start += 25
+        if len(page) < 25:
+            return players
+
+
+def timed(name, fetch, size, baseline=None):
+    start = time.perf_counter()
+    players = fetch()
+    elapsed = time.perf_counter() - start
+    assert len(players) == size, (name, len(players))
+    speedup = f"{baseline / elapsed:5.1f}x" if baseline else ""
+    print(f"  {name:<24} {elapsed:7.3f} s {speedup}")
+    return elapsed
+
+
+def main(latency_ms=20, workers=8):
+    for size in [1000, 5000]:
+        print(f"{size} players, {latency_ms} ms per page, {workers} workers")
+        with StubServer(pool_responder(size, latency_ms / 1000)) as server:
+            api = make_api(server.url, timeout=0)
+
+            def players():
+                return api.league().players()
+
+            base = timed("sequential get()", lambda: sequential(api), size)
+            timed("iter_all()", lambda: list(players().iter_all()), size, base)
+            timed(
+                "get_all() bisected",
+                lambda: players().get_all(None, workers),
+                size,
+                base,
+            )
+            timed(
+                "get_all(total)", lambda: players().get_all(size, workers), size, base
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,91 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from yfantasy_api import YahooFantasyApi
+from yfantasy_api.api.tokens import MemoryTokenStore
+
+
+class StubServer:
+    """A local http server that replays canned Yahoo responses
+
+    The server speaks HTTP/1.1 so that clients are able to keep their
+    connections alive between requests, just like the real api.
+
+    Attributes
+    ----------
+    url: str
+        The base url the server is listening on
+    requests: int
+        The number of requests the server has handled so far
+    """
+
+    def __init__(self, responder):
+        """Initialize a new StubServer
+
+        Parameters
+        ----------
+        responder
+            A callable that takes the request path and returns a tuple
+            of `(status, body)` where the body is bytes
+        """
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                stub.requests += 1
+                status, body = responder(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                self.do_GET()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.__server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.__server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.__server.shutdown()
+        self.__server.server_close()
+
+
+def fixture_responder(fixture):
+    """Build a responder that always returns the given fixture file"""
+    with open(fixture, "rb") as f:
+        body = f.read()
+    return lambda path: (200, body)
+
+
+def make_api(url, **kwargs):
+    """Build a YahooFantasyApi that sends its queries to the stub server
+
+    The tokens are kept in a memory store that never expires them, so
+    that the client neither prompts for a code nor refreshes tokens.
+    """
+    tokens = {
+        "access_token": "a",
+        "refresh_token": "r",
+        "expires_by": time.time() + 1e6,
+    }
+    kwargs.setdefault("token_store", MemoryTokenStore(tokens))
+
+    api = YahooFantasyApi(123456, "nhl", **kwargs)
+    api.base_url = url
+    return api
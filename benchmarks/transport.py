@@ -0,0 +1,43 @@
+"""Per-call latency of the module level `requests.get` versus a pooled Transport
+
+Usage: python -m benchmarks.transport [calls]
+"""
+import statistics
+import sys
+import time
+
+import requests
+
+from benchmarks.stub_server import StubServer, fixture_responder
+from yfantasy_api.api.transport import Transport
+
+FIXTURE = "tests/resources/game/game.json"
+
+
+def measure(get, url, calls):
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        get(url, params={"format": "json"}).content
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings):
+    mean = statistics.mean(timings) * 1000
+    p95 = sorted(timings)[int(len(timings) * 0.95)] * 1000
+    print(f"{name:<16} mean {mean:7.3f} ms   p95 {p95:7.3f} ms")
+
+
+def main(calls=500):
+    with StubServer(fixture_responder(FIXTURE)) as server:
+        url = f"{server.url}/game/nhl"
+        transport = Transport()
+
+        report("requests.get", measure(requests.get, url, calls))
+        report("Transport.get", measure(transport.get, url, calls))
+        transport.close()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
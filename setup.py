@@ -16,8 +16,17 @@ if __name__ == "__main__":
         long_description=long_description,
         long_description_content_type="text/markdown",
         url="https://github.com/hkyplyr/yfantasy-api",
-        packages=setuptools.find_packages(),
+        packages=setuptools.find_packages(exclude=["tests*", "benchmarks*"]),
         classifiers=[],
         python_requires=">=3.6",
         install_requires=["requests"],
+        extras_require={
+            "arrow": ["numpy", "pyarrow"],
+            "async": ["httpx"],
+            "msgspec": ["msgspec"],
+            "numpy": ["numpy"],
+            "opentelemetry": ["opentelemetry-api"],
+            "orjson": ["orjson"],
+            "pandas": ["numpy", "pandas"],
+        },
     )
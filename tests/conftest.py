@@ -0,0 +1,65 @@
+import json
+import time
+
+from pytest import fixture
+
+from yfantasy_api.api import auth
+
+
+class FakeClock:
+    """A clock standing still until a test, or a call to `sleep()`, moves it"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@fixture
+def clock():
+    return FakeClock()
+
+
+@fixture
+def token_stub(requests_mock):
+    """A token endpoint that is slow to answer and counts the refreshes"""
+    refreshes = []
+
+    def refresh(request, context):
+        refreshes.append(request.body)
+        time.sleep(0.05)
+        return json.dumps(
+            {
+                "access_token": f"token-{len(refreshes)}",
+                "refresh_token": "r",
+                "expires_in": 3600,
+            }
+        )
+
+    requests_mock.post(auth.TOKEN_URL, text=refresh)
+    return refreshes
+
+
+@fixture
+def token_file(monkeypatch, tmp_path):
+    """A temporary tokens file holding expired tokens, used by default
+
+    Returns a function saving tokens that expire at another time instead.
+    """
+    monkeypatch.setattr(auth, "TOKEN_FILE", str(tmp_path / ".tokens.json"))
+    monkeypatch.setenv("CLIENT_ID", "client_id")
+    monkeypatch.setenv("CLIENT_SECRET", "client_secret")
+
+    def save(expires_by):
+        tokens = {"access_token": "token-0", "refresh_token": "r"}
+        with open(auth.TOKEN_FILE, "w") as f:
+            json.dump({**tokens, "expires_by": expires_by}, f)
+
+    save(0)
+    return save
@@ -1,11 +1,24 @@
 import time
 
+import requests
 import requests_mock
 from pytest import fixture, raises
 from pytest_mock import mocker
 
 from yfantasy_api import YahooFantasyApi
 from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.cache import ResponseCache
+from yfantasy_api.api.errors import (
+    AuthenticationError,
+    CircuitOpenError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    YahooFantasyError,
+)
+from yfantasy_api.api.retry import CircuitBreaker, RetryPolicy
+from yfantasy_api.api.throttle import RateLimiter
+from yfantasy_api.api.transport import Transport
 
 
 @fixture(autouse=True)
@@ -49,12 +62,158 @@ def test_response_code_not_200(requests_mock, mocker):
     requests_mock.get(
         f"{YahooFantasyApi.base_url}/game/nhl", text="Error!", status_code=400
     )
-    with raises(SystemExit) as sys_exit_e:
+    with raises(YahooFantasyError) as error:
         make_api_call()
-    assert sys_exit_e.type == SystemExit
+    assert error.value.status_code == 400
+    assert error.value.text == "Error!"
+    assert requests_mock.call_count == 1
+
+
+def test_not_found(requests_mock):
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nhl", status_code=404)
+    with raises(NotFoundError):
+        make_api_call()
+
+
+def test_server_error_retried_with_jitter(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl",
+        [{"status_code": 503}, {"status_code": 500}, {"text": get_response_stub()}],
+    )
+    sleeps = []
+    policy = RetryPolicy(backoff_factor=1, uniform=lambda a, b: b, sleep=sleeps.append)
+    yfs = YahooFantasyApi(123456, "nhl", timeout=0, retry_policy=policy)
+    yfs.expires_by = time.time() + 1000
+
+    assert hasattr(yfs.game().get(), "info")
+    assert sleeps == [1, 2]
+    assert policy.retried == 2
+    assert yfs.circuit_breaker.failures == 0
+
+
+def test_server_error_raised_once_retries_run_out(requests_mock):
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nhl", status_code=502)
+    policy = RetryPolicy(retries=2, sleep=lambda _: None)
+    yfs = YahooFantasyApi(123456, "nhl", timeout=0, retry_policy=policy)
+    yfs.expires_by = time.time() + 1000
+
+    with raises(ServerError) as error:
+        yfs.game().get()
+    assert error.value.status_code == 502
+    assert requests_mock.call_count == 3
+
+
+def test_rejected_tokens_refreshed_once(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl",
+        [{"status_code": 401}, {"text": get_response_stub()}],
+    )
+    yfs, game = make_api_call()
+    assert hasattr(game, "info")
+    yfs.auth_service.refresh_tokens.assert_called_once_with()
+
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nhl", status_code=401)
+    with raises(AuthenticationError):
+        make_api_call()
+    assert yfs.auth_service.refresh_tokens.call_count == 2
+
+
+def test_rate_limit_error_once_retries_run_out(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl",
+        status_code=429,
+        headers={"Retry-After": "0"},
+    )
+    with raises(RateLimitError) as error:
+        make_api_call()
+    assert error.value.retry_after == 0
+    assert requests_mock.call_count == YahooFantasyApi.rate_limit_retries + 1
+
+
+def test_open_circuit_fails_fast(requests_mock):
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nhl", status_code=500)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    policy = RetryPolicy(retries=0)
+    yfs = YahooFantasyApi(
+        123456, "nhl", timeout=0, retry_policy=policy, circuit_breaker=breaker
+    )
+    yfs.expires_by = time.time() + 1000
+
+    for _ in range(2):
+        with raises(ServerError):
+            yfs.game().get()
+    with raises(CircuitOpenError) as error:
+        yfs.game().get()
+    assert error.value.retry_in > 59
+    assert breaker.state == "open"
+    assert requests_mock.call_count == 2
+
+
+def test_open_circuit_serves_stale_responses(requests_mock, tmp_path):
+    url = f"{YahooFantasyApi.base_url}/game/nhl"
+    requests_mock.get(url, text=get_response_stub(), headers={"ETag": '"v1"'})
+    cache = ResponseCache(str(tmp_path))
+    breaker = CircuitBreaker(failure_threshold=1)
+    yfs = YahooFantasyApi(
+        123456, "nhl", timeout=0, cache=cache, circuit_breaker=breaker
+    )
+    yfs.expires_by = time.time() + 1000
+    yfs.game().get()
+
+    requests_mock.get(url, exc=requests.ConnectionError)
+    with raises(requests.ConnectionError):
+        yfs.game().get()
+    assert breaker.state == "open"
+    assert hasattr(yfs.game().get(), "info")
+    assert requests_mock.call_count == 2
+
+
+def test_interrupted_probe_releases_the_circuit(requests_mock):
+    url = f"{YahooFantasyApi.base_url}/game/nhl"
+    requests_mock.get(url, exc=requests.ConnectionError)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    yfs = YahooFantasyApi(123456, "nhl", timeout=0, circuit_breaker=breaker)
+    yfs.expires_by = time.time() + 1000
+    with raises(requests.ConnectionError):
+        yfs.get("game/nhl")
+
+    requests_mock.get(url, exc=KeyboardInterrupt)
+    with raises(KeyboardInterrupt):
+        yfs.get("game/nhl")
+    assert breaker.state == "half-open"
+
+    requests_mock.get(url, text=get_response_stub())
+    assert yfs.get("game/nhl")
+    assert breaker.state == "closed"
 
 
 def make_api_call(is_valid=True, with_metadata=False):
     yfs = YahooFantasyApi(123456, "nhl", timeout=0)
     yfs.expires_by = time.time() + 1000 if is_valid else time.time() - 1000
     return yfs, yfs.game().get()
+
+
+def test_transport_shared_with_auth_service():
+    transport = Transport(pool_size=2)
+    yfs = YahooFantasyApi(123456, "nhl", timeout=0, transport=transport)
+    assert yfs.transport is transport
+    assert yfs.auth_service._AuthenticationService__transport is transport
+
+
+def test_rate_limited_response_backs_off_and_retries(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl",
+        [
+            {"status_code": 429, "headers": {"Retry-After": "0"}},
+            {"status_code": 999},
+            {"text": get_response_stub()},
+        ],
+    )
+    sleeps = []
+    limiter = RateLimiter(rate=None, sleep=sleeps.append)
+    yfs = YahooFantasyApi(123456, "nhl", rate_limiter=limiter)
+    yfs.expires_by = time.time() + 1000
+
+    assert hasattr(yfs.game().get(), "info")
+    assert limiter.backoffs == 2
+    assert len(sleeps) == 1
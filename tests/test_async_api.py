@@ -0,0 +1,368 @@
+import asyncio
+import json
+import re
+import time
+
+import httpx
+from pytest import fixture, raises
+
+from yfantasy_api import AsyncYahooFantasyApi
+from yfantasy_api.api.aio import AsyncTransport
+from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.cache import FOREVER, ModelCache, ResponseCache
+from yfantasy_api.api.errors import (
+    CircuitOpenError,
+    ServerError,
+    YahooFantasyError,
+)
+from yfantasy_api.api.league import PlayerKeysApi
+from yfantasy_api.api.retry import CircuitBreaker, RetryPolicy
+from yfantasy_api.api.throttle import RateLimiter
+
+
+@fixture(autouse=True)
+def setup(mocker):
+    mocker.patch.object(AuthenticationService, "__init__").return_value = None
+    mocker.patch.object(AuthenticationService, "get_access_token")
+    mocker.patch.object(AuthenticationService, "get_refresh_token")
+    mocker.patch.object(AuthenticationService, "get_expires_by").return_value = (
+        time.time() + 1000
+    )
+    mocker.patch.object(AuthenticationService, "refresh_tokens")
+
+
+def read_resource(name):
+    with open(f"tests/resources/{name}.json") as f:
+        return f.read()
+
+
+def make_api(handler, **kwargs):
+    async_transport = AsyncTransport(transport=httpx.MockTransport(handler))
+    return AsyncYahooFantasyApi(
+        123456, "nhl", timeout=0, async_transport=async_transport, **kwargs
+    )
+
+
+def test_gather_team_rosters():
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        return httpx.Response(200, text=read_resource("team/roster"))
+
+    api = make_api(handler, max_concurrency=3)
+
+    async def fetch_rosters():
+        teams = await asyncio.gather(
+            *[api.team(t).roster().get() for t in range(1, 13)]
+        )
+        await api.close()
+        return teams
+
+    teams = asyncio.run(fetch_rosters())
+    assert len(teams) == 12
+    assert all(team.players for team in teams)
+    assert len(requested) == 12
+    assert "/fantasy/v2/team/nhl.l.123456.t.12/roster" in requested
+
+
+def test_fluent_surface():
+    def handler(request):
+        path = request.url.path
+        if path.startswith("/fantasy/v2/users"):
+            return httpx.Response(200, text=read_resource("user/games"))
+        if path.startswith("/fantasy/v2/games"):
+            return httpx.Response(200, text=read_resource("game/games"))
+        if path.startswith("/fantasy/v2/game"):
+            return httpx.Response(200, text=read_resource("game/game"))
+        return httpx.Response(200, text=read_resource("league/standings"))
+
+    api = make_api(handler)
+
+    async def fetch_all():
+        return await asyncio.gather(
+            api.game().get(),
+            api.games().get(),
+            api.league().standings().get(),
+            api.user().games().get(),
+        )
+
+    game, games, league, user = asyncio.run(fetch_all())
+    assert game.info.game_key
+    assert games
+    assert league.standings
+    assert user.games
+
+
+def test_refreshes_expiring_tokens():
+    api = make_api(lambda request: httpx.Response(200, text=read_resource("game/game")))
+    api.expires_by = time.time() - 1000
+
+    asyncio.run(api.game().get())
+    api.auth_service.refresh_tokens.assert_called_with()
+
+
+def test_rate_limited_response_backs_off_and_retries():
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, text=read_resource("game/game")),
+        ]
+    )
+    limiter = RateLimiter(rate=None)
+    api = make_api(lambda request: next(responses), rate_limiter=limiter)
+
+    assert asyncio.run(api.get("game/nhl"))["game"]
+    assert limiter.backoffs == 1
+
+
+def test_response_code_not_200():
+    api = make_api(lambda request: httpx.Response(400, text="Error!"))
+
+    with raises(YahooFantasyError) as error:
+        asyncio.run(api.get("game/nhl"))
+    assert error.value.status_code == 400
+
+
+def test_server_error_retried_and_rejected_tokens_refreshed():
+    statuses = [503, 401]
+
+    def handler(request):
+        if statuses:
+            return httpx.Response(statuses.pop(0))
+        return httpx.Response(200, text=read_resource("game/game"))
+
+    policy = RetryPolicy(backoff_factor=0)
+    api = make_api(handler, retry_policy=policy)
+
+    assert asyncio.run(api.game().get()).info
+    assert policy.retried == 1
+    AuthenticationService.refresh_tokens.assert_called_once_with()
+
+
+def test_open_circuit_fails_fast():
+    api = make_api(
+        lambda request: httpx.Response(500),
+        retry_policy=RetryPolicy(retries=0),
+        circuit_breaker=CircuitBreaker(failure_threshold=1),
+    )
+
+    with raises(ServerError):
+        asyncio.run(api.get("game/nhl"))
+    with raises(CircuitOpenError):
+        asyncio.run(api.get("game/nhl"))
+
+
+def test_open_circuit_serves_stale_responses(tmp_path):
+    def handler(request):
+        if request.headers.get("If-None-Match"):
+            raise httpx.ConnectError("Yahoo is down")
+        return httpx.Response(
+            200, text=read_resource("game/game"), headers={"ETag": '"v1"'}
+        )
+
+    breaker = CircuitBreaker(failure_threshold=1)
+    cache = ResponseCache(str(tmp_path))
+    api = make_api(handler, cache=cache, circuit_breaker=breaker)
+    asyncio.run(api.game().get())
+
+    with raises(httpx.ConnectError):
+        asyncio.run(api.game().get())
+    assert asyncio.run(api.game().get()).info
+
+
+def test_cancelled_probe_releases_the_circuit():
+    clock = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=10, clock=lambda: clock[0]
+    )
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(500)
+        if len(calls) == 2:
+            await asyncio.sleep(10)
+        return httpx.Response(200, text=read_resource("game/game"))
+
+    api = make_api(
+        handler, retry_policy=RetryPolicy(retries=0), circuit_breaker=breaker
+    )
+    with raises(ServerError):
+        asyncio.run(api.get("game/nhl"))
+
+    async def start_probe():
+        asyncio.ensure_future(api.get("game/nhl"))
+        while len(calls) < 2:
+            await asyncio.sleep(0)
+
+    # The probe still in flight is cancelled once the loop completes
+    clock[0] = 10
+    asyncio.run(start_probe())
+    assert breaker.state == "half-open"
+
+    assert asyncio.run(api.get("game/nhl"))
+    assert breaker.state == "closed"
+
+
+def test_teams_batches_gathered():
+    api = make_api(
+        lambda request: httpx.Response(200, text=read_resource("team/teams_standings"))
+    )
+    teams_api = api.teams([1, 2, 3])
+    teams_api.max_team_keys = 2
+
+    teams = asyncio.run(teams_api.standings().get())
+    assert len(teams) == 4
+
+
+def test_players_aiter_all():
+    def handler(request):
+        start = int(str(request.url).split(";start=")[1].split(";")[0])
+        if start < 50:
+            return httpx.Response(200, text=read_resource("league/players"))
+        return httpx.Response(200, text=read_resource("league/players_empty"))
+
+    api = make_api(handler)
+
+    async def collect():
+        return [player async for player in api.league().players().stats().aiter_all()]
+
+    assert len(asyncio.run(collect())) == 50
+
+
+def test_players_aiter_all_stopped_early_cancels_the_next_page():
+    requested, cancelled = [], []
+
+    async def handler(request):
+        if ";start=0;" in str(request.url):
+            return httpx.Response(200, text=read_resource("league/players"))
+        requested.append(request.url)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(request.url)
+            raise
+
+    api = make_api(handler)
+
+    async def first_player():
+        players = api.league().players().aiter_all()
+        player = await players.__anext__()
+        while not requested:
+            await asyncio.sleep(0)
+        await players.aclose()
+        while not cancelled:
+            await asyncio.sleep(0)
+        return player
+
+    assert asyncio.run(asyncio.wait_for(first_player(), 5))
+    assert cancelled == requested
+
+
+def test_leagues_aiter_all_unsupported():
+    api = make_api(lambda request: httpx.Response(500))
+
+    async def collect():
+        return [
+            player async for player in api.leagues(["403.l.1"]).players().aiter_all()
+        ]
+
+    with raises(TypeError, match="single league"):
+        asyncio.run(collect())
+
+
+def test_transactions_aiter_since():
+    requested = []
+
+    def handler(request):
+        requested.append(str(request.url))
+        return httpx.Response(200, text=read_resource("league/transactions"))
+
+    api = make_api(handler)
+
+    async def collect():
+        transactions = api.league().transactions(count=500)
+        return [t async for t in transactions.aiter_since("403.l.17457.tr.460")]
+
+    transactions = asyncio.run(collect())
+    assert [t.transaction_id for t in transactions] == ["463", "462", "461"]
+    assert len(requested) == 1
+
+
+def test_transactions_aiter_since_pages():
+    def handler(request):
+        start = int(str(request.url).split(";start=")[1].split("?")[0])
+        if start == 0:
+            return httpx.Response(200, text=read_resource("league/transactions"))
+        return httpx.Response(200, text=read_resource("league/transactions_empty"))
+
+    api = make_api(handler)
+
+    async def collect():
+        transactions = api.league().transactions(count=438)
+        return [t async for t in transactions.aiter_since()]
+
+    assert len(asyncio.run(collect())) == 404
+
+
+def test_cache_hit_and_revalidation(tmpdir):
+    responses = [
+        httpx.Response(
+            200, text=read_resource("league/transactions"), headers={"ETag": '"v1"'}
+        ),
+        httpx.Response(304),
+    ]
+    cache = ResponseCache(str(tmpdir), policies=[("/settings", FOREVER)])
+    api = make_api(lambda request: responses.pop(0), cache=cache)
+    path = "league/nhl.l.123456/transactions"
+
+    asyncio.run(api.get(path))
+    assert asyncio.run(api.get(path))["league"]
+    assert cache.stats()["revalidations"] == 1
+
+    cache.put("league/nhl.l.123456/settings", b'{"fantasy_content": {}}', {}, {})
+    assert asyncio.run(api.get("league/nhl.l.123456/settings")) == {}
+
+
+def test_model_cache_hit():
+    api = make_api(
+        lambda request: httpx.Response(200, text=read_resource("game/game")),
+        model_cache=ModelCache(),
+    )
+
+    async def fetch_twice():
+        return await api.game().get(), await api.game().get()
+
+    first, second = asyncio.run(fetch_twice())
+    assert first is second
+
+
+def test_players_by_key_in_order(mocker):
+    mocker.patch.object(PlayerKeysApi, "max_player_keys", 2)
+    with open("tests/resources/league/players.json") as f:
+        league = json.load(f)["fantasy_content"]["league"]
+    players = league[1]["players"]
+    by_key = {}
+    for p in range(players["count"]):
+        player = players[str(p)]
+        by_key[f"nhl.p.{player['player'][0][1]['player_id']}"] = player
+
+    def handler(request):
+        keys = re.search("player_keys=([^/]+)", request.url.path).group(1).split(",")
+        found = {str(i): by_key[key] for i, key in enumerate(reversed(keys))}
+        found["count"] = len(keys)
+        content = {"league": [league[0], {"players": found}]}
+        return httpx.Response(200, json={"fantasy_content": content})
+
+    api = make_api(handler)
+    keys = ["nhl.p.3346", "nhl.p.1600", "nhl.p.2530", "nhl.p.1644", "nhl.p.1700"]
+
+    async def fetch_players():
+        players = await api.league().players(player_keys=keys).get()
+        await api.close()
+        return players
+
+    players = asyncio.run(fetch_players())
+    assert [f"nhl.p.{p.id}" for p in players] == keys
@@ -0,0 +1,255 @@
+import json
+import os
+import time
+
+from pytest import fixture
+
+from yfantasy_api import YahooFantasyApi
+from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.cache import FOREVER, ModelCache, ResponseCache
+
+
+@fixture(autouse=True)
+def setup(mocker):
+    mocker.patch.object(AuthenticationService, "__init__").return_value = None
+    mocker.patch.object(AuthenticationService, "get_access_token")
+    mocker.patch.object(AuthenticationService, "get_refresh_token")
+    mocker.patch.object(AuthenticationService, "get_expires_by").return_value = (
+        time.time() + 1000
+    )
+
+
+@fixture
+def cache(tmpdir, clock):
+    return ResponseCache(str(tmpdir.join("cache")), clock=clock)
+
+
+def read_resource(name):
+    with open(f"tests/resources/{name}.json", "rb") as f:
+        return f.read()
+
+
+def content(name):
+    return json.loads(read_resource(name))["fantasy_content"]
+
+
+def test_policies(cache):
+    scoreboard = content("league/scoreboard")
+    assert cache.ttl("game/nhl/stat_categories", content("game/stat_categories"))
+    assert cache.ttl("league/nhl.l.1/draftresults/players", scoreboard) is FOREVER
+    assert cache.ttl("league/nhl.l.1/scoreboard;week=3", scoreboard) == 300
+    assert cache.ttl("league/nhl.l.1/players;start=0;count=25", None) == 0
+
+    matchups = scoreboard["league"][1]["scoreboard"]["0"]["matchups"]
+    for m in range(matchups["count"]):
+        matchups[str(m)]["matchup"]["status"] = "postevent"
+    assert cache.ttl("league/nhl.l.1/scoreboard;week=3", scoreboard) is FOREVER
+    assert cache.ttl("league/nhl.l.1/scoreboard", scoreboard) == 300
+
+    scoreboard["league"][0]["draft_status"] = "predraft"
+    assert cache.ttl("league/nhl.l.1/draftresults/players", scoreboard) == 60
+
+
+def test_league_collection_policies(requests_mock, cache):
+    keys = "leagues;league_keys=403.l.17457,403.l.17458"
+    body = read_resource("league/leagues_standings")
+    for sub_resource in ["draftresults/players", "scoreboard"]:
+        url = f"{YahooFantasyApi.base_url}/{keys}/{sub_resource}"
+        requests_mock.get(url, content=body)
+    api = YahooFantasyApi(123456, "nhl", timeout=0, cache=cache)
+    leagues = ["403.l.17457", "403.l.17458"]
+
+    assert len(api.leagues(leagues).draft_results().get()) == 2
+    assert len(api.leagues(leagues).scoreboard().get()) == 2
+    assert (
+        cache.ttl(f"{keys}/draftresults/players", content("league/leagues_standings"))
+        == 60
+    )
+    assert cache.ttl(f"{keys}/scoreboard", content("league/leagues_standings")) == 300
+    assert cache.stats()["entries"] == 2
+
+
+def test_hit_and_expiry(cache, clock):
+    path = "game/nhl/game_weeks"
+    body = read_resource("game/game_weeks")
+    cache.put(path, body, {}, json.loads(body)["fantasy_content"])
+
+    assert cache.get(path).fresh
+    assert cache.get(path).content()["game"]
+    clock.now += 2 * 24 * 60 * 60
+    assert not cache.get(path).fresh
+    assert cache.get("game/nhl/position_types") is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_uncacheable_responses_are_not_stored(cache):
+    cache.put("league/nhl.l.1/players", b"{}", {}, {})
+    assert cache.stats()["entries"] == 0
+
+
+def test_validators_and_revalidation(cache, clock):
+    path = "league/nhl.l.1/transactions"
+    headers = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Mar 2021 00:00:00 GMT"}
+    cache.put(path, b'{"fantasy_content": {}}', headers, {})
+
+    cached = cache.get(path)
+    assert not cached.fresh
+    assert cached.validators() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 01 Mar 2021 00:00:00 GMT",
+    }
+    cache.revalidated(cached, {})
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_lru_eviction(tmpdir):
+    cache = ResponseCache(str(tmpdir), max_bytes=600, policies=[("", FOREVER)])
+    for i in range(3):
+        cache.put(f"game/{i}", b"x" * 100, {}, {})
+    cache.get("game/0")
+    cache.put("game/3", b"x" * 100, {}, {})
+
+    assert cache.get("game/0") is not None
+    assert cache.get("game/1") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_reload_from_disk_and_invalidate(tmpdir):
+    directory = str(tmpdir)
+    cache = ResponseCache(directory, policies=[("", FOREVER)])
+    cache.put("team/nhl.l.1.t.1/roster", b"{}", {}, {})
+    cache.put("team/nhl.l.1.t.2/roster", b"{}", {}, {})
+    open(os.path.join(directory, "leftover.tmp"), "w").close()
+
+    reloaded = ResponseCache(directory, policies=[("", FOREVER)])
+    assert reloaded.stats()["entries"] == 2
+    reloaded.invalidate("nhl.l.1.t.1")
+    assert reloaded.get("team/nhl.l.1.t.1/roster") is None
+    assert reloaded.get("team/nhl.l.1.t.2/roster").fresh
+
+
+def test_invalidate_matches_whole_keys(tmpdir):
+    paths = [
+        "league/nhl.l.1/standings",
+        "league/nhl.l.12/standings",
+        "team/nhl.l.1.t.1/roster",
+        "team/nhl.l.1.t.10/roster",
+        "leagues;league_keys=nhl.l.1,nhl.l.2/standings",
+        "leagues;league_keys=nhl.l.2,nhl.l.1/standings",
+        "league/xnhl.l.1/standings",
+    ]
+    cache = ResponseCache(str(tmpdir), policies=[("", FOREVER)])
+    models = ModelCache()
+    for path in paths:
+        cache.put(path, b"{}", {}, {})
+        models.put(path, path, 10)
+
+    for store in [cache, models]:
+        store.invalidate("nhl.l.1.t.1")
+        assert store.get("team/nhl.l.1.t.1/roster") is None
+        assert store.get("team/nhl.l.1.t.10/roster")
+
+        store.invalidate("nhl.l.1")
+        assert [path for path in paths if store.get(path)] == [
+            "league/nhl.l.12/standings",
+            "league/xnhl.l.1/standings",
+        ]
+
+
+def test_corrupted_entries_are_dropped(tmpdir):
+    directory = str(tmpdir)
+    cache = ResponseCache(directory, policies=[("", FOREVER)])
+    cache.put("game/nhl", b"{}", {}, {})
+    for name in os.listdir(directory):
+        with open(os.path.join(directory, name), "w") as f:
+            f.write("corrupted")
+
+    assert cache.get("game/nhl") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_api_serves_fresh_responses_from_cache(requests_mock, cache):
+    path = "game/nhl/stat_categories"
+    body = read_resource("game/stat_categories")
+    requests_mock.get(f"{YahooFantasyApi.base_url}/{path}", content=body)
+    api = YahooFantasyApi(123456, "nhl", timeout=0, cache=cache)
+
+    first = api.game().stat_categories().get()
+    second = api.game().stat_categories().get()
+    assert len(first.stat_categories) == len(second.stat_categories)
+    assert requests_mock.call_count == 1
+
+
+def test_api_revalidates_stale_responses(requests_mock, cache, clock):
+    path = "league/nhl.l.123456/transactions"
+    url = f"{YahooFantasyApi.base_url}/{path}"
+    body = read_resource("league/transactions")
+    requests_mock.get(url, content=body, headers={"ETag": '"v1"'})
+    api = YahooFantasyApi(123456, "nhl", timeout=0, cache=cache)
+    api.league().transactions().get()
+
+    requests_mock.get(url, status_code=304)
+    league = api.league().transactions().get()
+    assert league.transactions
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_model_cache_returns_shared_instances(clock):
+    models = ModelCache(ttl=60, clock=clock)
+    league = object()
+    models.put("league/nhl.l.1/draftresults/players", league, 100)
+
+    assert models.get("league/nhl.l.1/draftresults/players") is league
+    clock.now += 61
+    assert models.get("league/nhl.l.1/draftresults/players") is None
+    assert models.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 0,
+        "bytes": 0,
+    }
+
+
+def test_model_cache_memory_budget():
+    models = ModelCache(ttl=FOREVER, max_bytes=250)
+    for i in range(3):
+        models.put(f"team/nhl.l.1.t.{i}", i, 100)
+    models.put("team/nhl.l.1.t.2", 2, 100)
+
+    assert models.get("team/nhl.l.1.t.0") is None
+    assert models.get("team/nhl.l.1.t.1") == 1
+    assert models.stats()["evictions"] == 1
+    assert models.stats()["bytes"] == 200
+
+
+def test_model_cache_invalidation():
+    models = ModelCache()
+    models.put("league/nhl.l.1/standings", 1, 10)
+    models.put("team/nhl.l.1.t.1/roster", 2, 10)
+    models.put("team/nhl.l.1.t.2/roster", 3, 10)
+
+    models.invalidate("nhl.l.1.t.1")
+    assert models.get("team/nhl.l.1.t.1/roster") is None
+    assert models.get("team/nhl.l.1.t.2/roster") == 3
+    models.clear()
+    assert models.stats()["entries"] == 0
+
+
+def test_api_memoizes_models(requests_mock, cache):
+    path = "league/nhl.l.123456/draftresults/players"
+    body = read_resource("league/draftresults")
+    requests_mock.get(f"{YahooFantasyApi.base_url}/{path}", content=body)
+    models = ModelCache()
+    api = YahooFantasyApi(123456, "nhl", timeout=0, cache=cache, model_cache=models)
+
+    first = api.league().draft_results().get()
+    assert api.league().draft_results().get() is first
+    assert models.stats()["bytes"] == len(body)
+
+    api.invalidate("nhl.l.123456")
+    assert api.league().draft_results().get() is not first
+    assert api.get(path)["league"]
+    assert requests_mock.call_count == 2
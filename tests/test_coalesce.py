@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from pytest import fixture, raises
+
+from yfantasy_api import AsyncYahooFantasyApi, YahooFantasyApi
+from yfantasy_api.api.aio import AsyncTransport
+from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.coalesce import SingleFlight
+from yfantasy_api.api.errors import NotFoundError
+
+CALLERS = 8
+
+
+@fixture(autouse=True)
+def setup(mocker):
+    mocker.patch.object(AuthenticationService, "__init__").return_value = None
+    mocker.patch.object(AuthenticationService, "get_access_token")
+    mocker.patch.object(AuthenticationService, "get_refresh_token")
+    mocker.patch.object(AuthenticationService, "get_expires_by").return_value = (
+        time.time() + 1000
+    )
+
+
+def read_resource(name):
+    with open(f"tests/resources/{name}.json") as f:
+        return f.read()
+
+
+def wait_for_followers(single_flight, followers):
+    deadline = time.time() + 5
+    while single_flight.coalesced < followers and time.time() < deadline:
+        time.sleep(0.001)
+
+
+def query_concurrently(query):
+    barrier = threading.Barrier(CALLERS)
+
+    def call(_):
+        barrier.wait()
+        try:
+            return query()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as executor:
+        return list(executor.map(call, range(CALLERS)))
+
+
+def test_concurrent_queries_share_one_request(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    def scoreboard(request, context):
+        # Holds the request until every other caller is waiting for it
+        wait_for_followers(api.single_flight, CALLERS - 1)
+        return read_resource("league/scoreboard")
+
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/league/nhl.l.123456/scoreboard", text=scoreboard
+    )
+
+    leagues = query_concurrently(lambda: api.league().scoreboard().get())
+    assert requests_mock.call_count == 1
+    assert all(league is leagues[0] for league in leagues)
+    assert api.single_flight.metrics() == {"calls": 1, "coalesced": CALLERS - 1}
+
+    api.league().scoreboard().get()
+    assert requests_mock.call_count == 2
+
+
+def test_concurrent_queries_share_one_error(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    def not_found(request, context):
+        wait_for_followers(api.single_flight, CALLERS - 1)
+        context.status_code = 404
+        return "Not found"
+
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nhl", text=not_found)
+
+    errors = query_concurrently(lambda: api.game().get())
+    assert requests_mock.call_count == 1
+    assert all(isinstance(error, NotFoundError) for error in errors)
+
+
+def test_queries_of_other_paths_are_not_coalesced():
+    single_flight = SingleFlight()
+    assert single_flight.do("a", lambda: 1) == 1
+    assert single_flight.do("b", lambda: 2) == 2
+    assert single_flight.metrics() == {"calls": 2, "coalesced": 0}
+
+
+def test_concurrent_tasks_share_one_request():
+    requested = []
+
+    async def handler(request):
+        requested.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=read_resource("team/roster"))
+
+    async_transport = AsyncTransport(transport=httpx.MockTransport(handler))
+    api = AsyncYahooFantasyApi(
+        123456, "nhl", timeout=0, async_transport=async_transport
+    )
+
+    async def fetch_rosters():
+        first = asyncio.gather(*[api.team(1).roster().get() for _ in range(CALLERS)])
+        other = api.team(2).roster().get()
+        return await first, await other
+
+    teams, other = asyncio.run(fetch_rosters())
+    assert len(requested) == 2
+    assert all(team is teams[0] for team in teams)
+    assert other is not teams[0]
+    assert api.single_flight.metrics() == {"calls": 2, "coalesced": CALLERS - 1}
+
+
+def test_cancelled_task_does_not_cancel_the_others():
+    single_flight = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def call():
+        first = asyncio.ensure_future(single_flight.do_async("key", slow))
+        second = asyncio.ensure_future(single_flight.do_async("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        with raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(call()) == "done"
+    assert single_flight.metrics() == {"calls": 1, "coalesced": 1}
+
+
+def test_call_cancelled_with_its_last_caller():
+    single_flight = SingleFlight()
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def call():
+        callers = [
+            asyncio.ensure_future(single_flight.do_async("key", slow)) for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        states = []
+        for caller in callers:
+            caller.cancel()
+            await asyncio.gather(caller, return_exceptions=True)
+            await asyncio.sleep(0)
+            states.append(list(cancelled))
+        return states
+
+    assert asyncio.run(call()) == [[], [True]]
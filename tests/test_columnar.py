@@ -0,0 +1,100 @@
+import json
+
+import numpy as np
+
+from yfantasy_api.models import Game, League, Team
+from yfantasy_api.models.columnar import (
+    stat_ids,
+    stats_matrix,
+    to_arrow,
+    to_numpy,
+    to_pandas,
+)
+
+
+def load(path):
+    with open(f"tests/resources/{path}.json") as f:
+        return json.load(f)["fantasy_content"]
+
+
+def players():
+    return League(load("league/players_with_stats")["league"]).players
+
+
+def categories():
+    return League(load("league/settings")["league"]).settings.stat_categories
+
+
+def goalie(pool):
+    return next(p for p in pool if p.stats.get(25))
+
+
+def test_stat_ids():
+    assert stat_ids(categories()) == [1, 2, 4, 8, 11, 14, 31, 32, 19, 20, 22, 25, 27]
+    assert stat_ids(players=players()) == sorted(stat_ids(categories()))
+
+    game_categories = Game(load("game/stat_categories")["game"]).stat_categories
+    assert stat_ids(game_categories)[:3] == [0, 1, 2]
+
+
+def test_stats_matrix():
+    pool = players()
+    ids = stat_ids(categories())
+    matrix = stats_matrix(pool, ids)
+
+    assert matrix.shape == (25, 13)
+    for row, player in enumerate(pool):
+        for column, stat_id in enumerate(ids):
+            expected = player.stats.get(stat_id)
+            if expected is None:
+                assert np.isnan(matrix[row, column])
+            else:
+                assert matrix[row, column] == expected
+
+
+def test_stats_matrix_without_stats():
+    draft_results = League(load("league/draftresults")["league"]).draft_results
+    matrix = stats_matrix(draft_results, [1, 2])
+
+    assert matrix.shape == (len(draft_results), 2)
+    assert np.isnan(matrix).all()
+
+
+def test_to_numpy():
+    pool = players()
+    array = to_numpy(pool, categories())
+
+    assert array.dtype.names[:3] == ("key", "id", "name")
+    assert array["key"][0] == pool[0].key
+    assert array["id"][0] == pool[0].id
+    assert array["name"][0] == pool[0].name
+    assert array["1"][0] == pool[0].stats[1]
+    assert np.isnan(array["19"][0])
+    assert array["25"][pool.index(goalie(pool))] == goalie(pool).stats[25]
+
+
+def test_to_pandas():
+    pool = players()
+    frame = to_pandas(pool)
+
+    assert list(frame.columns[:4]) == ["id", "name", "1", "2"]
+    assert len(frame.columns) == 15
+    assert frame.index[0] == pool[0].key
+    assert frame.loc[pool[1].key, "14"] == pool[1].stats[14]
+
+
+def test_to_arrow():
+    pool = players()
+    table = to_arrow(pool, categories())
+
+    assert table.num_rows == 25
+    assert table.column_names[:4] == ["key", "id", "name", "1"]
+    assert table.column("2")[0].as_py() == pool[0].stats[2]
+    assert table.column("19").null_count == 21
+
+
+def test_team_roster_to_numpy():
+    team = Team(load("team/roster_with_stats")["team"])
+    array = to_numpy(team.players)
+
+    assert len(array) == len(team.players)
@@ -1,3 +1,5 @@
+import json
+
 import requests_mock
 
 from yfantasy_api import YahooFantasyApi
@@ -58,3 +60,39 @@ def test_games(requests_mock):
     mock_request(requests_mock, path, "games")
 
     api.games().get(is_available=True, game_codes=["nhl"], seasons=[2020])
+
+
+def game_players(*player_ids):
+    with open("tests/resources/league/players.json") as f:
+        players = json.load(f)["fantasy_content"]["league"][1]["players"]
+    found = [
+        players[str(p)]
+        for p in range(players["count"])
+        if players[str(p)]["player"][0][1]["player_id"] in player_ids
+    ]
+    collection = {str(i): player for i, player in enumerate(found)}
+    collection["count"] = len(found)
+    with open("tests/resources/game/game.json") as f:
+        game = json.load(f)["fantasy_content"]["game"]
+    return {"fantasy_content": {"game": [game[0], {"players": collection}]}}
+
+
+def test_players_by_key(requests_mock):
+    path = "game/nhl/players;player_keys=nhl.p.1700,nhl.p.1600/percent_owned"
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/{path}", json=game_players("1600", "1700")
+    )
+
+    players = api.game().players(["nhl.p.1700", "nhl.p.1600"]).percent_owned().get()
+    assert [p.id for p in players] == [1700, 1600]
+
+
+def test_players_by_key_not_found(requests_mock):
+    path = "game/nhl/players;player_keys=nhl.p.1"
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    response = game_players()
+    response["fantasy_content"]["game"][1]["players"] = []
+    requests_mock.get(f"{YahooFantasyApi.base_url}/{path}", json=response)
+
+    assert api.game().players(["nhl.p.1"]).get() == []
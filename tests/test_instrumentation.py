@@ -0,0 +1,283 @@
+import asyncio
+import time
+
+import httpx
+from pytest import fixture, raises
+
+from yfantasy_api import AsyncYahooFantasyApi, YahooFantasyApi
+from yfantasy_api.api import instrumentation
+from yfantasy_api.api.aio import AsyncTransport
+from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.cache import ResponseCache
+from yfantasy_api.api.errors import NotFoundError
+from yfantasy_api.api.instrumentation import (
+    CallbackInstrument,
+    Histogram,
+    Instrument,
+    MetricsCollector,
+    OpenTelemetryInstrument,
+    RequestEvent,
+    resource_type,
+)
+from yfantasy_api.api.throttle import RateLimiter
+
+
+@fixture(autouse=True)
+def setup(mocker):
+    mocker.patch.object(AuthenticationService, "__init__").return_value = None
+    mocker.patch.object(AuthenticationService, "get_access_token")
+    mocker.patch.object(AuthenticationService, "get_refresh_token")
+    mocker.patch.object(AuthenticationService, "get_expires_by").return_value = (
+        time.time() + 1000
+    )
+
+
+def read_resource(name):
+    with open(f"tests/resources/{name}.json") as f:
+        return f.read()
+
+
+class FakeSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions = []
+        self.ended = False
+
+    def set_attributes(self, attributes):
+        self.attributes.update(attributes)
+
+    def record_exception(self, exception):
+        self.exceptions.append(exception)
+
+    def end(self):
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes):
+        self.spans.append(FakeSpan(name, attributes))
+        return self.spans[-1]
+
+
+def test_resource_types():
+    assert resource_type("game/nhl") == "game"
+    assert resource_type("league/nhl.l.1/scoreboard;week=2") == "league/scoreboard"
+    assert (
+        resource_type("league/nhl.l.1/players;start=25/stats;type=week")
+        == "league/players/stats"
+    )
+    assert resource_type("teams;team_keys=nhl.l.1.t.1/standings") == "teams/standings"
+    assert resource_type("users;use_login=1/games") == "users/games"
+
+
+def test_hooks_receive_every_phase(requests_mock):
+    url = f"{YahooFantasyApi.base_url}/league/nhl.l.123456/standings"
+    requests_mock.get(url, text=read_resource("league/standings"))
+    sleeps = []
+    before, after = [], []
+    api = YahooFantasyApi(
+        123456,
+        "nhl",
+        rate_limiter=RateLimiter(rate=1, sleep=sleeps.append),
+        instruments=[CallbackInstrument(before.append, after.append), Instrument()],
+    )
+
+    api.league().standings().get()
+    api.league().standings().get()
+
+    assert before == after
+    first, second = after
+    assert first.path == "league/nhl.l.123456/standings"
+    assert first.resource == "league/standings"
+    assert first.status_code == 200
+    assert first.source == "network"
+    assert first.attempts == 1
+    assert first.bytes == len(read_resource("league/standings").encode())
+    assert first.throttle_time == 0
+    assert second.throttle_time == sleeps[0] > 0
+    assert first.network_time > 0
+    assert first.decode_time > 0
+    assert first.model_time > 0
+    assert first.duration >= first.network_time + first.model_time
+    assert first.error is None
+
+
+def test_hooks_receive_errors_and_cached_responses(requests_mock, tmp_path):
+    events = []
+    api = YahooFantasyApi(
+        123456,
+        "nhl",
+        timeout=0,
+        cache=ResponseCache(str(tmp_path)),
+        instruments=[CallbackInstrument(after=events.append)],
+    )
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nhl", status_code=404)
+    with raises(NotFoundError):
+        api.game().get()
+
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl/stat_categories",
+        text=read_resource("game/stat_categories"),
+    )
+    api.game().stat_categories().get()
+    api.game().stat_categories().get()
+
+    error, network, cached = events
+    assert isinstance(error.error, NotFoundError)
+    assert error.status_code == 404
+    assert error.source is None
+    assert network.source == "network"
+    assert cached.source == "cache"
+    assert cached.status_code is None
+    assert cached.bytes == network.bytes
+    assert cached.network_time == 0
+
+
+def test_failing_hooks_do_not_fail_the_query(requests_mock, caplog):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl", text=read_resource("game/game")
+    )
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nfl", status_code=404)
+
+    def fail(event):
+        raise ValueError("broken instrument")
+
+    events = []
+    api = YahooFantasyApi(
+        123456,
+        "nhl",
+        timeout=0,
+        instruments=[
+            CallbackInstrument(fail, fail),
+            CallbackInstrument(after=events.append),
+        ],
+    )
+
+    assert api.game().get().info.game_key == "403"
+    with raises(NotFoundError):
+        api.get("game/nfl")
+
+    assert [event.status_code for event in events] == [200, 404]
+    assert len(caplog.records) == 4
+    assert "before_request hook" in caplog.records[0].getMessage()
+    assert caplog.records[1].exc_info[0] is ValueError
+
+
+def test_metrics_collector(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl", text=read_resource("game/game")
+    )
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nfl", status_code=404)
+    metrics = MetricsCollector()
+    api = YahooFantasyApi(123456, "nhl", timeout=0, instruments=[metrics])
+
+    api.game().get()
+    api.get("game/nhl")
+    with raises(NotFoundError):
+        api.get("game/nfl")
+
+    assert metrics.requests.value("game", "200", "network") == 2
+    assert metrics.requests.value("game", "404", "error") == 1
+    assert metrics.response_bytes.value("game") == 2 * len(read_resource("game/game"))
+    assert metrics.duration.count("game") == 3
+    assert metrics.phases.sum("game", "network") > 0
+    assert metrics.phases.count("game", "model") == 3
+    assert metrics.phases.count("team", "model") == 0
+    assert metrics.phases.sum("team", "model") == 0
+
+    text = metrics.render()
+    assert "# TYPE yfantasy_requests_total counter" in text
+    assert (
+        'yfantasy_requests_total{resource="game",status="200",source="network"} 2'
+        in text
+    )
+    assert "# TYPE yfantasy_request_duration_seconds histogram" in text
+    assert 'yfantasy_request_duration_seconds_count{resource="game"} 3' in text
+    assert (
+        'yfantasy_request_phase_seconds_bucket{resource="game",phase="model",le="+Inf"} 3'
+        in text
+    )
+
+
+def test_histogram_buckets():
+    histogram = Histogram("latency", "Latency", buckets=[1, 0.1])
+    for value in [0.05, 0.5, 5]:
+        histogram.observe((), value)
+
+    assert histogram.render().splitlines()[2:] == [
+        'latency_bucket{le="0.1"} 1',
+        'latency_bucket{le="1"} 2',
+        'latency_bucket{le="+Inf"} 3',
+        "latency_sum 5.55",
+        "latency_count 3",
+    ]
+
+
+def test_label_values_are_escaped():
+    metrics = MetricsCollector(prefix="test")
+    event = RequestEvent('users/"a\\b\nc"')
+    event.finish()
+    metrics.after_request(event)
+    assert 'resource="users/\\"a\\\\b\\nc\\""' in metrics.render()
+
+
+def test_opentelemetry_spans(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl", text=read_resource("game/game")
+    )
+    requests_mock.get(f"{YahooFantasyApi.base_url}/game/nfl", status_code=404)
+    tracer = FakeTracer()
+    api = YahooFantasyApi(
+        123456, "nhl", timeout=0, instruments=[OpenTelemetryInstrument(tracer)]
+    )
+
+    api.game().get()
+    with raises(NotFoundError):
+        api.get("game/nfl")
+
+    ok, failed = tracer.spans
+    assert ok.name == "yfantasy game"
+    assert ok.ended and failed.ended
+    assert ok.attributes["yfantasy.path"] == "game/nhl"
+    assert ok.attributes["http.response.status_code"] == 200
+    assert ok.attributes["yfantasy.source"] == "network"
+    assert ok.attributes["yfantasy.network_time"] > 0
+    assert ok.exceptions == []
+    assert failed.attributes["yfantasy.source"] == "error"
+    assert isinstance(failed.exceptions[0], NotFoundError)
+
+
+def test_opentelemetry_disabled_without_the_package(monkeypatch):
+    monkeypatch.setattr(instrumentation, "trace", None)
+    disabled = OpenTelemetryInstrument()
+    assert disabled.tracer is None
+
+    event = RequestEvent("game/nhl")
+    disabled.before_request(event)
+    disabled.after_request(event)
+
+
+def test_async_hooks():
+    events = []
+
+    def handler(request):
+        return httpx.Response(200, text=read_resource("team/roster"))
+
+    api = AsyncYahooFantasyApi(
+        123456,
+        "nhl",
+        timeout=0,
+        async_transport=AsyncTransport(transport=httpx.MockTransport(handler)),
+        instruments=[CallbackInstrument(after=events.append)],
+    )
+
+    asyncio.run(api.team(1).roster().get())
+    (event,) = events
+    assert event.resource == "team/roster"
+    assert event.status_code == 200
+    assert event.network_time > 0
+    assert event.model_time > 0
@@ -1,7 +1,13 @@
+import json
+import re
+
 import requests_mock
 from pytest import raises
 
 from yfantasy_api import YahooFantasyApi
+from yfantasy_api.api.cache import ModelCache
+from yfantasy_api.api.league import LeaguesApi, PlayerKeysApi
+from yfantasy_api.models import League
 
 
 def mock_request(requests_mock, path, response_name):
@@ -197,3 +203,351 @@ def test_transactions_waiver(requests_mock):
         api.league().transactions(ttype="waiver", team_id=1, count=1, start=1).get(),
         sub_resource,
     )
+
+
+def transactions_page(url):
+    with open("tests/resources/league/transactions.json") as f:
+        content = json.load(f)
+    history = content["fantasy_content"]["league"][1]["transactions"]
+    count = int(re.search(";count=([0-9]+)", url).group(1))
+    start = int(re.search(";start=([0-9]+)", url).group(1))
+
+    page = {"count": max(0, min(count, history["count"] - start))}
+    for t in range(page["count"]):
+        page[str(t)] = history[str(start + t)]
+    content["fantasy_content"]["league"][1]["transactions"] = page
+    return json.dumps(content)
+
+
+def mock_transactions(requests_mock):
+    url = re.compile(f"{YahooFantasyApi.base_url}/league/nhl.l.123456/transactions")
+    return requests_mock.get(
+        url, text=lambda request, context: transactions_page(request.url)
+    )
+
+
+def test_transactions_iter_since_key(requests_mock):
+    history = mock_transactions(requests_mock)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    transactions = api.league().transactions(count=5).iter_since("403.l.17457.tr.455")
+    keys = [t.transaction_id for t in transactions]
+    assert keys == ["463", "462", "461", "460", "459", "458", "457", "456"]
+    assert history.call_count == 2
+
+
+def test_transactions_iter_since_timestamp(requests_mock):
+    history = mock_transactions(requests_mock)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    for timestamp in [1618182820, "1618182820"]:
+        transactions = api.league().transactions().iter_since(since_timestamp=timestamp)
+        assert [t.transaction_id for t in transactions] == ["463", "462"]
+    assert history.call_count == 2
+
+
+def test_transactions_iter_since_stops_before_requesting(requests_mock):
+    history = mock_transactions(requests_mock)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    transactions = api.league().transactions(count=10).iter_since()
+    next(transactions)
+    assert history.call_count == 1
+
+
+def test_transactions_iter_since_whole_history(requests_mock):
+    mock_transactions(requests_mock)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    with open("tests/resources/league/transactions.json") as f:
+        expected = League(json.load(f)["fantasy_content"]["league"]).transactions
+
+    transactions = list(api.league().transactions(count=100).iter_since())
+    assert [t.transaction_key for t in transactions] == [
+        t.transaction_key for t in reversed(expected)
+    ]
+
+
+def test_transactions_iter_since_empty(requests_mock):
+    with open("tests/resources/league/transactions_empty.json") as f:
+        requests_mock.get(
+            re.compile(f"{YahooFantasyApi.base_url}/league/nhl.l.123456/transactions"),
+            text=f.read(),
+        )
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    assert list(api.league().transactions().iter_since("nhl.l.123456.tr.1")) == []
+
+
+def test_transactions_get_and_iter_since_share_a_path(requests_mock):
+    history = mock_transactions(requests_mock)
+    models = ModelCache()
+    api = YahooFantasyApi(123456, "nhl", timeout=0, model_cache=models)
+    transactions = api.league().transactions(count=5, start=5)
+
+    league = transactions.get()
+    for _ in range(2):
+        assert transactions.get() is league
+        synced = transactions.iter_since("403.l.17457.tr.455")
+        assert [t.transaction_id for t in synced] == ["458", "457", "456"]
+    assert history.call_count == 2
+    assert models.stats()["entries"] == 2
+
+
+def test_transactions_iter_since_filters(requests_mock):
+    history = mock_transactions(requests_mock)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    transactions = api.league().transactions(ttype="waiver", team_id=1, start=3)
+    next(transactions.iter_since())
+    assert history.last_request.url.endswith(
+        "/transactions;type=waiver;team_key=nhl.l.123456.t.1;count=25;start=3"
+        "?format=json"
+    )
+
+
+def mock_pages(requests_mock, response_name, pages):
+    with open(f"tests/resources/league/{response_name}.json") as f:
+        full_page = f.read()
+    with open("tests/resources/league/players_empty.json") as f:
+        empty_page = f.read()
+
+    def respond(request, context):
+        start = int(request.url.split(";start=")[1].split(";")[0])
+        return full_page if start < pages * 25 else empty_page
+
+    url = re.compile(f"{YahooFantasyApi.base_url}/league/nhl.l.123456/players")
+    requests_mock.get(url, text=respond)
+
+
+def test_players_iter_all(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_pages(requests_mock, "players", pages=2)
+
+    players = list(api.league().players(status="FA").iter_all())
+    assert len(players) == 50
+    assert [r.url.split(";")[1] for r in requests_mock.request_history] == [
+        "start=0",
+        "start=25",
+        "start=50",
+    ]
+    assert ";count=25;status=FA?" in requests_mock.request_history[0].url
+
+
+def test_players_iter_all_with_stats(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_pages(requests_mock, "players_with_stats", pages=2)
+
+    players = list(api.league().players(start=25).stats(week=3).iter_all())
+    assert len(players) == 25
+    assert all(player.stats for player in players)
+    assert (
+        "/players;start=50;count=25/stats;type=week;week=3?"
+        in requests_mock.request_history[1].url
+    )
+
+
+def test_players_iter_all_stops_on_short_page(requests_mock):
+    with open("tests/resources/league/players_with_ownership.json") as f:
+        short_page = json.load(f)
+    short_page["fantasy_content"]["league"][1]["players"]["count"] = 5
+    path = "league/nhl.l.123456/players;start=0;count=25/ownership"
+    requests_mock.get(f"{YahooFantasyApi.base_url}/{path}", json=short_page)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+
+    players = list(api.league().players().ownership().iter_all())
+    assert len(players) == 5
+    assert requests_mock.call_count == 1
+
+
+def test_players_iter_all_stops_when_closed(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_pages(requests_mock, "players_with_percent_owned", pages=10)
+
+    players = api.league().players().percent_owned().iter_all()
+    first = next(players)
+    players.close()
+    assert first.percent_owned is not None
+    assert requests_mock.call_count == 2
+
+
+def mock_player_pool(requests_mock, size, shift=0):
+    with open("tests/resources/league/players.json") as f:
+        template = json.load(f)
+
+    def respond(request, context):
+        start = int(request.url.split(";start=")[1].split(";")[0])
+        page = json.loads(json.dumps(template))
+        players = page["fantasy_content"]["league"][1]["players"]
+        count = max(0, min(25, size - start))
+        for i in range(count):
+            key = f"nhl.p.{start + i - shift * bool(start)}"
+            players[str(i)]["player"][0][0]["player_key"] = key
+        for i in range(count, 25):
+            del players[str(i)]
+        players["count"] = count
+        return page
+
+    url = re.compile(f"{YahooFantasyApi.base_url}/league/nhl.l.123456/players")
+    requests_mock.get(url, json=respond)
+
+
+def player_keys(players):
+    return [player.key for player in players]
+
+
+def test_players_get_all_with_total(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_player_pool(requests_mock, 60)
+
+    players = api.league().players().get_all(total=60)
+    assert player_keys(players) == [f"nhl.p.{i}" for i in range(60)]
+    assert requests_mock.call_count == 3
+
+
+def test_players_get_all_bisects_pool_size(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_player_pool(requests_mock, 190)
+
+    players = api.league().players().stats().get_all(max_workers=2)
+    starts = [r.url.split(";")[1] for r in requests_mock.request_history]
+    assert player_keys(players) == [f"nhl.p.{i}" for i in range(190)]
+    assert len(starts) == len(set(starts)) == 9
+
+
+def test_players_get_all_single_page(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_player_pool(requests_mock, 10)
+
+    assert len(api.league().players().get_all()) == 10
+    assert requests_mock.call_count == 1
+
+
+def test_players_get_all_removes_duplicates(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_player_pool(requests_mock, 50, shift=1)
+
+    players = api.league().players().get_all(total=50)
+    assert player_keys(players) == [f"nhl.p.{i}" for i in range(49)]
+
+
+def test_leagues_standings(requests_mock):
+    path = "leagues;league_keys=403.l.17457,403.l.17458/standings"
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_request(requests_mock, path, "leagues_standings")
+
+    leagues = api.leagues(["403.l.17457", "403.l.17458"]).standings().get()
+    assert [league.key for league in leagues] == ["403.l.17457", "403.l.17458"]
+    assert all(len(league.standings) == 12 for league in leagues)
+    assert requests_mock.call_count == 1
+
+
+def test_leagues_chunked_into_batches(requests_mock, mocker):
+    mocker.patch.object(LeaguesApi, "max_league_keys", 2)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_request(
+        requests_mock,
+        "leagues;league_keys=403.l.1,403.l.2/players;start=0;count=25/stats",
+        "leagues_standings",
+    )
+    mock_request(
+        requests_mock,
+        "leagues;league_keys=403.l.3/players;start=0;count=25/stats",
+        "leagues_standings",
+    )
+
+    leagues = api.leagues(["403.l.1", "403.l.2", "403.l.3"]).players().stats().get()
+    assert len(leagues) == 4
+    assert requests_mock.call_count == 2
+    assert requests_mock.request_history[1].path.endswith(
+        "leagues;league_keys=403.l.3/players;start=0;count=25/stats"
+    )
+
+
+def test_leagues_transactions(requests_mock):
+    path = "leagues;league_keys=403.l.17457/transactions;type=trade"
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/{path}",
+        json={"fantasy_content": {"leagues": {"count": 0}}},
+    )
+
+    assert api.leagues(["403.l.17457"]).transactions(ttype="trade").get() == []
+
+    with raises(Exception):
+        api.leagues(["403.l.17457"]).transactions(ttype="waiver")
+
+
+def test_leagues_paging_helpers_unsupported(requests_mock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    leagues = api.leagues(["403.l.1", "403.l.2"])
+
+    with raises(TypeError, match="single league"):
+        leagues.players().get_all()
+    with raises(TypeError, match="single league"):
+        next(leagues.players().stats().iter_all())
+    with raises(TypeError, match="single league"):
+        next(leagues.transactions().iter_since())
+    assert requests_mock.call_count == 0
+
+
+def player_keys_response(resource):
+    with open("tests/resources/league/players.json") as f:
+        league = json.load(f)["fantasy_content"]["league"]
+    players = league[1]["players"]
+    by_id = {
+        players[str(p)]["player"][0][1]["player_id"]: players[str(p)]["player"]
+        for p in range(players["count"])
+    }
+    info = {"league": league[0], "game": {"game_key": "403"}}[resource]
+
+    def respond(request, context):
+        keys = re.search("player_keys=([^/?]+)", request.url).group(1).split(",")
+        found = [by_id.get(k.rsplit(".", 1)[-1]) for k in reversed(keys)]
+        found = [p for p in found if p]
+        collection = {str(i): {"player": p} for i, p in enumerate(found)}
+        collection["count"] = len(found)
+        return json.dumps(
+            {"fantasy_content": {resource: [info, {"players": collection}]}}
+        )
+
+    return respond
+
+
+def test_players_by_key_in_order(requests_mock, mocker):
+    mocker.patch.object(PlayerKeysApi, "max_player_keys", 2)
+    requests_mock.get(
+        re.compile("players;player_keys="), text=player_keys_response("league")
+    )
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    keys = ["nhl.p.3346", "403.p.1600", "nhl.p.2530", "nhl.p.3346", "nhl.p.5"]
+
+    players = api.league().players(player_keys=keys).stats(week=3).get()
+    assert [p.key for p in players] == ["403.p.3346", "403.p.1600", "403.p.2530"]
+    assert requests_mock.call_count == 2
+    assert {r.url for r in requests_mock.request_history} == {
+        f"{YahooFantasyApi.base_url}/league/nhl.l.123456/players;player_keys="
+        f"{keys}/stats;type=week;week=3?format=json"
+        for keys in ["nhl.p.3346,403.p.1600", "nhl.p.2530,nhl.p.5"]
+    }
+
+
+def test_players_by_key_sub_resources(requests_mock):
+    requests_mock.get(
+        re.compile("players;player_keys="), text=player_keys_response("league")
+    )
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    league = api.league()
+
+    assert league.players(player_keys=[]).get() == []
+    for sub_resource in ["draft_analysis", "ownership", "percent_owned"]:
+        players = getattr(
+            api.league().players(player_keys=["nhl.p.1600"]), sub_resource
+        )()
+        assert [p.id for p in players.get()] == [1600]
+        assert requests_mock.last_request.url.endswith(f"/{sub_resource}?format=json")
+
+
+def test_leagues_players_without_player_keys():
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    with raises(TypeError):
+        api.leagues(["403.l.1"]).players(player_keys=["403.p.1600"])
@@ -0,0 +1,156 @@
+import json
+
+from pytest import mark, raises
+
+from yfantasy_api.models import League, Team
+from yfantasy_api.models.helpers import as_int, as_shared, field, lazy, Schema
+from yfantasy_api.models.league import Matchup
+from yfantasy_api.models.transaction import Add
+
+
+def load(path):
+    with open(f"tests/resources/{path}.json") as f:
+        return json.load(f)["fantasy_content"]
+
+
+def league(name):
+    return League(load(f"league/{name}")["league"])
+
+
+@mark.parametrize(
+    "name,sub_resource",
+    [
+        ("draftresults", "draft_results"),
+        ("players", "players"),
+        ("scoreboard", "matchups"),
+        ("settings_nfl", "settings"),
+        ("standings", "standings"),
+        ("transactions", "transactions"),
+    ],
+)
+def test_models_have_no_instance_dict(name, sub_resource):
+    models = getattr(league(name), sub_resource)
+    for model in models if type(models) == list else [models]:
+        assert not hasattr(model, "__dict__")
+
+
+def test_models_reject_unknown_attributes():
+    with raises(AttributeError):
+        league("meta").unknown = 1
+
+
+def test_missing_sub_resources_default_to_none():
+    meta = league("meta")
+    assert meta.players is None
+    assert meta.transactions is None
+
+    player = league("players").players[0]
+    assert player.stats is None
+    assert player.percent_owned is None
+    assert player.selected_position is None
+
+
+def test_team_standings_default_to_none():
+    team = Team(load("team/meta")["team"])
+    assert team.rank is None
+    assert team.div_wins is None
+    assert team.streak_type is None
+
+
+def test_matchup_without_winner():
+    matchups = load("league/scoreboard")["league"][1]["scoreboard"]["0"]["matchups"]
+    json = dict(matchups["0"]["matchup"])
+    json.pop("winner_team_key", None)
+    matchup = Matchup(json)
+    assert matchup.winning_team is None
+    assert matchup.losing_team is None
+
+
+def test_repr_lists_every_attribute():
+    transaction = league("transactions").transactions[0]
+    assert "'transaction_key'" in repr(transaction)
+    assert "'added_player'" in repr(transaction)
+
+    settings = league("settings_nfl").settings
+    assert "'waiver_rule'" in repr(settings)
+    assert "'Division 1'" in repr(settings.divisions)
+    assert "'Pass Yds'" in repr(settings.stat_categories)
+
+    assert "'pick': 1" in repr(league("draftresults").draft_results[0])
+    assert "'week': 1" in repr(league("scoreboard").matchups[0])
+    assert "'draft_results': None" in repr(league("meta"))
+
+
+def test_matchup_with_winner():
+    matchup = next(m for m in league("scoreboard_nfl").matchups if m.winning_team)
+    assert matchup.winning_team in matchup.teams
+    assert matchup.losing_team in matchup.teams
+    assert matchup.winning_team is not matchup.losing_team
+
+
+def test_sub_resources_are_parsed_on_first_access(mocker):
+    add = mocker.spy(Add, "__init__")
+    transactions = league("transactions")
+    assert add.call_count == 0
+
+    assert transactions.transactions is transactions.transactions
+    assert add.call_count > 0
+    assert "transactions" not in transactions._raw
+
+
+def test_repr_leaves_sub_resources_unparsed(mocker):
+    add = mocker.spy(Add, "__init__")
+    transactions = league("transactions")
+
+    assert "'transactions'" not in repr(transactions)
+    assert add.call_count == 0
+    assert transactions.transactions
+    assert "'transactions'" in repr(transactions)
+
+
+def test_lazy_sub_resources_on_the_class():
+    assert isinstance(League.players, lazy)
+    assert League.players.name == "players"
+
+
+class Model:
+    __slots__ = ("id", "first_name", "positions")
+
+
+def test_schema_reads_nested_paths_in_one_pass():
+    schema = Schema(
+        [
+            field("id", "player_id", as_int),
+            field("first_name", "name/first"),
+            field("positions", "eligible_positions", default=list),
+        ]
+    )
+    model = Model()
+    schema.parse(model, [{"player_id": "3"}, [], {"name": {"first": "Connor"}}])
+
+    assert model.id == 3
+    assert model.first_name == "Connor"
+    assert model.positions == []
+
+    other = Model()
+    schema.parse(other, [])
+    assert other.positions is not model.positions
+
+
+def test_schema_missing_values_use_the_defaults():
+    schema = Schema(
+        [field("first_name", "name/first", as_shared), field("id", "player_id")]
+    )
+    model = Model()
+    schema.parse(model, [{"name": None}])
+
+    assert model.first_name is None
+    assert model.id is None
+
+
+def test_team_without_logos_or_managers():
+    team = Team([[{"team_key": "1.l.1.t.1"}, {"team_logos": []}]])
+    assert team.key == "1.l.1.t.1"
+    assert team.team_logos is None
+    assert team.managers == []
+    assert team.clinched_playoffs is False
@@ -0,0 +1,123 @@
+import asyncio
+import time
+
+import httpx
+from pytest import fixture
+
+from yfantasy_api import AsyncYahooFantasyApi, MultiLeagueApi, YahooFantasyApi
+from yfantasy_api.api.aio import AsyncTransport
+from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.cache import ModelCache
+
+LEAGUES = [("nhl", 111), ("nhl", 222), ("nfl", 333)]
+
+
+@fixture(autouse=True)
+def setup(mocker):
+    mocker.patch.object(AuthenticationService, "__init__").return_value = None
+    mocker.patch.object(AuthenticationService, "get_access_token")
+    mocker.patch.object(AuthenticationService, "get_refresh_token")
+    mocker.patch.object(AuthenticationService, "get_expires_by").return_value = (
+        time.time() + 1000
+    )
+
+
+def read_resource(name):
+    with open(f"tests/resources/{name}.json") as f:
+        return f.read()
+
+
+def mock_league(requests_mock, league_key, sub_resource, response_name):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/league/{league_key}/{sub_resource}",
+        text=read_resource(f"league/{response_name}"),
+    )
+
+
+def test_leagues_share_one_api():
+    api = MultiLeagueApi(LEAGUES, timeout=0)
+
+    assert list(api.leagues) == ["nhl.l.111", "nhl.l.222", "nfl.l.333"]
+    assert AuthenticationService.__init__.call_count == 1
+    assert all(league.api is api.api for league in api.leagues.values())
+
+
+def test_standings_keyed_by_league(requests_mock):
+    for game_id, league_id in LEAGUES:
+        mock_league(requests_mock, f"{game_id}.l.{league_id}", "standings", "standings")
+    api = MultiLeagueApi(LEAGUES, timeout=0)
+
+    standings = api.standings()
+    assert list(standings) == ["nhl.l.111", "nhl.l.222", "nfl.l.333"]
+    assert all(league.standings for league in standings.values())
+    assert requests_mock.call_count == 3
+
+
+def test_scoreboard_of_a_week(requests_mock):
+    for game_id, league_id in LEAGUES:
+        league_key = f"{game_id}.l.{league_id}"
+        mock_league(requests_mock, league_key, "scoreboard;week=2", "scoreboard")
+    api = MultiLeagueApi(LEAGUES, timeout=0)
+
+    scoreboards = api.scoreboard(week=2)
+    assert all(league.matchups for league in scoreboards.values())
+
+
+def test_map_custom_query(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/team/nfl.l.333.t.1/roster",
+        text=read_resource("team/roster"),
+    )
+    api = MultiLeagueApi(LEAGUES, timeout=0, max_workers=2)
+
+    rosters = api.map(
+        lambda league: league.team(1).roster().get() if league.game_id == "nfl" else 0
+    )
+    assert rosters["nhl.l.111"] == 0
+    assert rosters["nfl.l.333"].players
+
+
+def test_cache_shared_across_scopes(requests_mock):
+    mock_league(requests_mock, "nhl.l.111", "standings", "standings")
+    api = MultiLeagueApi(LEAGUES, timeout=0, model_cache=ModelCache())
+
+    first = api.league("nhl.l.111").league().standings().get()
+    second = api.league("nhl.l.111").league().standings().get()
+    assert first is second
+    assert requests_mock.call_count == 1
+
+
+def test_async_standings():
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        return httpx.Response(200, text=read_resource("league/standings"))
+
+    async_transport = AsyncTransport(transport=httpx.MockTransport(handler))
+    shared = AsyncYahooFantasyApi(
+        111, "nhl", timeout=0, async_transport=async_transport
+    )
+    api = MultiLeagueApi(LEAGUES, api=shared)
+
+    async def fetch_standings():
+        standings = await api.standings()
+        await shared.close()
+        return standings
+
+    standings = asyncio.run(fetch_standings())
+    assert list(standings) == ["nhl.l.111", "nhl.l.222", "nfl.l.333"]
+    assert "/fantasy/v2/league/nfl.l.333/standings" in requested
+    assert len(requested) == 3
+
+
+def test_teams_of_a_league(requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/teams;team_keys=nhl.l.222.t.1,nhl.l.222.t.2"
+        "/standings",
+        text=read_resource("team/teams_standings"),
+    )
+    api = MultiLeagueApi(LEAGUES, timeout=0)
+
+    teams = api.league("nhl.l.222").teams([1, 2]).standings().get()
+    assert [team.id for team in teams] == [1, 2]
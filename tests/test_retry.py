@@ -0,0 +1,117 @@
+from types import SimpleNamespace
+
+from pytest import raises
+
+from yfantasy_api.api.errors import (
+    AuthenticationError,
+    CircuitOpenError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    YahooFantasyError,
+    error_for,
+)
+from yfantasy_api.api.retry import CircuitBreaker, RetryPolicy
+
+
+def make_response(status_code, headers=None):
+    return SimpleNamespace(
+        status_code=status_code,
+        url="https://example.com/game/nhl",
+        text="Error!",
+        headers=headers or {},
+    )
+
+
+def test_errors_by_status():
+    assert type(error_for(make_response(401))) is AuthenticationError
+    assert type(error_for(make_response(403))) is AuthenticationError
+    assert type(error_for(make_response(404))) is NotFoundError
+    assert type(error_for(make_response(503))) is ServerError
+    assert type(error_for(make_response(400))) is YahooFantasyError
+
+    error = error_for(make_response(999, {"Retry-After": "7"}))
+    assert type(error) is RateLimitError
+    assert error.retry_after == 7
+    assert error.url == "https://example.com/game/nhl"
+    assert str(error) == "Yahoo responded with 999: Error!"
+
+
+def test_retry_policy_backs_off_exponentially_with_jitter():
+    bounds = []
+    policy = RetryPolicy(
+        retries=5,
+        backoff_factor=1,
+        max_backoff=4,
+        uniform=lambda a, b: bounds.append((a, b)) or b / 2,
+    )
+
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.5, 1, 2, 2]
+    assert bounds == [(0, 1), (0, 2), (0, 4), (0, 4)]
+    assert policy.retried == 4
+
+
+def test_retry_policy_statuses():
+    policy = RetryPolicy(retries=1)
+    assert policy.should_retry(503, 0)
+    assert not policy.should_retry(503, 1)
+    assert not policy.should_retry(404, 0)
+
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure()
+    breaker.record_success()
+    assert breaker.failures == 0
+
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.opened == 1
+
+    with raises(CircuitOpenError) as error:
+        breaker.before_request()
+    assert error.value.retry_in == 10
+
+    # A failure of a query sent before the circuit opened keeps it as is
+    breaker.record_failure()
+    assert breaker.opened == 1
+
+
+def test_circuit_lets_a_single_query_through_after_the_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.state == "half-open"
+    breaker.before_request()
+    with raises(CircuitOpenError) as error:
+        breaker.before_request()
+    assert error.value.retry_in == 0
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.opened == 2
+
+    clock.now = 20
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_request()
+
+
+def test_released_probe_lets_another_query_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    breaker.before_request()
+    breaker.release()
+    assert breaker.state == "half-open"
+    assert breaker.opened == 1
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+from pytest import raises
+
+from yfantasy_api.models import League
+from yfantasy_api.models.columnar import stats_matrix
+from yfantasy_api.models.scoring import Scoring
+
+
+def load(name):
+    with open(f"tests/resources/league/{name}.json") as f:
+        return League(json.load(f)["fantasy_content"]["league"])
+
+
+def scoring():
+    return Scoring(load("settings").settings)
+
+
+def test_modifiers():
+    engine = scoring()
+    assert engine.stat_ids[:3] == [1, 2, 4]
+    assert list(engine.modifiers[:3]) == [3.5, 2.5, 1.0]
+
+
+def test_player_points_match_yahoo():
+    players = load("players_with_stats").players
+    points = scoring().player_points(players)
+
+    expected = [p.points for p in players]
+    assert np.allclose(points, expected)
+
+
+def test_period_points():
+    players = load("players_with_stats").players
+    engine = scoring()
+    points = engine.period_points([players, players, players])
+
+    assert points.shape == (3, len(players))
+    assert np.allclose(points.sum(axis=0), 3 * engine.player_points(players))
+
+
+def test_period_points_match_players_by_key():
+    players = load("players_with_stats").players
+    engine = scoring()
+    points = engine.period_points([players, players[::-1]])
+
+    assert np.allclose(points[0], points[1])
+    assert np.allclose(points[0], engine.player_points(players))
+    with raises(ValueError):
+        engine.period_points([players, players[1:]])
+    with raises(ValueError):
+        engine.period_points([players, players[1:] + players[:1] * 2])
+
+
+def test_points_of_a_stats_tensor():
+    players = load("players_with_stats").players
+    engine = scoring()
+    week = stats_matrix(players, engine.stat_ids)
+    stats = np.stack([week, week * 2])
+
+    points = engine.points(stats)
+    assert np.allclose(points[1], 2 * points[0])
+
+
+def test_players_without_stats_score_nothing():
+    draft_results = load("draftresults").draft_results
+    assert not scoring().player_points(draft_results).any()
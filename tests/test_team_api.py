@@ -2,6 +2,7 @@ import requests_mock
 from pytest import raises
 
 from yfantasy_api import YahooFantasyApi
+from yfantasy_api.api.team import TeamsApi
 
 
 def mock_request(requests_mock, path, response_name):
@@ -113,3 +114,35 @@ def test_roster_with_stats_date(requests_mock):
     mock_request(requests_mock, path, "roster_with_stats")
 
     hasattr(api.team(1).roster(date="2021-03-01").stats().get(), "roster")
+
+
+def test_teams_standings(requests_mock):
+    path = "teams;team_keys=nhl.l.123456.t.1,nhl.l.123456.t.2/standings"
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_request(requests_mock, path, "teams_standings")
+
+    teams = api.teams([1, 2]).standings().get()
+    assert [team.id for team in teams] == [1, 2]
+    assert requests_mock.call_count == 1
+
+
+def test_teams_chunked_into_batches(requests_mock, mocker):
+    mocker.patch.object(TeamsApi, "max_team_keys", 2)
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    mock_request(
+        requests_mock,
+        "teams;team_keys=nhl.l.123456.t.1,nhl.l.123456.t.2/roster/players/stats",
+        "teams_standings",
+    )
+    mock_request(
+        requests_mock,
+        "teams;team_keys=nhl.l.123456.t.3/roster/players/stats",
+        "teams_standings",
+    )
+
+    teams = api.teams([1, 2, 3]).roster().stats().get()
+    assert len(teams) == 4
+    assert requests_mock.call_count == 2
+    assert requests_mock.request_history[1].path.endswith(
+        "teams;team_keys=nhl.l.123456.t.3/roster/players/stats"
+    )
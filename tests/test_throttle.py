@@ -0,0 +1,89 @@
+import asyncio
+from email.utils import formatdate
+from types import SimpleNamespace
+
+from yfantasy_api.api.throttle import RateLimiter, retry_after
+
+
+def make_limiter(clock, rate=1.0, burst=1):
+    return RateLimiter(rate=rate, burst=burst, clock=clock, sleep=clock.sleep)
+
+
+def test_burst_is_not_throttled(clock):
+    limiter = make_limiter(clock, rate=2.0, burst=3)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert clock.sleeps == []
+    assert limiter.throttled_requests == 0
+
+
+def test_empty_bucket_waits_for_refill(clock):
+    limiter = make_limiter(clock, rate=2.0, burst=1)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert clock.sleeps == [0.5, 0.5]
+    assert limiter.metrics() == {
+        "throttled_requests": 2,
+        "throttled_time": 1.0,
+        "backoffs": 0,
+    }
+
+
+def test_spread_out_requests_are_not_throttled(clock):
+    limiter = make_limiter(clock, rate=1.0, burst=1)
+    limiter.acquire()
+    clock.now += 5
+    limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_from_timeout():
+    assert RateLimiter.from_timeout(2).rate == 0.5
+    assert RateLimiter.from_timeout(0).rate is None
+
+
+def test_unlimited_only_waits_while_backing_off(clock):
+    limiter = make_limiter(clock, rate=None)
+    limiter.acquire()
+    limiter.backoff(retry_after=3)
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == [3]
+
+
+def test_adaptive_backoff_doubles_until_recovered(clock):
+    limiter = make_limiter(clock, rate=None)
+    for _ in range(3):
+        limiter.backoff()
+        limiter.acquire()
+    limiter.recover()
+    limiter.backoff()
+    limiter.acquire()
+
+    assert clock.sleeps == [1.0, 2.0, 4.0, 1.0]
+    assert limiter.backoffs == 4
+
+
+def test_acquire_async(clock):
+    limiter = make_limiter(clock, rate=1000.0, burst=1)
+
+    async def acquire_twice():
+        await limiter.acquire_async()
+        await limiter.acquire_async()
+
+    asyncio.run(acquire_twice())
+    assert limiter.throttled_requests == 1
+
+
+def test_retry_after():
+    def response(value):
+        return SimpleNamespace(headers={"Retry-After": value} if value else {})
+
+    assert retry_after(response(None)) is None
+    assert retry_after(response("7")) == 7.0
+    assert retry_after(response(formatdate(0, usegmt=True))) == 0.0
+    assert retry_after(response("soon")) is None
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from pytest import mark
+
+from yfantasy_api import AsyncYahooFantasyApi, YahooFantasyApi
+from yfantasy_api.api import auth
+from yfantasy_api.api.aio import AsyncTransport
+from yfantasy_api.api.throttle import RateLimiter
+
+THREADS = 16
+
+pytestmark = mark.usefixtures("token_file")
+
+
+def read_resource(name):
+    with open(f"tests/resources/{name}.json") as f:
+        return f.read()
+
+
+def test_one_refresh_per_expiry_across_threads(token_stub, requests_mock):
+    requests_mock.get(
+        f"{YahooFantasyApi.base_url}/game/nhl", text=read_resource("game/game")
+    )
+    api = YahooFantasyApi(123456, "nhl", rate_limiter=RateLimiter(rate=None))
+    barrier = threading.Barrier(THREADS)
+
+    def query(_):
+        barrier.wait()
+        return api.game().get()
+
+    for expiry in range(1, 4):
+        requests_mock.reset_mock()
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            games = list(executor.map(query, range(THREADS)))
+
+        assert len(token_stub) == expiry
+        assert all(game.info for game in games)
+        authorizations = {
+            r.headers["Authorization"]
+            for r in requests_mock.request_history
+            if r.method == "GET"
+        }
+        assert authorizations == {f"Bearer token-{expiry}"}
+        api.expires_by = time.time() - 1
+
+    with open(auth.TOKEN_FILE) as f:
+        assert json.load(f)["access_token"] == "token-3"
+
+
+def test_one_refresh_per_expiry_across_tasks(token_stub):
+    authorizations = []
+
+    def handler(request):
+        authorizations.append(request.headers["Authorization"])
+        return httpx.Response(200, text=read_resource("game/game"))
+
+    async_transport = AsyncTransport(transport=httpx.MockTransport(handler))
+    api = AsyncYahooFantasyApi(
+        123456,
+        "nhl",
+        rate_limiter=RateLimiter(rate=None),
+        async_transport=async_transport,
+        max_concurrency=THREADS,
+    )
+
+    async def query_all():
+        games = await asyncio.gather(*[api.game().get() for _ in range(THREADS)])
+        await api.close()
+        return games
+
+    games = asyncio.run(query_all())
+    assert len(token_stub) == 1
+    assert len(games) == THREADS
+    assert set(authorizations) == {"Bearer token-1"}
+
+
+def test_forced_refresh(token_stub):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    api.refresh_tokens()
+    api.ensure_tokens()
+
+    assert len(token_stub) == 1
+    assert api.access_token == "token-1"
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import time
+
+from pytest import fixture
+
+from yfantasy_api import YahooFantasyApi
+from yfantasy_api.api import auth
+from yfantasy_api.api.refresher import TokenRefresher
+
+
+@fixture(autouse=True)
+def tokens(token_file):
+    token_file(time.time() + 3600)
+
+
+def test_refreshes_ahead_of_expiry(token_stub, clock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    expires_by = api.expires_by
+    clock.now = expires_by - 700
+    refresher = TokenRefresher(api, lead=600, jitter=60, clock=clock, uniform=max)
+
+    assert refresher.due() == expires_by - 660
+    assert refresher.run_once() == 40
+    assert token_stub == []
+
+    clock.now = expires_by - 650
+    refresher.run_once()
+    assert len(token_stub) == 1
+    assert refresher.refreshes == 1
+    assert api.access_token == "token-1"
+    assert api.expires_by > expires_by
+    assert refresher.due() == api.expires_by - 660
+
+    # The request path finds valid tokens and doesn't refresh them again
+    api.ensure_tokens()
+    assert len(token_stub) == 1
+
+
+def test_keeps_tokens_refreshed_in_the_request_path(token_stub, clock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    expires_by = clock.now = api.expires_by
+    refresher = TokenRefresher(api, clock=clock, uniform=min)
+    assert refresher.due() == expires_by - 600
+
+    api.refresh_tokens()
+    api.refresh_tokens(expires_by)
+    assert len(token_stub) == 1
+
+
+def test_tokens_refreshed_by_a_request_are_not_counted(token_stub, clock):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    clock.now = api.expires_by
+    refresher = TokenRefresher(api, clock=clock)
+    refresh_tokens = api.refresh_tokens
+
+    def refreshed_by_a_request(expires_by=None):
+        # A request refreshes the tokens while the refresher waits on the lock
+        assert refresh_tokens()
+        return refresh_tokens(expires_by)
+
+    api.refresh_tokens = refreshed_by_a_request
+    refresher.run_once()
+    assert len(token_stub) == 1
+    assert refresher.refreshes == 0
+
+
+def test_failures_fall_back_to_the_request_path(token_stub, requests_mock, clock):
+    requests_mock.post(auth.TOKEN_URL, status_code=500, text="{}")
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    clock.now = api.expires_by - 600
+    refresher = TokenRefresher(api, retry=5, clock=clock)
+
+    assert refresher.run_once() == 5
+    assert refresher.run_once() == 5
+    assert refresher.failures == 2
+    assert refresher.refreshes == 0
+    assert refresher.last_error is not None
+    assert api.access_token == "token-0"
+
+    requests_mock.post(
+        auth.TOKEN_URL,
+        text=json.dumps(
+            {"access_token": "token-1", "refresh_token": "r", "expires_in": 3600}
+        ),
+    )
+    api.expires_by = time.time() + 60
+    api.ensure_tokens()
+    assert api.access_token == "token-1"
+
+
+def test_background_thread(token_stub):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    api.expires_by = time.time() + 60
+    refresher = TokenRefresher(api)
+
+    with refresher:
+        deadline = time.time() + 5
+        while not refresher.refreshes and time.time() < deadline:
+            time.sleep(0.01)
+    refresher.stop()
+
+    assert refresher.refreshes == 1
+    assert len(token_stub) == 1
+    assert api.access_token == "token-1"
+
+
+def test_background_task(token_stub):
+    api = YahooFantasyApi(123456, "nhl", timeout=0)
+    api.expires_by = time.time() + 60
+    refresher = TokenRefresher(api)
+
+    async def refresh():
+        task = asyncio.create_task(refresher.run())
+        while not refresher.refreshes:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(refresh())
+    assert len(token_stub) == 1
+    assert api.access_token == "token-1"
@@ -0,0 +1,104 @@
+import os
+import threading
+
+from pytest import raises
+
+from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.tokens import (
+    CallbackTokenStore,
+    EnvTokenStore,
+    FileTokenStore,
+    MemoryTokenStore,
+)
+
+EXPIRED = {"access_token": "token-0", "refresh_token": "r", "expires_by": 0}
+
+
+def prompt(_):
+    raise AssertionError("the user was prompted")
+
+
+def refresh_concurrently(services):
+    barrier = threading.Barrier(len(services))
+
+    def refresh(service):
+        barrier.wait()
+        service.refresh_tokens()
+
+    threads = [threading.Thread(target=refresh, args=(s,)) for s in services]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_file_store_saves_atomically(tmp_path):
+    store = FileTokenStore(str(tmp_path / ".tokens.json"))
+    assert store.load() is None
+
+    store.save(EXPIRED)
+    assert store.load() == EXPIRED
+    assert os.listdir(tmp_path) == [".tokens.json"]
+
+
+def test_file_store_shared_by_processes(tmp_path, token_stub):
+    # Each service has its own store object, like separate processes would,
+    # so only the lock file keeps them from refreshing the tokens twice
+    path = str(tmp_path / ".tokens.json")
+    FileTokenStore(path).save(EXPIRED)
+    services = [AuthenticationService(store=FileTokenStore(path)) for _ in range(4)]
+
+    refresh_concurrently(services)
+    assert len(token_stub) == 1
+    assert {s.get_access_token() for s in services} == {"token-1"}
+    assert FileTokenStore(path).load()["access_token"] == "token-1"
+
+
+def test_startup_does_not_write_the_tokens(tmp_path, mocker):
+    store = FileTokenStore(str(tmp_path / ".tokens.json"))
+    store.save(EXPIRED)
+    save = mocker.spy(store, "save")
+
+    service = AuthenticationService(store=store)
+    assert service.get_access_token() == "token-0"
+    save.assert_not_called()
+
+
+def test_memory_store_shared_by_services(token_stub):
+    store = MemoryTokenStore(dict(EXPIRED))
+    services = [AuthenticationService(store=store) for _ in range(4)]
+
+    refresh_concurrently(services)
+    assert len(token_stub) == 1
+    assert store.load()["access_token"] == "token-1"
+
+
+def test_env_store(monkeypatch, token_stub):
+    monkeypatch.setenv("YF_REFRESH_TOKEN", "env_refresh_token")
+    service = AuthenticationService(store=EnvTokenStore(prefix="YF_"))
+    assert service.get_access_token() is None
+    assert service.get_expires_by() == 0
+
+    service.refresh_tokens()
+    assert "refresh_token=env_refresh_token" in token_stub[0]
+    assert service.get_access_token() == "token-1"
+
+
+def test_callback_store(token_stub):
+    saved = []
+    store = CallbackTokenStore(lambda: saved[-1] if saved else EXPIRED, saved.append)
+    service = AuthenticationService(store=store)
+
+    service.refresh_tokens()
+    assert saved[0]["access_token"] == "token-1"
+    assert store.load() is saved[0]
+
+    read_only = CallbackTokenStore(lambda: EXPIRED)
+    AuthenticationService(store=read_only).refresh_tokens()
+    assert read_only.load() is EXPIRED
+
+
+def test_empty_store_never_prompts(monkeypatch):
+    monkeypatch.setattr("builtins.input", prompt)
+    with raises(Exception, match="no tokens"):
+        AuthenticationService(store=EnvTokenStore(prefix="MISSING_"))
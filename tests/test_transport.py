@@ -0,0 +1,93 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests_mock
+from pytest import fixture
+
+from yfantasy_api.api import transport
+from yfantasy_api.api.transport import Transport, load_decoder
+
+
+def test_pool_size():
+    pooled = Transport(pool_size=4, retries=2)
+    adapter = pooled.session.get_adapter("https://fantasysports.yahooapis.com")
+
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+
+
+@fixture
+def server():
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            status = 429 if self.path == "/limited" else 503
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever)
+    thread.start()
+    yield "http://127.0.0.1:{}".format(httpd.server_port), requests
+    httpd.shutdown()
+    httpd.server_close()
+    thread.join()
+
+
+def test_statuses_are_not_retried_by_the_adapter(server):
+    url, requests = server
+    pooled = Transport(retries=3, backoff_factor=0)
+
+    assert pooled.get(f"{url}/limited").status_code == 429
+    assert pooled.get(f"{url}/failing").status_code == 503
+    assert requests == ["/limited", "/failing"]
+    pooled.close()
+
+
+def test_keep_alive_disabled():
+    assert Transport(keep_alive=False).session.headers["Connection"] == "close"
+
+
+def test_get_and_post_reuse_session(requests_mock):
+    requests_mock.get("https://example.com/get", text="get")
+    requests_mock.post("https://example.com/post", text="post")
+    pooled = Transport()
+
+    assert pooled.get("https://example.com/get").text == "get"
+    assert pooled.post("https://example.com/post", data={"a": 1}).text == "post"
+    pooled.close()
+
+
+def read_resource(name):
+    with open(f"tests/resources/{name}.json", "rb") as f:
+        return f.read()
+
+
+def test_decoders_match_stdlib():
+    body = read_resource("league/transactions")
+    expected = json.loads(body)
+
+    for name in ["json", "orjson", "msgspec"]:
+        assert load_decoder(name)(body) == expected
+
+
+def test_auto_decoder_falls_back_to_stdlib(mocker):
+    def missing():
+        raise ImportError
+
+    mocker.patch.dict(transport.DECODERS, {"orjson": missing, "msgspec": missing})
+    assert load_decoder() is json.loads
+    assert load_decoder(json.loads) is json.loads
+
+
+def test_transport_decoder():
+    assert Transport(decoder="json").decode is json.loads
+    assert Transport().decode(b'{"a": 1}') == {"a": 1}
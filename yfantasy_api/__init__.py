@@ -1,3 +1,5 @@
 __version__ = "develop"
 
 from yfantasy_api.api.api import YahooFantasyApi
+from yfantasy_api.api.aio import AsyncYahooFantasyApi
+from yfantasy_api.api.multi import MultiLeagueApi
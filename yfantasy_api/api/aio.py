@@ -0,0 +1,249 @@
+import asyncio
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from yfantasy_api.api.api import YahooFantasyApi
+from yfantasy_api.api.cache import model_kind
+from yfantasy_api.api.errors import CircuitOpenError
+from yfantasy_api.api.instrumentation import RequestEvent, notify
+from yfantasy_api.api.query import PARAMS, REFRESH, RETRY, Query
+from yfantasy_api.api.transport import load_decoder
+
+
+class AsyncTransport:
+    """Async Transport: Owns the pooled async http client used for queries
+
+    This is the asyncio counterpart of `Transport`, built on an
+    `httpx.AsyncClient` so that connections are kept alive and shared
+    by every task sending requests to Yahoo.
+
+    Attributes
+    ----------
+    client: httpx.AsyncClient
+        The pooled async client used to send all http requests
+    decode
+        The function used to decode raw response bodies into json
+    """
+
+    def __init__(
+        self,
+        pool_size=10,
+        retries=3,
+        keep_alive=True,
+        transport=None,
+        decoder="auto",
+    ):
+        """Initialize a new AsyncTransport
+
+        Parameters
+        ----------
+        pool_size: int
+            The maximum number of open connections. (default: 10)
+        retries: int
+            The number of times a failed connection is retried.
+            (default: 3)
+        keep_alive: bool
+            A flag to indicate whether connections should be kept open
+            between requests. (default: True)
+        transport: httpx.AsyncBaseTransport
+            An httpx transport to send requests through, if nothing is
+            provided a pooled `httpx.AsyncHTTPTransport` is created
+        decoder: str
+            The json decoder used for response bodies, see `load_decoder`.
+            (default: 'auto')
+        """
+        if httpx is None:  # pragma: no cover
+            raise ImportError(
+                "httpx is required for the async client, "
+                "install it with `pip install yfantasy-api[async]`"
+            )
+
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size if keep_alive else 0,
+        )
+        self.decode = load_decoder(decoder)
+        self.client = httpx.AsyncClient(
+            transport=transport
+            or httpx.AsyncHTTPTransport(retries=retries, limits=limits)
+        )
+
+    async def get(self, url, params=None, headers=None):
+        """Send a GET request over the pooled async client
+
+        Parameters
+        ----------
+        url: str
+            The full url of the request
+        params: dict
+            The query parameters to include in the request
+        headers: dict
+            The headers to include in the request
+        """
+        return await self.client.get(url, params=params, headers=headers)
+
+    async def close(self):
+        """Close every pooled connection held by the client"""
+        await self.client.aclose()
+
+
+class AsyncYahooFantasyApi(YahooFantasyApi):
+    """Async Yahoo Fantasy API: The asyncio flavour of YahooFantasyApi
+
+    This class exposes the exact same fluent builders as YahooFantasyApi,
+    but every `get()` call returns an awaitable that resolves to the same
+    `League`, `Team`, `Game` or `User` models. This allows many queries
+    to be run concurrently, for example:
+
+        await asyncio.gather(*[api.team(t).roster().get() for t in teams])
+
+    Attributes
+    ----------
+    async_transport: AsyncTransport
+        The pooled async transport used for sending every query
+    max_concurrency: int
+        The maximum number of queries allowed in flight at once
+    """
+
+    def __init__(
+        self,
+        league_id,
+        game_id,
+        timeout=1,
+        transport=None,
+        rate_limiter=None,
+        cache=None,
+        model_cache=None,
+        async_transport=None,
+        max_concurrency=10,
+        token_store=None,
+        retry_policy=None,
+        circuit_breaker=None,
+        single_flight=None,
+        instruments=None,
+    ):
+        super().__init__(
+            league_id,
+            game_id,
+            timeout,
+            transport,
+            rate_limiter,
+            cache,
+            model_cache,
+            token_store,
+            retry_policy,
+            circuit_breaker,
+            single_flight,
+            instruments,
+        )
+        self.async_transport = async_transport or AsyncTransport(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+        self.__refresh_lock = asyncio.Lock()
+
+    async def get(self, path, model=None):
+        """Invoke the query built by the api object calling this method
+
+        Parameters
+        ----------
+        path: str
+            The path built by the api object calling this method
+        model
+            A callable used to transform the `fantasy_content` json into
+            a model; if nothing is provided the json is returned as is
+        """
+        kind = model_kind(model)
+        if model and self.model_cache:
+            cached = self.model_cache.get(path, kind)
+            if cached is not None:
+                return cached
+
+        key = (path, kind)
+        return await self.single_flight.do_async(key, lambda: self.__get(path, model))
+
+    async def __get(self, path, model):
+        event = RequestEvent(path)
+        notify(self.instruments, "before_request", event)
+        try:
+            async with self.__semaphore:
+                content, size = await self.__get_resource(path, event)
+            if not model:
+                return content
+
+            with event.timing("model"):
+                built = model(content)
+            if self.model_cache:
+                self.model_cache.put(path, built, size, model_kind(model))
+            return built
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.finish()
+            notify(self.instruments, "after_request", event)
+
+    async def get_batches(self, paths, model, max_workers=None):
+        """Invoke one query per path concurrently and concatenate the models
+
+        Parameters
+        ----------
+        paths: list
+            The paths built by the collection api calling this method
+        model
+            A callable used to transform each `fantasy_content` json into
+            a list of models
+        max_workers: int
+            Unused, the number of queries in flight is bounded by
+            `max_concurrency` instead
+        """
+        batches = await asyncio.gather(*[self.get(path, model) for path in paths])
+        return [item for batch in batches for item in batch]
+
+    async def close(self):
+        """Close the pooled connections of both transports"""
+        await self.async_transport.close()
+        self.transport.close()
+
+    async def __ensure_tokens(self):
+        # Tasks queue on the lock so that a single one runs the refresh in
+        # a worker thread, the others find the new tokens once it's done
+        async with self.__refresh_lock:
+            await asyncio.to_thread(self.ensure_tokens)
+
+    async def __get_resource(self, path, event):
+        query = Query(self, path, event, self.async_transport.decode)
+        if query.fresh:
+            return query.read_cached("cache")
+
+        if self.tokens_expiring():
+            await self.__ensure_tokens()
+        try:
+            response = await self.__send(query, event)
+        except CircuitOpenError:
+            if not query.cached:
+                raise
+            return query.read_cached("stale")
+        return query.read(response)
+
+    async def __send(self, query, event):
+        while True:
+            headers = query.headers()
+            with query.sending():
+                event.throttle_time += await self.rate_limiter.acquire_async()
+                event.attempts += 1
+                with event.timing("network"):
+                    response = await self.async_transport.get(
+                        query.url, params=PARAMS, headers=headers
+                    )
+
+            step = query.answered(response)
+            if step == REFRESH:
+                async with self.__refresh_lock:
+                    await asyncio.to_thread(self.refresh_tokens, query.expires_by)
+            elif step == RETRY:
+                await asyncio.sleep(query.delay)
+            elif step is None:
+                return response
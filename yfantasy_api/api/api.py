@@ -1,12 +1,19 @@
-import sys
+import threading
 import time
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
 
 from yfantasy_api.api.auth import AuthenticationService
+from yfantasy_api.api.cache import model_kind
+from yfantasy_api.api.coalesce import SingleFlight
+from yfantasy_api.api.errors import CircuitOpenError
 from yfantasy_api.api.game import GameApi, GamesApi
-from yfantasy_api.api.league import LeagueApi
-from yfantasy_api.api.team import TeamApi
+from yfantasy_api.api.instrumentation import RequestEvent, notify
+from yfantasy_api.api.league import LeagueApi, LeaguesApi
+from yfantasy_api.api.query import PARAMS, REFRESH, RETRY, Query
+from yfantasy_api.api.retry import CircuitBreaker, RetryPolicy
+from yfantasy_api.api.team import TeamApi, TeamsApi
+from yfantasy_api.api.throttle import RateLimiter
+from yfantasy_api.api.transport import Transport
 from yfantasy_api.api.user import UserApi
 
 
@@ -18,7 +25,9 @@ class YahooFantasyApi:
 
     Prior to each call to Yahoo, this class checks the existing tokens to
     ensure they are not yet yet expired, if they are the tokens are quickly
-    refreshed without user input, otherwise the call proceeds.
+    refreshed without user input, otherwise the call proceeds. A client can
+    be shared by many threads: a single refresh is sent when they find the
+    tokens expiring at once, the other threads wait for its new tokens.
 
     Attributes
     ----------
@@ -28,27 +37,80 @@ class YahooFantasyApi:
         The user provided league_id
     game_id: str
         The user provided game_id
+    transport: Transport
+        The pooled transport used for sending every http request, shared
+        with the auth_service so token refreshes reuse the connections
     auth_service: AuthenticationService
         The authentication service object used for checken tokens are
-        still valid and refreshing tokens when needed
+        still valid and refreshing tokens when needed. The tokens are
+        kept in the provided `token_store`, see `yfantasy_api.api.tokens`,
+        otherwise in the `.tokens.json` file
     access_token: str
         The token used for authenticating requests to yahoo
     refresh_token: str
         The token used to refresh the access_token once its expired
     expires_by: float
         The timestamp indicating when the current access_token expires
-    __timout: int
-        The timeout that the client should wait before sending an http
-        request. Used to avoid errors caused by too many requests
+    cache: ResponseCache
+        An optional on-disk cache consulted before sending a request and
+        filled with the responses its policies allow caching
+    model_cache: ModelCache
+        An optional in-memory cache of the models built for each path,
+        consulted before the response cache and the network. Its models
+        are shared by every caller and must not be modified
+    rate_limiter: RateLimiter
+        The token bucket every http request waits on before being sent.
+        Used to avoid errors caused by too many requests; when no limiter
+        is provided one is built from the `timeout`, allowing one request
+        every `timeout` seconds
+    retry_policy: RetryPolicy
+        How often, and after how long a wait, a query Yahoo failed with
+        a 5xx status is sent again
+    circuit_breaker: CircuitBreaker
+        Stops sending queries while Yahoo keeps failing them, the queries
+        then raise a `CircuitOpenError` unless a cached response is kept
+    single_flight: SingleFlight
+        Coalesces the concurrent queries of the same path, so that they
+        share a single request to Yahoo and the model built from it
+    instruments: list
+        The instruments observing every query sent to Yahoo, such as a
+        `MetricsCollector`, see `yfantasy_api.api.instrumentation`
+
+    Every failed query raises a subclass of `YahooFantasyError`, see
+    `yfantasy_api.api.errors`. A query rejected with a 401 status is sent
+    once more after refreshing the tokens.
     """
 
     base_url = "https://fantasysports.yahooapis.com/fantasy/v2"
+    rate_limit_retries = 3
 
-    def __init__(self, league_id, game_id, timeout=1):
+    def __init__(
+        self,
+        league_id,
+        game_id,
+        timeout=1,
+        transport=None,
+        rate_limiter=None,
+        cache=None,
+        model_cache=None,
+        token_store=None,
+        retry_policy=None,
+        circuit_breaker=None,
+        single_flight=None,
+        instruments=None,
+    ):
         self.league_id = league_id
         self.game_id = game_id
-        self.auth_service = AuthenticationService()
-        self.__timeout = timeout
+        self.transport = transport or Transport()
+        self.auth_service = AuthenticationService(self.transport, token_store)
+        self.rate_limiter = rate_limiter or RateLimiter.from_timeout(timeout)
+        self.cache = cache
+        self.model_cache = model_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.single_flight = single_flight or SingleFlight()
+        self.instruments = list(instruments or [])
+        self.__refresh_lock = threading.Lock()
         self.__set_tokens()
 
     def game(self):
@@ -75,6 +137,21 @@ class YahooFantasyApi:
         """
         return LeagueApi(self)
 
+    def leagues(self, league_keys):
+        """Build a query for the league collection
+
+        Returns a LeaguesApi object that provides methods for including
+        the same sub-resources as the League resource for many leagues
+        at once
+
+        Parameters
+        ----------
+        league_keys: list
+            The league keys (<game-code>.l.<league-id>) used to scope the
+            resulting queries, the leagues can belong to different games
+        """
+        return LeaguesApi(self, league_keys)
+
     def team(self, team_id):
         """Build a query for a team resource
 
@@ -88,6 +165,20 @@ class YahooFantasyApi:
         """
         return TeamApi(self, team_id)
 
+    def teams(self, team_ids):
+        """Build a query for the team collection
+
+        Returns a TeamsApi object that provides methods for including
+        the same sub-resources as the Team resource for many teams at
+        once
+
+        Parameters
+        ----------
+        team_ids: list
+            The team_ids used to scope the resulting queries
+        """
+        return TeamsApi(self, team_ids)
+
     def user(self):
         """Build a query for a user resource
 
@@ -96,37 +187,160 @@ class YahooFantasyApi:
         """
         return UserApi(self)
 
-    def get(self, path):
+    def get(self, path, model=None):
         """Invoke the query built by the api object calling this method
 
         Parameters
         ----------
         path: str
             The path built by the api object calling this method
+        model
+            A callable used to transform the `fantasy_content` json into
+            a model; if nothing is provided the json is returned as is
+        """
+        kind = model_kind(model)
+        if model and self.model_cache:
+            cached = self.model_cache.get(path, kind)
+            if cached is not None:
+                return cached
+
+        # Like the model cache, only queries building the same model share it
+        key = (path, kind)
+        return self.single_flight.do(key, lambda: self.__get(path, model))
+
+    def __get(self, path, model):
+        event = RequestEvent(path)
+        notify(self.instruments, "before_request", event)
+        try:
+            content, size = self.__get_resource(path, event)
+            if not model:
+                return content
+
+            with event.timing("model"):
+                built = model(content)
+            if self.model_cache:
+                self.model_cache.put(path, built, size, model_kind(model))
+            return built
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.finish()
+            notify(self.instruments, "after_request", event)
+
+    def get_batches(self, paths, model, max_workers=1):
+        """Invoke one query per path and concatenate the resulting models
+
+        Parameters
+        ----------
+        paths: list
+            The paths built by the collection api calling this method
+        model
+            A callable used to transform each `fantasy_content` json into
+            a list of models
+        max_workers: int
+            The number of queries sent concurrently from a pool of worker
+            threads, all of them still going through the shared rate
+            limiter. The models keep the order of the paths. (default: 1)
         """
-        return self.__get_resource(path)
+        if max_workers == 1:
+            return [item for path in paths for item in self.get(path, model)]
 
-    def __get_resource(self, path):
-        self.__check_tokens()
-        params = {"format": "json"}
-        headers = {"Authorization": "Bearer {}".format(self.access_token)}
-        url = "{}/{}".format(self.base_url, path)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            batches = executor.map(lambda path: self.get(path, model), paths)
+            return [item for batch in batches for item in batch]
 
-        time.sleep(self.__timeout)
+    def invalidate(self, key):
+        """Drop every cached response and model whose path contains the key
 
-        response = requests.get(url, params=params, headers=headers)
-        if response.status_code == 200:
-            return response.json()["fantasy_content"]
-        else:
-            print(response.status_code, response.text)
-            sys.exit()
+        Parameters
+        ----------
+        key: str
+            A league key (<game-code>.l.<league-id>) or team key
+            (<game-code>.l.<league-id>.t.<team-id>) that changed
+        """
+        if self.cache:
+            self.cache.invalidate(key)
+        if self.model_cache:
+            self.model_cache.invalidate(key)
+
+    def tokens_expiring(self):
+        """Check whether the access token expires within the next five minutes"""
+        return time.time() > self.expires_by - 300
+
+    def refresh_tokens(self, expires_by=None):
+        """Refresh the tokens through the auth service and store the new ones
+
+        Returns whether this call refreshed the tokens, rather than keeping
+        those refreshed by another caller.
+
+        Parameters
+        ----------
+        expires_by: float
+            The expiry of the tokens the caller wants to replace, if the
+            tokens were refreshed by another caller in the meantime they
+            are kept as is. If nothing is provided the tokens are always
+            refreshed.
+        """
+        with self.__refresh_lock:
+            if expires_by is not None and expires_by != self.expires_by:
+                return False
+            self.auth_service.refresh_tokens()
+            self.__set_tokens()
+            return True
+
+    def ensure_tokens(self):
+        """Refresh the tokens if they are expiring, one refresh at a time
+
+        The first caller to find the tokens expiring refreshes them, any
+        caller arriving during that refresh waits for it to complete and
+        then uses the new tokens instead of sending its own refresh.
+        """
+        if not self.tokens_expiring():
+            return
+        with self.__refresh_lock:
+            if self.tokens_expiring():
+                self.auth_service.refresh_tokens()
+                self.__set_tokens()
+
+    def __get_resource(self, path, event):
+        query = Query(self, path, event, self.transport.decode)
+        if query.fresh:
+            return query.read_cached("cache")
+
+        self.ensure_tokens()
+        try:
+            response = self.__send(query, event)
+        except CircuitOpenError:
+            if not query.cached:
+                raise
+            return query.read_cached("stale")
+        return query.read(response)
+
+    def __send(self, query, event):
+        # Sends the query until Yahoo answers it, the query decides which
+        # responses are retried and when the tokens are refreshed
+        while True:
+            headers = query.headers()
+            with query.sending():
+                event.throttle_time += self.rate_limiter.acquire()
+                event.attempts += 1
+                with event.timing("network"):
+                    response = self.transport.get(
+                        query.url, params=PARAMS, headers=headers
+                    )
+
+            step = query.answered(response)
+            if step == REFRESH:
+                self.refresh_tokens(query.expires_by)
+            elif step == RETRY:
+                self.retry_policy.sleep(query.delay)
+            elif step is None:
+                return response
 
     def __set_tokens(self):
+        # The expiry is stored last, so that a thread seeing fresh tokens
+        # through `tokens_expiring()` never reads the old access token
         self.access_token = self.auth_service.get_access_token()
         self.refresh_token = self.auth_service.get_refresh_token()
         self.expires_by = self.auth_service.get_expires_by()
-
-    def __check_tokens(self):
-        if time.time() > self.expires_by - 300:
-            self.auth_service.refresh_tokens()
-            self.__set_tokens()
@@ -1,13 +1,15 @@
-import json
 import os
 import time
 
-import requests
+from yfantasy_api.api.tokens import (
+    ACCESS_TOKEN,
+    EXPIRES_BY,
+    REFRESH_TOKEN,
+    FileTokenStore,
+)
+from yfantasy_api.api.transport import Transport
 
-ACCESS_TOKEN = "access_token"
-EXPIRES_BY = "expires_by"
 EXPIRES_IN = "expires_in"
-REFRESH_TOKEN = "refresh_token"
 TOKEN_FILE = ".tokens.json"
 
 AUTHORIZE_URL = "https://api.login.yahoo.com/oauth2/request_auth"
@@ -21,10 +23,14 @@ class AuthenticationService:
     This service has two main ways to authenticate a user with Yahoo.
     If the user hasn't used this library before the service obtains a new set
     of oauth tokens from Yahoo via the `__client_id` and `__client_secret`.
-    If the user has used this library before and a `.tokens.json` file exists
-    the `__access_token` is read in from that file and checked for expiry. If
-    the token has already expired this service will refresh the token, otherwise
-    it is good to be used.
+    If the user has used this library before and the token store holds tokens,
+    by default a `.tokens.json` file, the `__access_token` is read in from that
+    store and checked for expiry. If the token has already expired this service
+    will refresh the token, otherwise it is good to be used.
+
+    Refreshes hold the lock of the token store; when another service sharing
+    the store, possibly in another process, has refreshed the tokens in the
+    meantime its tokens are used instead of sending a new refresh.
 
     Attribute
     ----------
@@ -38,37 +44,65 @@ class AuthenticationService:
         The current refresh token used for refreshing the access token
     __expires_by: float
         The expiry of the current access token, used to determine when to refresh
+    __transport: Transport
+        The pooled transport used to send requests to the Yahoo login api
+    __store: TokenStore
+        The store the tokens are loaded from and saved to
+    __interactive: bool
+        Whether the user is prompted for an authorization code when the
+        store holds no tokens
     """
 
-    def __init__(self):
+    def __init__(self, transport=None, store=None, interactive=None):
         """Initialize a new AuthenticationService
 
         The initialization consists of reading in the client id and secret
-        from their respective env variables, loading existing tokens or
-        retrieving new tokens, and finally caching the tokens into the
-        `.tokens.json` file.
+        from their respective env variables, then loading the existing tokens
+        from the store or retrieving new tokens and saving them to the store.
+
+        Parameters
+        ----------
+        transport: Transport
+            The transport used to send requests to the Yahoo login api,
+            if nothing is provided a new Transport is created
+        store: TokenStore
+            The store the tokens are loaded from and saved to, if nothing
+            is provided the tokens are kept in the `.tokens.json` file
+        interactive: bool
+            Whether the user is prompted for an authorization code when
+            the store holds no tokens, otherwise an exception is raised.
+            By default the user is only prompted when no store is provided.
         """
+        self.__transport = transport or Transport()
+        self.__store = store or FileTokenStore(TOKEN_FILE)
+        self.__interactive = store is None if interactive is None else interactive
         self.__set_credentials()
         self.__set_tokens()
-        self.__cache_tokens()
 
     def refresh_tokens(self):
         """Retrieve a new access token using the refresh token.
 
         When this method is called a new request is built to obtain
         a new set of oauth tokens from Yahoo by providing the
-        `__client_id`, `__client_secret`, and `__refresh_token`.
+        `__client_id`, `__client_secret`, and `__refresh_token`, unless
+        the store already holds tokens newer than the current ones.
         """
-        data = {
-            "client_id": self.__client_id,
-            "client_secret": self.__client_secret,
-            "redirect_uri": "oob",
-            "refresh_token": self.__refresh_token,
-            "grant_type": "refresh_token",
-        }
-
-        tokens = requests.post(TOKEN_URL, data=data).json()
-        self.__cache_refreshed_tokens(tokens)
+        with self.__store.lock():
+            stored = self.__store.load()
+            if stored and stored[EXPIRES_BY] > self.__expires_by:
+                self.__use_tokens(stored)
+                return
+
+            data = {
+                "client_id": self.__client_id,
+                "client_secret": self.__client_secret,
+                "redirect_uri": "oob",
+                "refresh_token": self.__refresh_token,
+                "grant_type": "refresh_token",
+            }
+
+            tokens = self.__transport.post(TOKEN_URL, data=data).json()
+            self.__cache_refreshed_tokens(tokens)
 
     def get_access_token(self):
         """A simple getter for obtaining the access token."""
@@ -87,17 +121,22 @@ class AuthenticationService:
         self.__client_secret = os.getenv("CLIENT_SECRET")
 
     def __set_tokens(self):
-        if os.path.exists(TOKEN_FILE):
-            self.__load_tokens()
-        else:
+        stored = self.__store.load()
+        if stored:
+            self.__use_tokens(stored)
+        elif self.__interactive:
             self.__get_tokens()
+            self.__cache_tokens()
+        else:
+            raise Exception(
+                "The token store holds no tokens, authorize the application "
+                "once interactively or provide a refresh token."
+            )
 
-    def __load_tokens(self):
-        with open(TOKEN_FILE, "r") as f:
-            loaded_tokens = json.loads(f.read())
-        self.__access_token = loaded_tokens[ACCESS_TOKEN]
-        self.__refresh_token = loaded_tokens[REFRESH_TOKEN]
-        self.__expires_by = loaded_tokens[EXPIRES_BY]
+    def __use_tokens(self, tokens):
+        self.__access_token = tokens[ACCESS_TOKEN]
+        self.__refresh_token = tokens[REFRESH_TOKEN]
+        self.__expires_by = tokens[EXPIRES_BY]
 
     def __get_tokens(self):
         code = self.__get_auth_code()
@@ -118,7 +157,7 @@ class AuthenticationService:
 
         headers = {"Content-Type": "application/json"}
 
-        response = requests.post(AUTHORIZE_URL, params=params, headers=headers)
+        response = self.__transport.post(AUTHORIZE_URL, params=params, headers=headers)
         print(response.url)
 
         return input("Enter code: ")
@@ -132,7 +171,7 @@ class AuthenticationService:
             "grant_type": "authorization_code",
         }
 
-        return requests.post(TOKEN_URL, data=data).json()
+        return self.__transport.post(TOKEN_URL, data=data).json()
 
     def __cache_tokens(self):
         tokens = {
@@ -141,8 +180,7 @@ class AuthenticationService:
             EXPIRES_BY: self.__expires_by,
         }
 
-        with open(TOKEN_FILE, "w+") as f:
-            f.write(json.dumps(tokens))
+        self.__store.save(tokens)
 
     def __cache_refreshed_tokens(self, tokens):
         self.__access_token = tokens[ACCESS_TOKEN]
@@ -0,0 +1,450 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+FOREVER = None
+
+
+def draft_results_ttl(content):
+    """Cache draft results forever once the draft is over"""
+    league = content["league"][0]
+    return FOREVER if league.get("draft_status") == "postdraft" else MINUTE
+
+
+def scoreboard_ttl(content):
+    """Cache the scoreboard of a week forever once every matchup is over"""
+    matchups = content["league"][1]["scoreboard"]["0"]["matchups"]
+    statuses = [
+        matchups[str(m)]["matchup"].get("status") for m in range(matchups["count"])
+    ]
+    return FOREVER if all(s == "postevent" for s in statuses) else 5 * MINUTE
+
+
+def contains_key(path, key):
+    """Check whether a path contains the whole key, not only a prefix of another
+
+    The key must start a segment or follow another key, and be followed by
+    the end of a segment, a filter or another key: `nhl.l.1` is in
+    `team/nhl.l.1.t.2/roster` and in `league/nhl.l.1;out=settings`, but
+    neither in `league/nhl.l.12/standings` nor in `league/xnhl.l.1`.
+    """
+    pattern = r"(?<![^/=,])" + re.escape(key) + r"(?=[/;,.]|$)"
+    return re.search(pattern, path) is not None
+
+
+def model_kind(model):
+    """Identify what a model callable builds, `None` for the json as is
+
+    The apis pass a new lambda, or bound method, with every query; their
+    code identifies the model they build whichever instance they belong to.
+    """
+    return getattr(model, "__code__", model)
+
+
+DEFAULT_POLICIES = [
+    (r"^game/[^/]+/(game_weeks|position_types|roster_positions|stat_categories)$", DAY),
+    (r"/settings$", HOUR),
+    (r"^league/[^/]+/draftresults", draft_results_ttl),
+    # Without a week the scoreboard follows the current one, it never settles
+    (r"^league/[^/]+/scoreboard;week=\d+", scoreboard_ttl),
+    # The collections answer in another shape, they are kept like live ones
+    (r"/draftresults", MINUTE),
+    (r"/scoreboard", 5 * MINUTE),
+    (r"/standings$", 5 * MINUTE),
+    (r"/matchups", 5 * MINUTE),
+]
+
+
+class CachedResponse:
+    """A response body stored by the ResponseCache
+
+    Attributes
+    ----------
+    path: str
+        The path the response was requested for
+    body: bytes
+        The raw json body of the response
+    expires: float
+        The timestamp the response stops being fresh, `None` means never
+    etag: str
+        The `ETag` header of the response, if any
+    last_modified: str
+        The `Last-Modified` header of the response, if any
+    fresh: bool
+        Whether the response could be used without asking Yahoo at the
+        time it was looked up
+    """
+
+    def __init__(self, path, body, expires, etag=None, last_modified=None):
+        self.path = path
+        self.body = body
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fresh = False
+
+    def __repr__(self):
+        return str(self.__dict__)  # pragma: no cover
+
+    def content(self, decode=json.loads):
+        """Decode the stored body into the `fantasy_content` json"""
+        return decode(self.body)["fantasy_content"]
+
+    def validators(self):
+        """Build the headers used to revalidate a stale response"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Response Cache: A size-bounded on-disk cache of Yahoo responses
+
+    Responses are keyed by the full path built by the `*Api` builders and
+    kept for the TTL of the first policy whose pattern matches the path.
+    A TTL is either a number of seconds, `FOREVER`, or a callable that
+    takes the `fantasy_content` json and returns one of those, which is
+    how completed scoreboards and finished drafts are kept indefinitely.
+
+    Stale responses that carry an `ETag` or `Last-Modified` header are
+    kept around so that they can be revalidated with a conditional GET.
+    Once the cache grows past `max_bytes` the least recently used
+    responses are evicted.
+
+    Attributes
+    ----------
+    directory: str
+        The directory the responses are stored in
+    max_bytes: int
+        The maximum total size of the stored response bodies
+    policies: list
+        A list of `(pattern, ttl)` tuples matched against each path
+    hits: int
+        The number of lookups answered with a fresh response
+    misses: int
+        The number of lookups that had to go to Yahoo
+    revalidations: int
+        The number of stale responses confirmed unchanged by Yahoo
+    evictions: int
+        The number of responses evicted to stay within `max_bytes`
+    """
+
+    def __init__(
+        self,
+        directory=".yfantasy_cache",
+        max_bytes=100 * 1024 * 1024,
+        policies=DEFAULT_POLICIES,
+        clock=time.time,
+    ):
+        """Initialize a new ResponseCache
+
+        Responses already stored in the directory are picked up, from
+        the least to the most recently used.
+
+        Parameters
+        ----------
+        directory: str
+            The directory to store the responses in, it is created if it
+            doesn't exist yet. (default: .yfantasy_cache)
+        max_bytes: int
+            The maximum total size of the stored response bodies.
+            (default: 100 MB)
+        policies: list
+            A list of `(pattern, ttl)` tuples, the first pattern found in
+            a path decides the TTL of its response; paths that match no
+            pattern are never served from the cache. (default: DEFAULT_POLICIES)
+        clock
+            The wall clock used to expire responses
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.policies = [(re.compile(p), ttl) for p, ttl in policies]
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.__clock = clock
+        self.__lock = threading.RLock()
+        self.__sizes = OrderedDict()
+        self.__bytes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        files = [
+            os.path.join(directory, f)
+            for f in os.listdir(directory)
+            if not f.endswith(".tmp")
+        ]
+        for file in sorted(files, key=os.path.getmtime):
+            self.__sizes[os.path.basename(file)] = os.path.getsize(file)
+            self.__bytes += self.__sizes[os.path.basename(file)]
+
+    def get(self, path):
+        """Look up the stored response for a path
+
+        Returns a CachedResponse, fresh or stale, or `None` when nothing
+        is stored. Only fresh responses count as a hit.
+        """
+        with self.__lock:
+            cached = self.__read(path)
+            if cached:
+                now = self.__clock()
+                cached.fresh = cached.expires is None or now < cached.expires
+            if cached and cached.fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return cached
+
+    def put(self, path, body, headers, content):
+        """Store a response if the policies allow caching it
+
+        Parameters
+        ----------
+        path: str
+            The path the response was requested for
+        body: bytes
+            The raw json body of the response
+        headers: dict
+            The headers of the response, used for the validators
+        content: dict
+            The decoded `fantasy_content` json, passed to callable TTLs
+        """
+        ttl = self.ttl(path, content)
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if ttl == 0 and not (etag or last_modified):
+            return
+
+        expires = None if ttl is FOREVER else self.__clock() + ttl
+        cached = CachedResponse(path, body, expires, etag, last_modified)
+        with self.__lock:
+            self.__write(cached)
+
+    def revalidated(self, cached, content):
+        """Renew a stale response after Yahoo answered `304 Not Modified`"""
+        ttl = self.ttl(cached.path, content)
+        cached.expires = None if ttl is FOREVER else self.__clock() + ttl
+        with self.__lock:
+            self.revalidations += 1
+            self.__write(cached)
+
+    def ttl(self, path, content):
+        """Find the TTL of a response using the first matching policy"""
+        for pattern, ttl in self.policies:
+            if pattern.search(path):
+                return ttl(content) if callable(ttl) else ttl
+        return 0
+
+    def invalidate(self, key):
+        """Remove every stored response whose path contains the given key"""
+        with self.__lock:
+            for name in list(self.__sizes):
+                cached = self.__load(name)
+                if cached is None or contains_key(cached.path, key):
+                    self.__remove(name)
+
+    def stats(self):
+        """Return a snapshot of the cache statistics as a dict"""
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "entries": len(self.__sizes),
+                "bytes": self.__bytes,
+            }
+
+    def __name(self, path):
+        return hashlib.sha1(path.encode()).hexdigest()
+
+    def __read(self, path):
+        name = self.__name(path)
+        if name not in self.__sizes:
+            return None
+        cached = self.__load(name)
+        if cached is None:
+            self.__remove(name)
+            return None
+        self.__sizes.move_to_end(name)
+        os.utime(os.path.join(self.directory, name))
+        return cached
+
+    def __load(self, name):
+        try:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                meta, body = f.read().split(b"\n", 1)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(body=body, **json.loads(meta))
+
+    def __write(self, cached):
+        name = self.__name(cached.path)
+        meta = {
+            "path": cached.path,
+            "expires": cached.expires,
+            "etag": cached.etag,
+            "last_modified": cached.last_modified,
+        }
+        data = json.dumps(meta).encode() + b"\n" + cached.body
+
+        file = os.path.join(self.directory, name)
+        with open(f"{file}.tmp", "wb") as f:
+            f.write(data)
+        os.replace(f"{file}.tmp", file)
+
+        self.__bytes += len(data) - self.__sizes.get(name, 0)
+        self.__sizes[name] = len(data)
+        self.__sizes.move_to_end(name)
+        while self.__bytes > self.max_bytes and len(self.__sizes) > 1:
+            self.__remove(next(iter(self.__sizes)))
+            self.evictions += 1
+
+    def __remove(self, name):
+        self.__bytes -= self.__sizes.pop(name)
+        file = os.path.join(self.directory, name)
+        if os.path.exists(file):
+            os.remove(file)
+
+
+class ModelCache:
+    """Model Cache: An in-memory cache of the models built for each path
+
+    Where the ResponseCache saves round trips, this cache saves parsing
+    the same payload into `League`, `Team`, `Game` or `User` models over
+    and over. On a hit the very same instance is returned to every
+    caller. The models are not frozen: their sub-resources are filled in
+    on first read, and copying them on every hit would cost about as much
+    as parsing the payload again. Cached models are thus shared as is and
+    must not be modified, copy one (`copy.deepcopy`) before changing it.
+
+    Models are cached per path and kind, see `model_kind()`, since the
+    same response can be built into different models. The size of a model
+    is approximated by the size of the response body it was built from;
+    once the total exceeds `max_bytes` the least recently used models are
+    evicted.
+
+    Attributes
+    ----------
+    ttl: float
+        The seconds a model is kept, `FOREVER` means until evicted
+    max_bytes: int
+        The memory budget, approximated by the response body sizes
+    hits: int
+        The number of lookups answered with a cached model
+    misses: int
+        The number of lookups that had to build a new model
+    evictions: int
+        The number of models evicted to stay within `max_bytes`
+    """
+
+    def __init__(
+        self, ttl=5 * MINUTE, max_bytes=64 * 1024 * 1024, clock=time.monotonic
+    ):
+        """Initialize a new ModelCache
+
+        Parameters
+        ----------
+        ttl: float
+            The seconds a model is kept, `FOREVER` keeps models until
+            they are evicted or invalidated. (default: 300)
+        max_bytes: int
+            The memory budget, approximated by the size of the response
+            bodies the models were built from. (default: 64 MB)
+        clock
+            The monotonic clock used to expire models
+        """
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__bytes = 0
+
+    def get(self, path, kind=None):
+        """Return the model of a kind cached for a path, or `None` if there is none
+
+        Parameters
+        ----------
+        path: str
+            The path the model was requested for
+        kind
+            The kind of model, see `model_kind()`; the same path can be
+            built into different models. (default: None)
+        """
+        key = (path, kind)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry and entry[1] is not None and self.__clock() >= entry[1]:
+                self.__remove(key)
+                entry = None
+            if entry:
+                self.hits += 1
+                self.__entries.move_to_end(key)
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def put(self, path, model, size, kind=None):
+        """Cache the model built for a path
+
+        Parameters
+        ----------
+        path: str
+            The path the model was requested for
+        model
+            The model built from the response
+        size: int
+            The approximate size of the model in bytes
+        kind
+            The kind of model, see `model_kind()`. (default: None)
+        """
+        key = (path, kind)
+        expires = None if self.ttl is FOREVER else self.__clock() + self.ttl
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = (model, expires, size)
+            self.__bytes += size
+            while self.__bytes > self.max_bytes and len(self.__entries) > 1:
+                self.__remove(next(iter(self.__entries)))
+                self.evictions += 1
+
+    def invalidate(self, key):
+        """Remove every model whose path contains the given league or team key"""
+        with self.__lock:
+            for entry in [e for e in self.__entries if contains_key(e[0], key)]:
+                self.__remove(entry)
+
+    def clear(self):
+        """Remove every cached model"""
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def stats(self):
+        """Return a snapshot of the cache statistics as a dict"""
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.__entries),
+                "bytes": self.__bytes,
+            }
+
+    def __remove(self, key):
+        self.__bytes -= self.__entries.pop(key)[2]
@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Single Flight: Shares one call between the callers asking for the same key
+
+    The first caller of a key runs the call, every caller asking for the
+    same key while it's in flight waits for it and receives the same
+    result, or the same error. Once the call completes the key is
+    forgotten, so the next caller runs a new call.
+
+    Threads and asyncio tasks are coalesced separately: `do()` shares a
+    call between threads and `do_async()` between the tasks of a loop.
+
+    Attributes
+    ----------
+    calls: int
+        The number of calls run
+    coalesced: int
+        The number of callers that waited for a call run by another one
+    """
+
+    def __init__(self):
+        """Initialize a new SingleFlight"""
+        self.calls = 0
+        self.coalesced = 0
+        self.__lock = threading.Lock()
+        self.__futures = {}
+        self.__tasks = {}
+
+    def do(self, key, function):
+        """Run the function, unless another thread is already running it for the key
+
+        Parameters
+        ----------
+        key
+            The hashable key identifying the call
+        function
+            A callable without arguments running the call
+        """
+        with self.__lock:
+            future = self.__futures.get(key)
+            if future is None:
+                future = self.__futures[key] = Future()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__futures[key]
+
+    async def do_async(self, key, function):
+        """Await the coroutine, unless another task is already awaiting it for the key
+
+        The coroutine runs in its own task, so that cancelling one of the
+        callers doesn't cancel it for the others; it's only cancelled
+        along with the last caller still waiting for it.
+
+        Parameters
+        ----------
+        key
+            The hashable key identifying the call
+        function
+            A callable without arguments returning the coroutine to await
+        """
+        key = (asyncio.get_running_loop(), key)
+        waiting = self.__tasks.get(key)
+        if waiting is None:
+            task = asyncio.ensure_future(function())
+            waiting = self.__tasks[key] = [task, 0]
+            task.add_done_callback(lambda _: self.__tasks.pop(key))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+
+        task = waiting[0]
+        waiting[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if waiting[1] == 1:
+                task.cancel()
+            raise
+        finally:
+            waiting[1] -= 1
+
+    def metrics(self):
+        """Return a snapshot of the coalescing metrics as a dict"""
+        with self.__lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
@@ -0,0 +1,88 @@
+from yfantasy_api.api.throttle import RATE_LIMITED_STATUSES, retry_after
+
+
+class YahooFantasyError(Exception):
+    """Yahoo Fantasy Error: Raised when Yahoo doesn't answer a query
+
+    Every error raised for a failed query is a subclass of this one, so
+    that a worker can catch it and move on to its next query.
+
+    Attributes
+    ----------
+    status_code: int
+        The http status of the response, `None` when there was none
+    url: str
+        The url of the query
+    text: str
+        The body of the response
+    """
+
+    def __init__(self, message, status_code=None, url=None, text=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.url = url
+        self.text = text
+
+
+class AuthenticationError(YahooFantasyError):
+    """Raised when Yahoo rejects the tokens, even after refreshing them"""
+
+
+class NotFoundError(YahooFantasyError):
+    """Raised when the queried resource doesn't exist"""
+
+
+class RateLimitError(YahooFantasyError):
+    """Raised when Yahoo keeps rate limiting the query
+
+    Attributes
+    ----------
+    retry_after: float
+        The seconds Yahoo asked to wait, `None` when it didn't say
+    """
+
+    def __init__(self, message, retry_after=None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_after = retry_after
+
+
+class ServerError(YahooFantasyError):
+    """Raised when Yahoo keeps failing the query with a 5xx status"""
+
+
+class CircuitOpenError(YahooFantasyError):
+    """Raised without sending the query while Yahoo is considered down
+
+    Attributes
+    ----------
+    retry_in: float
+        The seconds before the next query is let through to Yahoo
+    """
+
+    def __init__(self, message, retry_in=0.0, **kwargs):
+        super().__init__(message, **kwargs)
+        self.retry_in = retry_in
+
+
+def error_for(response):
+    """Build the error matching the status of a failed response
+
+    Parameters
+    ----------
+    response
+        The `requests` or `httpx` response Yahoo answered with
+    """
+    status_code = response.status_code
+    kwargs = {"status_code": status_code, "url": str(response.url)}
+    kwargs["text"] = response.text
+    message = f"Yahoo responded with {status_code}: {response.text}"
+
+    if status_code in [401, 403]:
+        return AuthenticationError(message, **kwargs)
+    elif status_code == 404:
+        return NotFoundError(message, **kwargs)
+    elif status_code in RATE_LIMITED_STATUSES:
+        return RateLimitError(message, retry_after(response), **kwargs)
+    elif status_code >= 500:
+        return ServerError(message, **kwargs)
+    return YahooFantasyError(message, **kwargs)
@@ -1,3 +1,4 @@
+from yfantasy_api.api.league import PlayerKeysApi
 from yfantasy_api.api.terminal import TerminalApi
 from yfantasy_api.models import Game
 
@@ -57,7 +58,10 @@ class GamesApi:
             seasons = ",".join(map(str, seasons))
             self.path += f";seasons={seasons}"
 
-        games = self.__yfantasy_api.get(f"{self.__url}{self.path}")["games"]
+        return self.__yfantasy_api.get(f"{self.__url}{self.path}", self.__parse_games)
+
+    def __parse_games(self, json):
+        games = json["games"]
         return [Game(games[str(d)]["game"]) for d in range(games["count"])]
 
 
@@ -98,6 +102,27 @@ class GameApi:
         self.path += "/game_weeks"
         return TerminalApi(self)
 
+    def players(self, player_keys):
+        """Updates the path to include the `players` sub-resource
+
+        Returns a PlayerKeysApi object that provides methods for adding
+        further sub-resources or invoking the query
+
+        Parameters
+        ----------
+        player_keys: list
+            The keys of the players to return, in the format
+            <game-code>.p.<player-id>. Any number of keys can be
+            provided, they are requested in concurrent batches and the
+            players are returned in the same order.
+        """
+        return PlayerKeysApi(
+            self.__yfantasy_api,
+            f"{self.__url}{self.path}",
+            player_keys,
+            lambda json: Game(json["game"]).players,
+        )
+
     def position_types(self):
         """Updates the path to include the `position_types` sub-resource
 
@@ -130,4 +155,6 @@ class GameApi:
 
         The response json is transformed into a Game model
         """
-        return Game(self.__yfantasy_api.get(f"{self.__url}{self.path}")["game"])
+        return self.__yfantasy_api.get(
+            f"{self.__url}{self.path}", lambda json: Game(json["game"])
+        )
@@ -0,0 +1,430 @@
+import contextlib
+import logging
+import threading
+import time
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None
+
+# Resources whose second path segment is the key of the queried resource
+KEYED_RESOURCES = ["game", "league", "player", "team", "transaction"]
+PHASES = ["throttle", "network", "decode", "model"]
+DURATION_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+logger = logging.getLogger(__name__)
+
+
+def resource_type(path):
+    """Build the type of the resource queried by a path, without keys or params
+
+    For example `league/nhl.l.123/players;start=25/stats;type=week` is
+    a `league/players/stats` query.
+    """
+    segments = [segment.split(";")[0] for segment in path.split("/")]
+    if segments[0] in KEYED_RESOURCES:
+        del segments[1:2]
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """Request Event: Describes a query sent by the client to its instruments
+
+    An event is built for every query, except those answered by the model
+    cache or coalesced with an identical query already in flight. It's
+    passed to `before_request()` with only its path and resource, then to
+    `after_request()` once the query completed or failed.
+
+    Attributes
+    ----------
+    path: str
+        The path of the query
+    resource: str
+        The type of the queried resource, see `resource_type()`
+    status_code: int
+        The status of the last response, `None` when nothing was sent
+    bytes: int
+        The size of the response body
+    source: str
+        Where the response came from: 'network', 'revalidated' after a
+        `304 Not Modified`, 'cache' for a fresh cached response, or
+        'stale' for a cached response served while the circuit is open
+    attempts: int
+        The number of requests sent for the query, including retries
+    throttle_time: float
+        The seconds spent waiting on the rate limiter
+    network_time: float
+        The seconds spent sending requests and reading their responses
+    decode_time: float
+        The seconds spent decoding the json body
+    model_time: float
+        The seconds spent building the model from the json
+    duration: float
+        The total seconds spent on the query
+    error: Exception
+        The error raised by the query, `None` when it succeeded
+    """
+
+    def __init__(self, path):
+        """Initialize a new RequestEvent
+
+        Parameters
+        ----------
+        path: str
+            The path of the query
+        """
+        self.path = path
+        self.resource = resource_type(path)
+        self.status_code = None
+        self.bytes = 0
+        self.source = None
+        self.attempts = 0
+        self.throttle_time = 0.0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.model_time = 0.0
+        self.duration = 0.0
+        self.error = None
+        self.__started = time.perf_counter()
+
+    @contextlib.contextmanager
+    def timing(self, phase):
+        """Add the time spent in the block to the `<phase>_time` attribute"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            setattr(self, f"{phase}_time", getattr(self, f"{phase}_time") + elapsed)
+
+    def finish(self):
+        """Record the total time spent on the query"""
+        self.duration = time.perf_counter() - self.__started
+
+
+class Instrument:
+    """Instrument: Observes every query sent by a client
+
+    The hooks are called from the thread, or task, sending the query;
+    they must be thread safe when the client is shared by many threads.
+    An error raised by a hook is logged, it doesn't fail the query.
+    """
+
+    def before_request(self, event):
+        """Called before a query is sent
+
+        Parameters
+        ----------
+        event: RequestEvent
+            The event of the query, filled in once it completed
+        """
+
+    def after_request(self, event):
+        """Called once a query completed or failed
+
+        Parameters
+        ----------
+        event: RequestEvent
+            The event of the query
+        """
+
+
+def notify(instruments, hook, event):
+    """Call a hook of every instrument, a failing hook never fails the query
+
+    The errors raised by the hooks are logged and otherwise ignored, so
+    that the query keeps its own result or error.
+
+    Parameters
+    ----------
+    instruments: list
+        The instruments to notify
+    hook: str
+        The name of the hook, 'before_request' or 'after_request'
+    event: RequestEvent
+        The event passed to the hook
+    """
+    for instrument in instruments:
+        try:
+            getattr(instrument, hook)(event)
+        except Exception:
+            logger.exception(f"The {hook} hook of {instrument!r} failed")
+
+
+class CallbackInstrument(Instrument):
+    """Callback Instrument: Calls a pair of functions around every query"""
+
+    def __init__(self, before=None, after=None):
+        """Initialize a new CallbackInstrument
+
+        Parameters
+        ----------
+        before
+            A callable receiving the `RequestEvent` before a query is sent
+        after
+            A callable receiving the `RequestEvent` once a query completed
+        """
+        self.__before = before
+        self.__after = after
+
+    def before_request(self, event):
+        """Call the before callable"""
+        if self.__before:
+            self.__before(event)
+
+    def after_request(self, event):
+        """Call the after callable"""
+        if self.__after:
+            self.__after(event)
+
+
+def format_labels(names, values):
+    """Format the labels of a sample, escaping their values"""
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"'.replace("\n", "\\n"))
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    """Counter: A Prometheus-style counter, with one value per set of labels
+
+    Attributes
+    ----------
+    name: str
+        The name of the metric
+    documentation: str
+        The help text of the metric
+    labelnames: list
+        The names of the labels
+    """
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = list(labelnames)
+        self.__lock = threading.Lock()
+        self.__values = {}
+
+    def inc(self, labels=(), amount=1):
+        """Add the amount to the value of the labels"""
+        with self.__lock:
+            self.__values[labels] = self.__values.get(labels, 0) + amount
+
+    def value(self, *labels):
+        """Return the value of the labels"""
+        with self.__lock:
+            return self.__values.get(labels, 0)
+
+    def render(self):
+        """Render the counter in the Prometheus text format"""
+        lines = [f"# HELP {self.name} {self.documentation}"]
+        lines.append(f"# TYPE {self.name} counter")
+        with self.__lock:
+            for labels, value in sorted(self.__values.items()):
+                lines.append(
+                    f"{self.name}{format_labels(self.labelnames, labels)} {value}"
+                )
+        return "\n".join(lines)
+
+
+class Histogram:
+    """Histogram: A Prometheus-style histogram, with one series per set of labels
+
+    Attributes
+    ----------
+    name: str
+        The name of the metric
+    documentation: str
+        The help text of the metric
+    labelnames: list
+        The names of the labels
+    buckets: list
+        The sorted upper bounds of the buckets, without `+Inf`
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = list(labelnames)
+        self.buckets = sorted(buckets)
+        self.__lock = threading.Lock()
+        self.__series = {}
+
+    def observe(self, labels, value):
+        """Count a value in the series of the labels"""
+        with self.__lock:
+            series = self.__series.get(labels)
+            if series is None:
+                series = self.__series[labels] = [[0] * len(self.buckets), 0, 0.0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            series[1] += 1
+            series[2] += value
+
+    def count(self, *labels):
+        """Return the number of values observed for the labels"""
+        with self.__lock:
+            return self.__series[labels][1] if labels in self.__series else 0
+
+    def sum(self, *labels):
+        """Return the sum of the values observed for the labels"""
+        with self.__lock:
+            return self.__series[labels][2] if labels in self.__series else 0.0
+
+    def render(self):
+        """Render the histogram in the Prometheus text format"""
+        lines = [f"# HELP {self.name} {self.documentation}"]
+        lines.append(f"# TYPE {self.name} histogram")
+        names = self.labelnames + ["le"]
+        with self.__lock:
+            for labels, (counts, count, total) in sorted(self.__series.items()):
+                for bound, bucket in zip(self.buckets, counts):
+                    le = format_labels(names, labels + (bound,))
+                    lines.append(f"{self.name}_bucket{le} {bucket}")
+                le = format_labels(names, labels + ("+Inf",))
+                lines.append(f"{self.name}_bucket{le} {count}")
+                series = format_labels(self.labelnames, labels)
+                lines.append(f"{self.name}_sum{series} {total}")
+                lines.append(f"{self.name}_count{series} {count}")
+        return "\n".join(lines)
+
+
+class MetricsCollector(Instrument):
+    """Metrics Collector: Counts the queries into Prometheus-style metrics
+
+    The metrics are labelled by resource type, so that their cardinality
+    stays bounded no matter how many leagues, teams or players are
+    queried. `render()` returns them in the Prometheus text format, ready
+    to be served from a `/metrics` endpoint.
+
+    Attributes
+    ----------
+    requests: Counter
+        The queries by resource, status and source
+    response_bytes: Counter
+        The bytes of the responses by resource
+    duration: Histogram
+        The total seconds of the queries by resource
+    phases: Histogram
+        The seconds spent in each phase of the queries by resource, the
+        phases are 'throttle', 'network', 'decode' and 'model'
+    """
+
+    def __init__(self, prefix="yfantasy", buckets=DURATION_BUCKETS):
+        """Initialize a new MetricsCollector
+
+        Parameters
+        ----------
+        prefix: str
+            The prefix of the metric names. (default: 'yfantasy')
+        buckets: list
+            The upper bounds of the histogram buckets in seconds.
+            (default: DURATION_BUCKETS)
+        """
+        self.requests = Counter(
+            f"{prefix}_requests_total",
+            "Queries sent to Yahoo fantasy",
+            ["resource", "status", "source"],
+        )
+        self.response_bytes = Counter(
+            f"{prefix}_response_bytes_total",
+            "Bytes of the responses",
+            ["resource"],
+        )
+        self.duration = Histogram(
+            f"{prefix}_request_duration_seconds",
+            "Total seconds spent on a query",
+            ["resource"],
+            buckets,
+        )
+        self.phases = Histogram(
+            f"{prefix}_request_phase_seconds",
+            "Seconds spent in each phase of a query",
+            ["resource", "phase"],
+            buckets,
+        )
+
+    def after_request(self, event):
+        """Count the query in every metric"""
+        status = "none" if event.status_code is None else str(event.status_code)
+        source = event.source or "error"
+        self.requests.inc((event.resource, status, source))
+        self.response_bytes.inc((event.resource,), event.bytes)
+        self.duration.observe((event.resource,), event.duration)
+        for phase in PHASES:
+            value = getattr(event, f"{phase}_time")
+            self.phases.observe((event.resource, phase), value)
+
+    def render(self):
+        """Render every metric in the Prometheus text format"""
+        metrics = [self.requests, self.response_bytes, self.duration, self.phases]
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+class OpenTelemetryInstrument(Instrument):
+    """OpenTelemetry Instrument: Traces every query as an OpenTelemetry span
+
+    The spans are named after the resource type and carry the attributes
+    of the `RequestEvent`. When the `opentelemetry-api` package isn't
+    installed, and no tracer is provided, this instrument does nothing.
+
+    Attributes
+    ----------
+    tracer: opentelemetry.trace.Tracer
+        The tracer starting the spans, `None` when tracing is disabled
+    """
+
+    def __init__(self, tracer=None):
+        """Initialize a new OpenTelemetryInstrument
+
+        Parameters
+        ----------
+        tracer: opentelemetry.trace.Tracer
+            The tracer starting the spans, if nothing is provided the
+            tracer of the global tracer provider is used
+        """
+        self.tracer = tracer or (trace and trace.get_tracer("yfantasy_api"))
+        self.__lock = threading.Lock()
+        self.__spans = {}
+
+    def before_request(self, event):
+        """Start the span of the query"""
+        if self.tracer is None:
+            return
+        span = self.tracer.start_span(
+            f"yfantasy {event.resource}",
+            attributes={
+                "yfantasy.path": event.path,
+                "yfantasy.resource": event.resource,
+            },
+        )
+        with self.__lock:
+            self.__spans[id(event)] = span
+
+    def after_request(self, event):
+        """Record the event on the span of the query and end it"""
+        with self.__lock:
+            span = self.__spans.pop(id(event), None)
+        if span is None:
+            return
+
+        attributes = {
+            "yfantasy.source": event.source or "error",
+            "yfantasy.attempts": event.attempts,
+            "http.response.body.size": event.bytes,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        for phase in PHASES:
+            attributes[f"yfantasy.{phase}_time"] = getattr(event, f"{phase}_time")
+        span.set_attributes(attributes)
+        if event.error is not None:
+            span.record_exception(event.error)
+        span.end()
@@ -1,5 +1,10 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from yfantasy_api.api.team import chunks
 from yfantasy_api.api.terminal import TerminalApi
 from yfantasy_api.models import League
+from yfantasy_api.models.transaction import parse_transaction
 
 
 class LeagueApi:
@@ -56,11 +61,12 @@ class LeagueApi:
         """
         return TerminalApi(self)
 
-    def players(self, start=0, count=25, status=None, search=None):
+    def players(self, start=0, count=25, status=None, search=None, player_keys=None):
         """Updates the path to include the `players` sub-resource
 
         Returns a PlayersCollectionApi object that provides methods
-        for adding further sub-resources or invoking the query
+        for adding further sub-resources or invoking the query, or a
+        PlayerKeysApi object when `player_keys` are provided
 
         Parameters
         ----------
@@ -83,16 +89,30 @@ class LeagueApi:
             filter to the path. The server accepts any string and
             performs substring matching for all player names. If a
             match isn't found the list of players will be empy.
+        player_keys: list
+            The keys of the players to return, in the format
+            <game-code>.p.<player-id>. If values are provided the
+            players are requested by key with a `;player_keys=<values>`
+            filter instead of being paged through with `start` and
+            `count`, see PlayerKeysApi.
         """
-        self.path += f"/players;start={start};count={count}"
+        if player_keys is not None:
+            return PlayerKeysApi(
+                self.__yfantasy_api,
+                f"{self.__url}{self.path}",
+                player_keys,
+                lambda json: League(json["league"]).players,
+            )
+
+        filters = ""
 
         if search:
-            self.path += f";search={search}"
+            filters += f";search={search}"
 
         if status:
-            self.path += f";status={status}"
+            filters += f";status={status}"
 
-        return PlayersCollectionApi(self)
+        return PlayersCollectionApi(self, start, count, filters)
 
     def scoreboard(self, week=None):
         """Updates the path to include the `scoreboard` sub-resource
@@ -172,28 +192,158 @@ class LeagueApi:
             transaction while `start=1` begins at the second most recent.
             (default: 0)
         """
-        self.path += "/transactions"
+        base_path = self.path
+        filters = ""
 
         if ttype in ["waiver", "pending_trade"] and not team_id:
             raise Exception(f"'team_id' must be provided when using '{ttype}'.")
 
         if ttype:
-            self.path += f";type={ttype}"
+            filters += f";type={ttype}"
         if team_id:
-            self.path += f";team_key={self.__league_key}.t.{team_id}"
+            filters += f";team_key={self.__league_key}.t.{team_id}"
+
+        self.path += f"/transactions{filters}"
         if count:
             self.path += f";count={count}"
         if start:
             self.path += f";start={start}"
 
-        return TerminalApi(self)
+        return TransactionsTerminalApi(self, base_path, filters, count, start)
 
     def get(self):
         """Invoke the Yahoo Fantasy API GET call to query the League Resource
 
         The response json is transformed into a League model
         """
-        return League(self.__yfantasy_api.get(f"{self.__url}{self.path}")["league"])
+        return self.fetch(self.path)
+
+    def fetch(self, path, model=None):
+        """Invoke the Yahoo Fantasy API GET call for the given league path
+
+        Used by the sub-resource apis that need to send several queries,
+        for example one per page of players. The response json is
+        transformed into a League model.
+
+        Parameters
+        ----------
+        path: str
+            The path to append to the base url of the league resource
+        model
+            A callable used to transform the `fantasy_content` json in
+            place of the League model
+        """
+        return self.__yfantasy_api.get(
+            f"{self.__url}{path}", model or (lambda json: League(json["league"]))
+        )
+
+    def fetch_page(self, path, model=None):
+        """Invoke the Yahoo Fantasy API GET call for a page of a sub-resource
+
+        Used by the paging helpers of the players and transactions
+        sub-resources, such as `get_all()` or `iter_since()`, which page
+        through a single league.
+
+        Parameters
+        ----------
+        path: str
+            The path of the page to append to the base url of the league
+        model
+            A callable used to transform the `fantasy_content` json in
+            place of the League model
+        """
+        return self.fetch(path, model)
+
+
+class LeaguesApi(LeagueApi):
+    """League Collection API: An api used for querying many league resources at once
+
+    Supports the same sub-resources as the LeagueApi, but the leagues are
+    requested through the `leagues;league_keys=<key1>,<key2>` collection
+    so that a query across many leagues only takes a few round trips.
+    The leagues don't have to belong to the same game.
+
+    The paging helpers of the players and transactions sub-resources,
+    such as `get_all()` or `iter_since()`, page through a single league
+    and are only supported by the LeagueApi, they raise a TypeError here.
+
+    Attributes
+    ----------
+    __yfantasy_api: YahooFantasyApi
+        The api class responsible for checking the tokens and sending
+        the http request
+    __league_keys: list
+        The keys of the leagues to query; the format of each key is
+        <game-code>.l.<league-id>
+    path: str
+        The path to append to each batch url; can contain subresources,
+        filters, or nothing depending on the builder methods called
+    """
+
+    max_league_keys = 25
+
+    def __init__(self, yfantasy_api, league_keys):
+        """Initialize a new League Collection API
+
+        Parameters
+        ----------
+        yfantasy_api: YahooFantasyApi
+            The api class responsible for checking tokens and sending
+            the http request
+        league_keys: list
+            The keys of the leagues used to scope the resulting queries
+        """
+        self.__yfantasy_api = yfantasy_api
+        self.__league_keys = list(league_keys)
+        self.path = ""
+
+    def players(self, start=0, count=25, status=None, search=None):
+        """Updates the path to include the `players` sub-resource
+
+        The same as `LeagueApi.players()` without the `player_keys`
+        filter, which only applies to a single league.
+        """
+        return super().players(start, count, status, search)
+
+    def transactions(self, ttype=None, count=None, start=None):
+        """Updates the path to include the `transactions` sub-resource
+
+        The same as `LeagueApi.transactions()` without the `team_id`
+        filter, which only applies to a single league.
+        """
+        return super().transactions(ttype, None, count, start)
+
+    def fetch(self, path, model=None):
+        """Invoke the Yahoo Fantasy API GET calls to query the League Collection
+
+        The league keys are split into batches of at most `max_league_keys`
+        and the response json of every batch is transformed into a single
+        list of League models, in the same order as the provided keys.
+
+        Parameters
+        ----------
+        path: str
+            The path to append to the url of each batch
+        model
+            A callable used to transform each `fantasy_content` json into
+            a list of models in place of the League models
+        """
+        paths = [
+            f"leagues;league_keys={','.join(chunk)}{path}"
+            for chunk in chunks(self.__league_keys, self.max_league_keys)
+        ]
+        return self.__yfantasy_api.get_batches(paths, model or self.__parse_leagues)
+
+    def fetch_page(self, path, model=None):
+        """Raise a TypeError, the paging helpers only page through a single league"""
+        raise TypeError(
+            "The paging helpers, such as get_all() or iter_since(), are only "
+            "supported for a single league, use api.league() instead"
+        )
+
+    def __parse_leagues(self, json):
+        leagues = json["leagues"]
+        return [League(leagues[str(d)]["league"]) for d in range(leagues["count"])]
 
 
 class PlayersCollectionApi:
@@ -205,9 +355,21 @@ class PlayersCollectionApi:
         The parent api class that created this object, this parent
         api is used when invoking the query or creating the terminal
         api object.
+    __base_path: str
+        The path of the parent api before the `players` sub-resource
+    __start: int
+        The offset of the first player to return
+    __count: int
+        The number of players to return per page
+    __filters: str
+        The filters applied to the players collection
+    __sub_resource: str
+        The sub-resource requested for every player
     """
 
-    def __init__(self, parent_api):
+    max_count = 25
+
+    def __init__(self, parent_api, start=0, count=25, filters=""):
         """Initialize a new Players Collection API object
 
         Parameters
@@ -216,41 +378,51 @@ class PlayersCollectionApi:
             The parent api class that created this object, this parent
             api is used when invoking the query or creating the terminal
             api object.
+        start: int
+            The offset of the first player to return. (default: 0)
+        count: int
+            The number of players to return per page. (default: 25)
+        filters: str
+            The filters applied to the players collection, for example
+            `;status=FA`. (default: "")
         """
         self.__parent_api = parent_api
+        self.__base_path = parent_api.path
+        self.__start = start
+        self.__count = count
+        self.__filters = filters
+        self.__sub_resource = ""
+        self.__parent_api.path = self.__page_path(start)
 
     def draft_analysis(self):
         """Updates the path to include the 'draft_analysis' sub-resource
 
-        Returns a TerminalApi object that provides a `get()` call to
-        invoke the query.
+        Returns a PlayersTerminalApi object that provides a `get()` call
+        to invoke the query.
         """
-        self.__parent_api.path += "/draft_analysis"
-        return TerminalApi(self.__parent_api)
+        return self.__add_sub_resource("/draft_analysis")
 
     def ownership(self):
         """Updates the path to include the 'ownership' sub-resource
 
-        Returns a TerminalApi object that provides a `get()` call to
-        invoke the query.
+        Returns a PlayersTerminalApi object that provides a `get()` call
+        to invoke the query.
         """
-        self.__parent_api.path += "/ownership"
-        return TerminalApi(self.__parent_api)
+        return self.__add_sub_resource("/ownership")
 
     def percent_owned(self):
         """Updates the path to include the 'percent_owned' sub-resource
 
-        Returns a TerminalApi object that provides a `get()` call to
-        invoke the query.
+        Returns a PlayersTerminalApi object that provides a `get()` call
+        to invoke the query.
         """
-        self.__parent_api.path += "/percent_owned"
-        return TerminalApi(self.__parent_api)
+        return self.__add_sub_resource("/percent_owned")
 
     def stats(self, date=None, season=None, week=None):
         """Updates the path to include the 'stats' sub-resource
 
-        Returns a TerminalApi object that provides a `get()` call to
-        invoke the query.
+        Returns a PlayersTerminalApi object that provides a `get()` call
+        to invoke the query.
 
         This method supports changing the requested scope for player
         stats, but only one of `date`, `season`, or `week` can be
@@ -271,24 +443,417 @@ class PlayersCollectionApi:
             If a value is provided this will add a `;type=week;week=<value>`
             filter.
         """
-        coverage_filter = self.__build_coverage_filter(date, season, week)
-        self.__parent_api.path += f"/stats{coverage_filter}"
-        return TerminalApi(self.__parent_api)
+        coverage_filter = build_coverage_filter(date, season, week)
+        return self.__add_sub_resource(f"/stats{coverage_filter}")
 
     def get(self):
         """Invoke the parent API `get()` call"""
         return self.__parent_api.get()
 
-    def __build_coverage_filter(self, date, season, week):
-        if bool(date) + bool(season) + bool(week) > 1:
-            raise Exception(
-                "Only one of 'date', 'season', or 'week' should be provided."
-            )
-        elif date:
-            return f";type=date;date={date}"
-        elif season:
-            return f";type=season;season={season}"
-        elif week:
-            return f";type=week;week={week}"
+    def iter_all(self):
+        """Lazily yield every Player in the collection, page by page
+
+        Pages of `count` players are requested starting at `start`; the
+        next page is fetched in a background thread while the current
+        one is being consumed. Iteration stops at the first page that is
+        empty or shorter than a full page.
+        """
+        page_size = min(self.__count, self.max_count)
+        start = self.__start
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = executor.submit(self.__get_page, start)
+            while page:
+                players = page.result().players
+                start += len(players)
+                page = None
+                if len(players) == page_size:
+                    page = executor.submit(self.__get_page, start)
+                yield from players
+
+    def get_all(self, total=None, max_workers=4):
+        """Fetch every page of the collection in parallel
+
+        The pages are requested across a pool of worker threads, all of
+        them still going through the shared rate limiter. The players are
+        reassembled in page order and de-duplicated by their player key,
+        since the collection can shift while it is being paged.
+
+        Parameters
+        ----------
+        total: int
+            The number of players in the collection, when it isn't known
+            the index of the last page is bisected first, reusing every
+            page requested along the way. (default: None)
+        max_workers: int
+            The number of pages to request concurrently. (default: 4)
+        """
+        page_size = min(self.__count, self.max_count)
+        pages = {}
+
+        if total is None:
+            last_page = self.__find_last_page(pages, page_size)
         else:
-            return ""
+            last_page = -(-total // page_size) - 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            missing = [p for p in range(last_page + 1) if p not in pages]
+            starts = [self.__start + p * page_size for p in missing]
+            for p, league in zip(missing, executor.map(self.__get_page, starts)):
+                pages[p] = league.players
+
+        players = {}
+        for p in sorted(pages):
+            for player in pages[p]:
+                players.setdefault(player.key, player)
+        return list(players.values())
+
+    async def aiter_all(self):
+        """Lazily yield every Player in the collection with the async client
+
+        This is the asyncio counterpart of `iter_all()`, the next page is
+        fetched in a background task while the current one is consumed.
+        The task is cancelled when the iteration stops early.
+        """
+        page_size = min(self.__count, self.max_count)
+        start = self.__start
+
+        page = asyncio.ensure_future(self.__get_page(start))
+        try:
+            while page:
+                players = (await page).players
+                start += len(players)
+                page = None
+                if len(players) == page_size:
+                    page = asyncio.ensure_future(self.__get_page(start))
+                for player in players:
+                    yield player
+        finally:
+            if page:
+                page.cancel()
+
+    def __find_last_page(self, pages, page_size):
+        def is_full(page):
+            if page not in pages:
+                league = self.__get_page(self.__start + page * page_size)
+                pages[page] = league.players
+            return len(pages[page]) == page_size
+
+        if not is_full(0):
+            return 0
+
+        low, high = 0, 1
+        while is_full(high):
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if is_full(middle):
+                low = middle
+            else:
+                high = middle
+        return high
+
+    def __get_page(self, start):
+        return self.__parent_api.fetch_page(self.__page_path(start))
+
+    def __page_path(self, start):
+        return (
+            f"{self.__base_path}/players;start={start};count={self.__count}"
+            f"{self.__filters}{self.__sub_resource}"
+        )
+
+    def __add_sub_resource(self, sub_resource):
+        self.__sub_resource = sub_resource
+        self.__parent_api.path = self.__page_path(self.__start)
+        return PlayersTerminalApi(self)
+
+
+class PlayerKeysApi:
+    """Player Keys API: Supports querying sub-resources of a set of players
+
+    The players are requested by key through the `players;player_keys=`
+    collection of a league or game. The keys are split into batches of
+    at most `max_player_keys` that are sent concurrently, and the players
+    are returned in the order of the provided keys.
+
+    Attributes
+    ----------
+    __yfantasy_api: YahooFantasyApi
+        The api class responsible for checking the tokens and sending
+        the http request
+    __url: str
+        The url of the league or game resource holding the players
+    __player_keys: list
+        The keys of the players to query, without duplicates
+    __order: dict
+        The position of each player id in the keys, used to sort the
+        players of every batch
+    __parse
+        The callable transforming a `fantasy_content` json into the list
+        of players of a batch
+    __sub_resource: str
+        The sub-resource requested for every player
+    """
+
+    max_player_keys = 25
+    max_workers = 4
+
+    def __init__(self, yfantasy_api, url, player_keys, parse):
+        """Initialize a new Player Keys API object
+
+        Parameters
+        ----------
+        yfantasy_api: YahooFantasyApi
+            The api class responsible for checking tokens and sending
+            the http request
+        url: str
+            The url of the league or game resource holding the players
+        player_keys: list
+            The keys of the players to query; a key provided more than
+            once is only returned once
+        parse
+            The callable transforming a `fantasy_content` json into the
+            list of players of a batch
+        """
+        self.__yfantasy_api = yfantasy_api
+        self.__url = url
+        self.__player_keys = list(dict.fromkeys(player_keys))
+        self.__order = {
+            key.rsplit(".", 1)[-1]: i for i, key in enumerate(self.__player_keys)
+        }
+        self.__parse = parse
+        self.__sub_resource = ""
+
+    def draft_analysis(self):
+        """Updates the path to include the 'draft_analysis' sub-resource
+
+        Returns a TerminalApi object that provides a `get()` call to
+        invoke the query.
+        """
+        return self.__add_sub_resource("/draft_analysis")
+
+    def ownership(self):
+        """Updates the path to include the 'ownership' sub-resource
+
+        Returns a TerminalApi object that provides a `get()` call to
+        invoke the query.
+        """
+        return self.__add_sub_resource("/ownership")
+
+    def percent_owned(self):
+        """Updates the path to include the 'percent_owned' sub-resource
+
+        Returns a TerminalApi object that provides a `get()` call to
+        invoke the query.
+        """
+        return self.__add_sub_resource("/percent_owned")
+
+    def stats(self, date=None, season=None, week=None):
+        """Updates the path to include the 'stats' sub-resource
+
+        Returns a TerminalApi object that provides a `get()` call to
+        invoke the query. See `PlayersCollectionApi.stats()` for the
+        parameters.
+        """
+        coverage_filter = build_coverage_filter(date, season, week)
+        return self.__add_sub_resource(f"/stats{coverage_filter}")
+
+    def get(self):
+        """Invoke the Yahoo Fantasy API GET calls to query the players by key
+
+        Returns the list of Player models, in the order of the provided
+        keys; keys that don't match a player are left out.
+        """
+        paths = [
+            f"{self.__url}/players;player_keys={','.join(chunk)}{self.__sub_resource}"
+            for chunk in chunks(self.__player_keys, self.max_player_keys)
+        ]
+        return self.__yfantasy_api.get_batches(
+            paths, self.__parse_batch, self.max_workers
+        )
+
+    def __parse_batch(self, json):
+        # The batches are consecutive slices of the keys, so sorting every
+        # batch on its own keeps the concatenated players in key order.
+        # Yahoo may answer with the numeric game id in place of the game
+        # code, so the players are matched on their id.
+        order = self.__order
+        players = self.__parse(json) or []
+        return sorted(players, key=lambda p: order.get(str(p.id), len(order)))
+
+    def __add_sub_resource(self, sub_resource):
+        self.__sub_resource = sub_resource
+        return TerminalApi(self)
+
+
+class PlayersTerminalApi(TerminalApi):
+    """A terminal class for the players collection
+
+    On top of the `get()` call, this provides methods to iterate over
+    every page of players with the same sub-resources.
+    """
+
+    def __init__(self, players_api):
+        """Initialize a new Players Terminal API object
+
+        Parameters
+        ----------
+        players_api: PlayersCollectionApi
+            The players collection api that created this object
+        """
+        super().__init__(players_api)
+        self.__players_api = players_api
+
+    def iter_all(self):
+        """Invoke the players collection `iter_all()` call"""
+        return self.__players_api.iter_all()
+
+    def get_all(self, total=None, max_workers=4):
+        """Invoke the players collection `get_all()` call"""
+        return self.__players_api.get_all(total, max_workers)
+
+    def aiter_all(self):
+        """Invoke the players collection `aiter_all()` call"""
+        return self.__players_api.aiter_all()
+
+
+class TransactionsTerminalApi(TerminalApi):
+    """A terminal class for the transactions collection
+
+    On top of the `get()` call, this provides methods for incremental
+    syncs that page through the transactions from the newest to the
+    oldest and stop at the last transaction seen by the previous sync.
+
+    Attributes
+    ----------
+    __league_api: LeagueApi
+        The league api that created this object, used to fetch pages
+    __base_path: str
+        The path of the league api before the `transactions` sub-resource
+    __filters: str
+        The type and team filters applied to the transactions collection
+    __count: int
+        The number of transactions to request per page
+    __start: int
+        The offset of the first transaction to return
+    """
+
+    def __init__(self, league_api, base_path, filters, count=None, start=None):
+        """Initialize a new Transactions Terminal API object
+
+        Parameters
+        ----------
+        league_api: LeagueApi
+            The league api that created this object
+        base_path: str
+            The path of the league api before the `transactions` sub-resource
+        filters: str
+            The type and team filters applied to the transactions collection
+        count: int
+            The number of transactions to request per page. (default: 25)
+        start: int
+            The offset of the first transaction to return. (default: 0)
+        """
+        super().__init__(league_api)
+        self.__league_api = league_api
+        self.__base_path = base_path
+        self.__filters = filters
+        self.__count = count or 25
+        self.__start = start or 0
+
+    def iter_since(self, since_key=None, since_timestamp=None):
+        """Lazily yield the transactions newer than a watermark, newest first
+
+        Pages of `count` transactions are requested one at a time and each
+        transaction is only parsed once it is reached, so a sync that has
+        nothing or little to catch up on costs a single small request.
+        Transactions of a type without a model, such as `commish`, are
+        skipped.
+
+        Parameters
+        ----------
+        since_key: str
+            The `transaction_key` of the newest transaction seen by the
+            previous sync, every transaction at or older than it is left
+            out.
+        since_timestamp: int
+            The unix timestamp the previous sync stopped at, every
+            transaction at or older than it is left out. If neither
+            watermark is provided the whole history is yielded.
+        """
+        watermark = self.__watermark(since_key, since_timestamp)
+        start = self.__start
+        while True:
+            page = self.__league_api.fetch_page(self.__page_path(start), self.__page)
+            transactions, done = self.__parse_page(page, watermark)
+            yield from transactions
+            if done:
+                return
+            start += self.__count
+
+    async def aiter_since(self, since_key=None, since_timestamp=None):
+        """Lazily yield the transactions newer than a watermark with the async client
+
+        This is the asyncio counterpart of `iter_since()`.
+        """
+        watermark = self.__watermark(since_key, since_timestamp)
+        start = self.__start
+        while True:
+            page = await self.__league_api.fetch_page(
+                self.__page_path(start), self.__page
+            )
+            transactions, done = self.__parse_page(page, watermark)
+            for transaction in transactions:
+                yield transaction
+            if done:
+                return
+            start += self.__count
+
+    def __page(self, json):
+        return json["league"][1]["transactions"]
+
+    def __page_path(self, start):
+        return (
+            f"{self.__base_path}/transactions{self.__filters}"
+            f";count={self.__count};start={start}"
+        )
+
+    def __parse_page(self, page, watermark):
+        count = page["count"] if page else 0
+        transactions = []
+        for t in range(count):
+            json = page[str(t)]["transaction"]
+            if self.__reached(json[0], watermark):
+                return transactions, True
+            transaction = parse_transaction(json)
+            if transaction:
+                transactions.append(transaction)
+        return transactions, count < self.__count
+
+    def __watermark(self, since_key, since_timestamp):
+        # The transaction ids of a league only grow, the key is compared by id
+        if since_key is not None:
+            since_key = int(since_key.rsplit(".", 1)[-1])
+        if since_timestamp is not None:
+            since_timestamp = float(since_timestamp)
+        return since_key, since_timestamp
+
+    def __reached(self, json, watermark):
+        transaction_id, timestamp = watermark
+        if transaction_id is not None and int(json["transaction_id"]) <= transaction_id:
+            return True
+        return timestamp is not None and int(json["timestamp"]) <= timestamp
+
+
+def build_coverage_filter(date=None, season=None, week=None):
+    """Build the `type` filter of player stats for a date, season or week"""
+    if bool(date) + bool(season) + bool(week) > 1:
+        raise Exception("Only one of 'date', 'season', or 'week' should be provided.")
+    elif date:
+        return f";type=date;date={date}"
+    elif season:
+        return f";type=season;season={season}"
+    elif week:
+        return f";type=week;week={week}"
+    else:
+        return ""
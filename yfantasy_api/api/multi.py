@@ -0,0 +1,173 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from yfantasy_api.api.api import YahooFantasyApi
+
+
+class LeagueScope:
+    """League Scope: A view of a shared api pinned to one league
+
+    The scope provides the same builders as YahooFantasyApi for a single
+    league, while every query is sent through the shared api so that the
+    transport, tokens, caches and rate limiter are shared by all leagues.
+
+    Attributes
+    ----------
+    api: YahooFantasyApi
+        The shared api responsible for checking the tokens and sending
+        the http request, either synchronous or asynchronous
+    game_id: str
+        The game_id of the league
+    league_id: str
+        The league_id of the league
+    league_key: str
+        The league key built from the game_id and league_id; the format
+        is <game-code>.l.<league-id>
+    """
+
+    def __init__(self, api, game_id, league_id):
+        """Initialize a new League Scope
+
+        Parameters
+        ----------
+        api: YahooFantasyApi
+            The shared api responsible for checking tokens and sending
+            the http request
+        game_id: str
+            The game_id of the league
+        league_id: str
+            The league_id of the league
+        """
+        self.api = api
+        self.game_id = game_id
+        self.league_id = league_id
+        self.league_key = f"{game_id}.l.{league_id}"
+
+    game = YahooFantasyApi.game
+    league = YahooFantasyApi.league
+    team = YahooFantasyApi.team
+    teams = YahooFantasyApi.teams
+
+    def get(self, path, model=None):
+        """Invoke the query through the shared api, see `YahooFantasyApi.get`"""
+        return self.api.get(path, model)
+
+    def get_batches(self, paths, model, max_workers=1):
+        """Invoke the queries through the shared api, see `get_batches`"""
+        return self.api.get_batches(paths, model, max_workers)
+
+
+class MultiLeagueApi:
+    """Multi League API: Used for running the same query across many leagues
+
+    A single YahooFantasyApi, or AsyncYahooFantasyApi, is shared by every
+    league so that one authenticated transport, one set of tokens, the
+    caches and the rate limiter serve all of them. A query is a function
+    receiving the `LeagueScope` of a league and returning the result of
+    its builder chain, for example:
+
+        api.map(lambda league: league.league().standings().get())
+
+    Attributes
+    ----------
+    api: YahooFantasyApi
+        The api shared by every league
+    leagues: dict
+        The LeagueScope of every league, keyed by league key
+    max_workers: int
+        The number of leagues queried concurrently by `map()`
+    """
+
+    def __init__(self, leagues, api=None, max_workers=8, **kwargs):
+        """Initialize a new Multi League API
+
+        Parameters
+        ----------
+        leagues: list
+            The `(game_id, league_id)` pair of every league
+        api: YahooFantasyApi
+            The api shared by every league, if nothing is provided a
+            YahooFantasyApi is created with the remaining keyword
+            arguments, for example `timeout`, `cache` or `rate_limiter`
+        max_workers: int
+            The number of leagues queried concurrently by `map()`, the
+            requests are still paced by the shared rate limiter.
+            (default: 8)
+        """
+        if api is None:
+            game_id, league_id = leagues[0]
+            api = YahooFantasyApi(league_id, game_id, **kwargs)
+
+        self.api = api
+        self.max_workers = max_workers
+        self.leagues = {}
+        for game_id, league_id in leagues:
+            scope = LeagueScope(api, game_id, league_id)
+            self.leagues[scope.league_key] = scope
+
+    def league(self, league_key):
+        """Get the LeagueScope of a league to build queries for it alone
+
+        Parameters
+        ----------
+        league_key: str
+            The league key, in the format <game-code>.l.<league-id>
+        """
+        return self.leagues[league_key]
+
+    def map(self, query):
+        """Run a query against every league concurrently
+
+        Returns a dict of the result of each league, keyed by league key.
+
+        Parameters
+        ----------
+        query
+            A callable receiving the LeagueScope of a league and returning
+            the result of the query
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                key: executor.submit(query, scope)
+                for key, scope in self.leagues.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    async def amap(self, query):
+        """Run a query against every league concurrently with the async api
+
+        This is the asyncio counterpart of `map()`, the shared api must be
+        an AsyncYahooFantasyApi and the query must return an awaitable.
+        The number of requests in flight is bounded by the api's
+        `max_concurrency`.
+        """
+        results = await asyncio.gather(
+            *[query(scope) for scope in self.leagues.values()]
+        )
+        return dict(zip(self.leagues, results))
+
+    def standings(self):
+        """Get the standings of every league, keyed by league key
+
+        With an AsyncYahooFantasyApi this returns an awaitable.
+        """
+        return self.__run(lambda league: league.league().standings().get())
+
+    def scoreboard(self, week=None):
+        """Get the scoreboard of every league, keyed by league key
+
+        With an AsyncYahooFantasyApi this returns an awaitable.
+
+        Parameters
+        ----------
+        week: int
+            The week of the scoreboard, if nothing is provided the
+            current week of each league is used
+        """
+        return self.__run(lambda league: league.league().scoreboard(week).get())
+
+    def __run(self, query):
+        if inspect.iscoroutinefunction(self.api.get):
+            return self.amap(query)
+        return self.map(query)
@@ -0,0 +1,154 @@
+from contextlib import contextmanager
+
+from yfantasy_api.api.errors import error_for
+from yfantasy_api.api.throttle import RATE_LIMITED_STATUSES, retry_after
+
+PARAMS = {"format": "json"}
+
+REFRESH = "refresh"
+RETRY = "retry"
+SEND = "send"
+
+
+class Query:
+    """Query: The steps of sending a query to Yahoo that don't do any I/O
+
+    YahooFantasyApi and AsyncYahooFantasyApi send their queries through the
+    same pipeline, only the calls that block or await differ between them.
+    A Query holds everything else: the cached response, the headers of each
+    attempt, the circuit breaker and retry decisions and the reading of the
+    final response. Each client creates one per query and only does the
+    sending, sleeping and token refreshes it asks for.
+
+    Attributes
+    ----------
+    url: str
+        The full url the query is sent to
+    cached: CachedResponse
+        The response cached for the path, `None` if there is none
+    expires_by: float
+        The expiry of the tokens the last attempt was sent with
+    attempt: int
+        The number of times the query was retried after a failed status
+    delay: float
+        The seconds to wait before the retry asked for by `answered()`
+    """
+
+    def __init__(self, api, path, event, decode):
+        """Initialize a new Query
+
+        Parameters
+        ----------
+        api: YahooFantasyApi
+            The client sending the query, its cache, limiter, retry
+            policy and circuit breaker are the ones used
+        path: str
+            The path built by the api object sending the query
+        event: RequestEvent
+            The event instruments are notified of for this query
+        decode
+            The function used to decode raw response bodies into json
+        """
+        self.url = "{}/{}".format(api.base_url, path)
+        self.cached = api.cache.get(path) if api.cache else None
+        self.expires_by = None
+        self.attempt = 0
+        self.delay = None
+        self.__api = api
+        self.__path = path
+        self.__event = event
+        self.__decode = decode
+        self.__rate_limited = 0
+        self.__refreshed = False
+
+    @property
+    def fresh(self):
+        """Check whether the cached response can be used without asking Yahoo"""
+        return self.cached is not None and self.cached.fresh
+
+    def headers(self):
+        """Check the circuit breaker and build the headers of the next attempt"""
+        api = self.__api
+        api.circuit_breaker.before_request()
+        self.expires_by = api.expires_by
+        headers = {"Authorization": "Bearer {}".format(api.access_token)}
+        headers.update(self.cached.validators() if self.cached else {})
+        return headers
+
+    @contextmanager
+    def sending(self):
+        """Record an attempt failing without a response on the circuit breaker"""
+        try:
+            yield
+        except Exception:
+            self.__api.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled or interrupted, Yahoo may still be probed
+            self.__api.circuit_breaker.release()
+            raise
+
+    def answered(self, response):
+        """Record the response of an attempt and decide what comes next
+
+        Returns `SEND` when the query is sent again once the rate limiter
+        lets it, `REFRESH` when the tokens must be refreshed first, `RETRY`
+        when it is sent again after waiting `delay` seconds, or `None` when
+        the response is the final one.
+        """
+        api = self.__api
+        status_code = self.__event.status_code = response.status_code
+        if status_code >= 500:
+            api.circuit_breaker.record_failure()
+        else:
+            api.circuit_breaker.record_success()
+
+        if (
+            status_code in RATE_LIMITED_STATUSES
+            and self.__rate_limited < api.rate_limit_retries
+        ):
+            self.__rate_limited += 1
+            api.rate_limiter.backoff(retry_after(response))
+            return SEND
+        elif status_code == 401 and not self.__refreshed:
+            self.__refreshed = True
+            return REFRESH
+        elif api.retry_policy.should_retry(status_code, self.attempt):
+            self.delay = api.retry_policy.delay(self.attempt)
+            self.attempt += 1
+            return RETRY
+        return None
+
+    def read(self, response):
+        """Return the content and size of the final response, or raise its error"""
+        api, event = self.__api, self.__event
+        if response.status_code == 304 and self.cached:
+            api.rate_limiter.recover()
+            content, size = self.read_cached("revalidated")
+            api.cache.revalidated(self.cached, content)
+            return content, size
+        elif response.status_code == 200:
+            api.rate_limiter.recover()
+            event.source, event.bytes = "network", len(response.content)
+            with event.timing("decode"):
+                content = self.__decode(response.content)["fantasy_content"]
+            if api.cache:
+                api.cache.put(self.__path, response.content, response.headers, content)
+            return content, event.bytes
+        else:
+            raise error_for(response)
+
+    def read_cached(self, source):
+        """Return the content and size of the cached response
+
+        Parameters
+        ----------
+        source: str
+            Why the cached response is used, 'cache' when it's fresh,
+            'revalidated' when Yahoo confirmed it or 'stale' when Yahoo
+            can't be asked
+        """
+        event = self.__event
+        event.source, event.bytes = source, len(self.cached.body)
+        with event.timing("decode"):
+            return self.cached.content(self.__decode), event.bytes
@@ -0,0 +1,144 @@
+import asyncio
+import random
+import threading
+import time
+
+
+class TokenRefresher:
+    """Token Refresher: Renews the tokens of a client ahead of their expiry
+
+    The client only refreshes its tokens once a request finds them within
+    five minutes of their expiry, so that request also pays for the round
+    trip to the Yahoo login api. The refresher renews them earlier from a
+    background thread, or an asyncio task, so that requests keep finding
+    valid tokens and never wait on the refresh lock.
+
+    Each refresh is scheduled `lead` seconds before the expiry, minus a
+    random jitter of up to `jitter` seconds so that many workers sharing
+    the same tokens don't all refresh at once. A failed refresh is retried
+    every `retry` seconds; while it keeps failing the client still
+    refreshes the tokens itself once they are about to expire.
+
+    Attributes
+    ----------
+    api: YahooFantasyApi
+        The client whose tokens are renewed
+    lead: float
+        The seconds before the expiry at which the tokens are renewed
+    jitter: float
+        The maximum random seconds the renewal is moved ahead by
+    retry: float
+        The seconds to wait before retrying a failed refresh
+    refreshes: int
+        The number of tokens renewed by the refresher
+    failures: int
+        The number of refreshes that failed
+    last_error: Exception
+        The error raised by the last failed refresh
+    """
+
+    def __init__(
+        self,
+        api,
+        lead=600.0,
+        jitter=60.0,
+        retry=30.0,
+        clock=time.time,
+        uniform=random.uniform,
+    ):
+        """Initialize a new TokenRefresher
+
+        Parameters
+        ----------
+        api: YahooFantasyApi
+            The client whose tokens are renewed
+        lead: float
+            The seconds before the expiry at which the tokens are renewed,
+            it should be above the five minutes at which the client
+            refreshes them itself. (default: 600.0)
+        jitter: float
+            The maximum random seconds the renewal is moved ahead by.
+            (default: 60.0)
+        retry: float
+            The seconds to wait before retrying a failed refresh.
+            (default: 30.0)
+        clock
+            The wall clock the expiry of the tokens is compared with
+        uniform
+            The function drawing the jitter between two bounds
+        """
+        self.api = api
+        self.lead = lead
+        self.jitter = jitter
+        self.retry = retry
+        self.refreshes = 0
+        self.failures = 0
+        self.last_error = None
+        self.__clock = clock
+        self.__uniform = uniform
+        self.__schedule = (None, None)
+        self.__stopped = threading.Event()
+        self.__thread = None
+
+    def due(self):
+        """Return the timestamp at which the current tokens are renewed"""
+        expires_by, due = self.__schedule
+        if expires_by != self.api.expires_by:
+            expires_by = self.api.expires_by
+            due = expires_by - self.lead - self.__uniform(0, self.jitter)
+            self.__schedule = (expires_by, due)
+        return due
+
+    def run_once(self):
+        """Renew the tokens if they are due
+
+        Returns the seconds to wait before the next call.
+        """
+        expires_by = self.api.expires_by
+        if self.__clock() >= self.due():
+            try:
+                refreshed = self.api.refresh_tokens(expires_by)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = e
+                return self.retry
+            if refreshed:
+                self.refreshes += 1
+        return max(0.0, self.due() - self.__clock())
+
+    def start(self):
+        """Start renewing the tokens from a daemon thread"""
+        self.__stopped.clear()
+        self.__thread = threading.Thread(
+            target=self.__run, name="yfantasy-token-refresher", daemon=True
+        )
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stop the thread started by `start()` and wait for it to exit"""
+        self.__stopped.set()
+        if self.__thread:
+            self.__thread.join()
+            self.__thread = None
+
+    async def run(self):
+        """Renew the tokens from an asyncio task until it's cancelled
+
+        The refreshes are sent from a worker thread, for example:
+
+            task = asyncio.create_task(TokenRefresher(api).run())
+        """
+        while True:
+            await asyncio.sleep(await asyncio.to_thread(self.run_once))
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __run(self):
+        delay = 0.0
+        while not self.__stopped.wait(delay):
+            delay = self.run_once()
@@ -0,0 +1,191 @@
+import random
+import threading
+import time
+
+from yfantasy_api.api.errors import CircuitOpenError
+from yfantasy_api.api.transport import RETRY_STATUSES
+
+
+class RetryPolicy:
+    """Retry Policy: Decides how often and how long to wait for a failed query
+
+    Queries that Yahoo failed with one of the retried statuses are sent
+    again up to `retries` times. The waits grow exponentially and are
+    drawn at random below that bound ("full jitter"), so that the workers
+    failed by the same outage don't all retry at the same time.
+
+    Attributes
+    ----------
+    retries: int
+        The number of times a failed query is sent again
+    backoff_factor: float
+        The bound of the first wait, doubled for each following retry
+    max_backoff: float
+        The upper bound in seconds of every wait
+    statuses: list
+        The statuses of the responses that are retried
+    retried: int
+        The number of queries sent again by this policy
+    """
+
+    def __init__(
+        self,
+        retries=3,
+        backoff_factor=0.5,
+        max_backoff=30.0,
+        statuses=RETRY_STATUSES,
+        uniform=random.uniform,
+        sleep=time.sleep,
+    ):
+        """Initialize a new RetryPolicy
+
+        Parameters
+        ----------
+        retries: int
+            The number of times a failed query is sent again. (default: 3)
+        backoff_factor: float
+            The bound of the first wait in seconds, the wait before retry
+            `n` is at most `backoff_factor * 2 ** n`. (default: 0.5)
+        max_backoff: float
+            The upper bound in seconds of every wait. (default: 30.0)
+        statuses: list
+            The statuses of the responses that are retried, only GET
+            queries are ever sent so they're all safe to retry.
+            (default: [500, 502, 503, 504])
+        uniform
+            The function drawing the wait between two bounds
+        sleep
+            The function used to wait in synchronous code
+        """
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+        self.retried = 0
+        self.__uniform = uniform
+        self.__sleep = sleep
+
+    def should_retry(self, status_code, attempt):
+        """Check whether a query failed with the status is sent again
+
+        Parameters
+        ----------
+        status_code: int
+            The status Yahoo responded with
+        attempt: int
+            The number of times the query was already retried
+        """
+        return status_code in self.statuses and attempt < self.retries
+
+    def delay(self, attempt):
+        """Return the seconds to wait before sending a query again"""
+        self.retried += 1
+        bound = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return self.__uniform(0, bound)
+
+    def sleep(self, seconds):
+        """Block the current thread for a wait returned by `delay()`"""
+        self.__sleep(seconds)
+
+
+class CircuitBreaker:
+    """Circuit Breaker: Stops sending queries while Yahoo is down
+
+    The circuit opens after `failure_threshold` consecutive queries failed
+    with a 5xx status or without a response. While it's open queries fail
+    right away with a `CircuitOpenError` instead of waiting on retries
+    that are bound to fail. After `reset_timeout` seconds a single query
+    is let through: the circuit closes once it succeeds, otherwise it
+    opens again for another `reset_timeout` seconds.
+
+    Attributes
+    ----------
+    failure_threshold: int
+        The number of consecutive failures opening the circuit
+    reset_timeout: float
+        The seconds the circuit stays open before a query is let through
+    failures: int
+        The number of consecutive failures
+    opened: int
+        The number of times the circuit opened
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0, clock=time.monotonic):
+        """Initialize a new CircuitBreaker
+
+        Parameters
+        ----------
+        failure_threshold: int
+            The number of consecutive failures opening the circuit.
+            (default: 5)
+        reset_timeout: float
+            The seconds the circuit stays open before a query is let
+            through. (default: 30.0)
+        clock
+            The monotonic clock used to time the open circuit
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened = 0
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__opened_at = None
+        self.__probing = False
+
+    @property
+    def state(self):
+        """The state of the circuit: 'closed', 'open' or 'half-open'"""
+        with self.__lock:
+            if self.__opened_at is None:
+                return "closed"
+            if self.__probing or self.__remaining() <= 0:
+                return "half-open"
+            return "open"
+
+    def before_request(self):
+        """Raise a `CircuitOpenError` unless a query can be sent
+
+        Every query let through must then be reported to either
+        `record_success()`, `record_failure()` or `release()`.
+        """
+        with self.__lock:
+            if self.__opened_at is None:
+                return
+            remaining = self.__remaining()
+            if remaining > 0 or self.__probing:
+                raise CircuitOpenError(
+                    f"Yahoo is unavailable, retry in {max(0.0, remaining):.1f}s",
+                    retry_in=max(0.0, remaining),
+                )
+            self.__probing = True
+
+    def record_success(self):
+        """Close the circuit after Yahoo answered a query"""
+        with self.__lock:
+            self.failures = 0
+            self.__opened_at = None
+            self.__probing = False
+
+    def record_failure(self):
+        """Count a failed query, opening the circuit past the threshold"""
+        with self.__lock:
+            self.failures += 1
+            closed = self.__opened_at is None
+            if self.__probing or (closed and self.failures >= self.failure_threshold):
+                self.__opened_at = self.__clock()
+                self.__probing = False
+                self.opened += 1
+
+    def release(self):
+        """Let another query through after one was interrupted
+
+        A query cancelled before Yahoo answered it tells nothing about
+        Yahoo, it's neither a success nor a failure; but when it was the
+        single query let through the open circuit, another one must be.
+        """
+        with self.__lock:
+            self.__probing = False
+
+    def __remaining(self):
+        return self.__opened_at + self.reset_timeout - self.__clock()
@@ -113,7 +113,9 @@ class TeamApi:
 
         The response json is transformed into a Team model
         """
-        return Team(self.__yfantasy_api.get(f"{self.__url}{self.path}")["team"])
+        return self.__yfantasy_api.get(
+            f"{self.__url}{self.path}", lambda json: Team(json["team"])
+        )
 
     def __build_coverage_filter(self, week, date):
         if week and date:
@@ -126,6 +128,67 @@ class TeamApi:
             return ""
 
 
+class TeamsApi(TeamApi):
+    """Team Collection API: An api used for querying many team resources at once
+
+    Supports the same sub-resources as the TeamApi, but the teams are
+    requested through the `teams;team_keys=<key1>,<key2>` collection so
+    that a league-wide query only takes one or two round trips.
+
+    Attributes
+    ----------
+    __yfantasy_api: YahooFantasyApi
+        The api class responsible for checking the tokens and sending
+        the http request
+    __team_keys: list
+        The team keys built using the game_code and league_id from the
+        __yfantasy_api object along with the provided team_ids
+    path: str
+        The path to append to each batch url; can contain subresources,
+        filters, or nothing depending on the builder methods called
+    """
+
+    max_team_keys = 25
+
+    def __init__(self, yfantasy_api, team_ids):
+        """Initialize a new Team Collection API
+
+        Parameters
+        ----------
+        yfantasy_api: YahooFantasyApi
+            The api class responsible for checking tokens and sending
+            the http request
+        team_ids: list
+            The team_ids used to scope the resulting queries
+        """
+        self.__yfantasy_api = yfantasy_api
+        league_key = f"{self.__yfantasy_api.game_id}.l.{self.__yfantasy_api.league_id}"
+        self.__team_keys = [f"{league_key}.t.{team_id}" for team_id in team_ids]
+        self.path = ""
+
+    def get(self):
+        """Invoke the Yahoo Fantasy API GET calls to query the Team Collection
+
+        The team keys are split into batches of at most `max_team_keys`
+        and the response json of every batch is transformed into a single
+        list of Team models, in the same order as the provided team_ids.
+        """
+        paths = [
+            f"teams;team_keys={','.join(chunk)}{self.path}"
+            for chunk in chunks(self.__team_keys, self.max_team_keys)
+        ]
+        return self.__yfantasy_api.get_batches(paths, self.__parse_teams)
+
+    def __parse_teams(self, json):
+        teams = json["teams"]
+        return [Team(teams[str(d)]["team"]) for d in range(teams["count"])]
+
+
+def chunks(items, size):
+    """Split a list of items into consecutive lists of at most `size` items"""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 class PlayerCollectionApi:
     """Players Collection API: Supports querying players sub-resources
 
@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+RATE_LIMITED_STATUSES = [429, 999]
+
+
+class RateLimiter:
+    """Rate Limiter: A token bucket shared by every request sent to Yahoo
+
+    The bucket holds up to `burst` tokens and is refilled at `rate` tokens
+    per second. Each request takes a token, when the bucket is empty the
+    token is reserved ahead of time and the caller waits until it would
+    have been refilled. Reserving a token is guarded by a lock and never
+    blocks, so a single limiter can be shared across threads and asyncio
+    tasks alike.
+
+    When Yahoo responds with a rate limited status the limiter blocks all
+    callers for the `Retry-After` duration, or an adaptive back-off that
+    doubles with each consecutive rate limited response.
+
+    Attributes
+    ----------
+    rate: float
+        The number of requests allowed per second, `None` means unlimited
+    burst: int
+        The maximum number of requests that can be sent back to back
+    throttled_requests: int
+        The number of requests that had to wait for a token
+    throttled_time: float
+        The total seconds requests have spent waiting for a token
+    backoffs: int
+        The number of times the limiter backed off after a rate limited
+        response
+    """
+
+    def __init__(
+        self,
+        rate=1.0,
+        burst=1,
+        max_backoff=60.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        """Initialize a new RateLimiter
+
+        Parameters
+        ----------
+        rate: float
+            The number of requests allowed per second, if `None` is
+            provided requests are only delayed while backing off.
+            (default: 1.0)
+        burst: int
+            The maximum number of requests that can be sent back to back
+            once the bucket has been refilled. (default: 1)
+        max_backoff: float
+            The upper bound in seconds for the adaptive back-off.
+            (default: 60.0)
+        clock
+            The monotonic clock used to refill the bucket
+        sleep
+            The function used to wait for a token in synchronous code
+        """
+        self.rate = rate
+        self.burst = burst
+        self.throttled_requests = 0
+        self.throttled_time = 0.0
+        self.backoffs = 0
+        self.__max_backoff = max_backoff
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__lock = threading.Lock()
+        self.__tokens = burst
+        self.__updated = clock()
+        self.__blocked_until = 0.0
+        self.__penalty = 0.0
+
+    @classmethod
+    def from_timeout(cls, timeout):
+        """Build a limiter equivalent to sleeping `timeout` seconds per request
+
+        A timeout of `0` or `None` disables the token bucket entirely.
+        """
+        return cls(rate=1 / timeout if timeout else None)
+
+    def reserve(self):
+        """Take a token and return the seconds to wait before using it"""
+        with self.__lock:
+            now = self.__clock()
+            wait = max(0.0, self.__blocked_until - now)
+
+            if self.rate is not None:
+                elapsed = now - self.__updated
+                self.__tokens = min(self.burst, self.__tokens + elapsed * self.rate)
+                self.__tokens -= 1
+                if self.__tokens < 0:
+                    wait = max(wait, -self.__tokens / self.rate)
+            self.__updated = now
+
+            if wait > 0:
+                self.throttled_requests += 1
+                self.throttled_time += wait
+            return wait
+
+    def acquire(self):
+        """Block the current thread until a token is available
+
+        Returns the seconds spent waiting for the token.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self.__sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """Suspend the current task until a token is available
+
+        Returns the seconds spent waiting for the token.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def backoff(self, retry_after=None):
+        """Block every caller after Yahoo responded with a rate limited status
+
+        Parameters
+        ----------
+        retry_after: float
+            The seconds Yahoo asked to wait, if nothing is provided the
+            previous back-off is doubled, starting at one second
+        """
+        with self.__lock:
+            self.__penalty = min(self.__max_backoff, self.__penalty * 2 or 1.0)
+            delay = retry_after if retry_after is not None else self.__penalty
+            self.__blocked_until = max(self.__blocked_until, self.__clock() + delay)
+            self.backoffs += 1
+
+    def recover(self):
+        """Reset the adaptive back-off after a successful response"""
+        with self.__lock:
+            self.__penalty = 0.0
+
+    def metrics(self):
+        """Return a snapshot of the throttling metrics as a dict"""
+        with self.__lock:
+            return {
+                "throttled_requests": self.throttled_requests,
+                "throttled_time": self.throttled_time,
+                "backoffs": self.backoffs,
+            }
+
+
+def retry_after(response):
+    """Parse the `Retry-After` header of a response into seconds
+
+    Returns `None` when the header is missing or can't be parsed.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
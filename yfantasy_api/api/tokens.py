@@ -0,0 +1,194 @@
+import abc
+import contextlib
+import json
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+ACCESS_TOKEN = "access_token"
+EXPIRES_BY = "expires_by"
+REFRESH_TOKEN = "refresh_token"
+
+
+class TokenStore(abc.ABC):
+    """Token Store: Where the oauth tokens are loaded from and saved to
+
+    A store holds the tokens as a dict with an `access_token`, a
+    `refresh_token` and an `expires_by` timestamp. Every store provides a
+    `lock()` that is held while the tokens are refreshed, so that the
+    users of a store share a single refresh: whoever takes the lock last
+    finds the tokens already refreshed and reuses them.
+    """
+
+    def __init__(self):
+        """Initialize a new TokenStore"""
+        self.__lock = threading.Lock()
+
+    @abc.abstractmethod
+    def load(self):
+        """Load the tokens, returns `None` when the store has none"""
+
+    @abc.abstractmethod
+    def save(self, tokens):
+        """Save the tokens
+
+        Parameters
+        ----------
+        tokens: dict
+            The `access_token`, `refresh_token` and `expires_by` to save
+        """
+
+    @contextlib.contextmanager
+    def lock(self):
+        """Hold the lock guarding refreshes of the tokens in this store"""
+        with self.__lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    """File Token Store: Keeps the tokens in a json file
+
+    The file is only read when the tokens are loaded and only written
+    when they change. Writes go to a temporary file renamed over the
+    tokens file, so that a reader never sees a partial file. On POSIX
+    systems the refresh lock is also an exclusive lock on a `.lock` file
+    next to the tokens, shared by every process using the same file.
+
+    Attributes
+    ----------
+    path: str
+        The path of the json file holding the tokens
+    """
+
+    def __init__(self, path=".tokens.json"):
+        """Initialize a new FileTokenStore
+
+        Parameters
+        ----------
+        path: str
+            The path of the json file holding the tokens.
+            (default: '.tokens.json')
+        """
+        super().__init__()
+        self.path = path
+
+    def load(self):
+        """Load the tokens from the file, returns `None` when it's missing"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, "r") as f:
+            return json.loads(f.read())
+
+    def save(self, tokens):
+        """Atomically replace the file with the tokens"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(tokens))
+        os.replace(temporary, self.path)
+
+    @contextlib.contextmanager
+    def lock(self):
+        """Hold the lock guarding refreshes across threads and processes"""
+        with super().lock():
+            if fcntl is None:  # pragma: no cover
+                yield
+                return
+            with open(f"{self.path}.lock", "a") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class MemoryTokenStore(TokenStore):
+    """Memory Token Store: Keeps the tokens in memory
+
+    Nothing is ever written to disk, a single store can be shared by
+    every client of a process so that they share the refreshed tokens.
+    """
+
+    def __init__(self, tokens=None):
+        """Initialize a new MemoryTokenStore
+
+        Parameters
+        ----------
+        tokens: dict
+            The initial `access_token`, `refresh_token` and `expires_by`
+        """
+        super().__init__()
+        self.__tokens = tokens
+
+    def load(self):
+        """Load the tokens held in memory"""
+        return self.__tokens
+
+    def save(self, tokens):
+        """Hold the tokens in memory"""
+        self.__tokens = tokens
+
+
+class EnvTokenStore(MemoryTokenStore):
+    """Env Token Store: Reads the initial tokens from environment variables
+
+    The tokens are read from `<prefix>ACCESS_TOKEN`, `<prefix>REFRESH_TOKEN`
+    and `<prefix>EXPIRES_BY`. Only the refresh token is required, without
+    an access token or an expiry the tokens are refreshed before the
+    first request. Refreshed tokens are only kept in memory.
+    """
+
+    def __init__(self, prefix="YAHOO_"):
+        """Initialize a new EnvTokenStore
+
+        Parameters
+        ----------
+        prefix: str
+            The prefix of the environment variables. (default: 'YAHOO_')
+        """
+        tokens = None
+        if os.getenv(f"{prefix}REFRESH_TOKEN"):
+            tokens = {
+                ACCESS_TOKEN: os.getenv(f"{prefix}ACCESS_TOKEN"),
+                REFRESH_TOKEN: os.getenv(f"{prefix}REFRESH_TOKEN"),
+                EXPIRES_BY: float(os.getenv(f"{prefix}EXPIRES_BY") or 0),
+            }
+        super().__init__(tokens)
+
+
+class CallbackTokenStore(TokenStore):
+    """Callback Token Store: Loads and saves the tokens through callables
+
+    Used to keep the tokens in an external system, such as a secrets
+    manager or a database shared by many workers.
+    """
+
+    def __init__(self, load, save=None):
+        """Initialize a new CallbackTokenStore
+
+        Parameters
+        ----------
+        load
+            A callable without arguments returning the tokens dict, or
+            `None` when there are no tokens
+        save
+            A callable receiving the tokens dict to save, if nothing is
+            provided the refreshed tokens are not saved
+        """
+        super().__init__()
+        self.__load = load
+        self.__save = save
+
+    def load(self):
+        """Load the tokens through the load callable"""
+        return self.__load()
+
+    def save(self, tokens):
+        """Save the tokens through the save callable"""
+        if self.__save:
+            self.__save(tokens)
@@ -0,0 +1,150 @@
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = [500, 502, 503, 504]
+
+
+def orjson_decoder():
+    import orjson
+
+    return orjson.loads
+
+
+def msgspec_decoder():
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+DECODERS = {
+    "json": lambda: json.loads,
+    "orjson": orjson_decoder,
+    "msgspec": msgspec_decoder,
+}
+
+
+def load_decoder(decoder="auto"):
+    """Load the function used to decode raw response bodies
+
+    Parameters
+    ----------
+    decoder: str
+        One of 'json' (the standard library), 'orjson', 'msgspec', or
+        'auto' to pick the fastest one installed. A callable taking the
+        raw bytes is used as is. (default: 'auto')
+    """
+    if callable(decoder):
+        return decoder
+    if decoder != "auto":
+        return DECODERS[decoder]()
+
+    for name in ["orjson", "msgspec"]:
+        try:
+            return DECODERS[name]()
+        except ImportError:
+            continue
+    return json.loads
+
+
+class Transport:
+    """Transport: Owns the pooled http session used for every request to Yahoo
+
+    Every query and token refresh goes through a single `requests.Session`
+    so that the underlying connections are kept alive and reused instead of
+    paying a fresh TCP + TLS handshake for each call.
+
+    Attributes
+    ----------
+    session: requests.Session
+        The pooled session used to send all http requests
+    decode
+        The function used to decode raw response bodies into json
+    """
+
+    def __init__(
+        self,
+        pool_size=10,
+        retries=3,
+        backoff_factor=0.5,
+        keep_alive=True,
+        decoder="auto",
+    ):
+        """Initialize a new Transport
+
+        Parameters
+        ----------
+        pool_size: int
+            The number of connections to keep open per host. This should
+            be at least the number of threads sharing the transport.
+            (default: 10)
+        retries: int
+            The number of times a failed connection is retried before
+            giving up, the GETs Yahoo answered with a 5xx status are
+            retried by the client's `RetryPolicy`. (default: 3)
+        backoff_factor: float
+            The factor used to compute the sleep between retries, the
+            sleep is `backoff_factor * 2 ** (retry - 1)`. (default: 0.5)
+        keep_alive: bool
+            A flag to indicate whether connections should be kept open
+            between requests. (default: True)
+        decoder: str
+            The json decoder used for response bodies, see `load_decoder`.
+            (default: 'auto')
+        """
+        self.decode = load_decoder(decoder)
+        # Only failed connections are retried here, the statuses Yahoo
+        # answers with are left to the client's limiter and `RetryPolicy`
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            allowed_methods=["GET"],
+            status_forcelist=(),
+            respect_retry_after_header=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def get(self, url, params=None, headers=None):
+        """Send a GET request over the pooled session
+
+        Parameters
+        ----------
+        url: str
+            The full url of the request
+        params: dict
+            The query parameters to include in the request
+        headers: dict
+            The headers to include in the request
+        """
+        return self.session.get(url, params=params, headers=headers)
+
+    def post(self, url, params=None, data=None, headers=None):
+        """Send a POST request over the pooled session
+
+        Parameters
+        ----------
+        url: str
+            The full url of the request
+        params: dict
+            The query parameters to include in the request
+        data: dict
+            The form data to include in the request body
+        headers: dict
+            The headers to include in the request
+        """
+        return self.session.post(url, params=params, data=data, headers=headers)
+
+    def close(self):
+        """Close every pooled connection held by the session"""
+        self.session.close()
@@ -66,6 +66,6 @@ class UserApi:
 
         The response json is transformed into a User model
         """
-        return User(
-            self.__yfantasy_api.get(f"{self.__url}{self.path}")["users"]["0"]["user"]
+        return self.__yfantasy_api.get(
+            f"{self.__url}{self.path}", lambda json: User(json["users"]["0"]["user"])
         )
@@ -0,0 +1,144 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from yfantasy_api.models.game import StatCategory
+from yfantasy_api.models.league import DraftResult
+
+
+def require(module, extra):
+    if module is None:  # pragma: no cover
+        raise ImportError(
+            f"{extra} is required for the columnar export, "
+            f"install it with `pip install yfantasy-api[{extra}]`"
+        )
+    return module
+
+
+def as_players(items):
+    return [item.player if isinstance(item, DraftResult) else item for item in items]
+
+
+def stat_ids(categories=None, players=()):
+    """List the stat ids used as columns
+
+    The ids come from `Settings.stat_categories` or `Game.stat_categories`
+    when they are provided, otherwise from the stats of the players.
+    """
+    if categories is not None:
+        return [
+            int(c.stat_id if isinstance(c, StatCategory) else c.id) for c in categories
+        ]
+    return sorted({s for player in players for s in player.stats or {}})
+
+
+def stats_matrix(players, ids):
+    """Build a float matrix of one row per player and one column per stat id
+
+    Every stat is scattered into the matrix with a single vectorized
+    assignment; stats a player doesn't have, or that have no value, are
+    left as `nan`.
+
+    Parameters
+    ----------
+    players: list
+        The players, or draft results, to build the rows from
+    ids: list
+        The stat ids to build the columns from, see `stat_ids`
+    """
+    require(np, "numpy")
+    columns = {stat_id: c for c, stat_id in enumerate(ids)}
+    rows, cols, values = [], [], []
+    for row, player in enumerate(as_players(players)):
+        for stat_id, value in (player.stats or {}).items():
+            if stat_id in columns and value is not None:
+                rows.append(row)
+                cols.append(columns[stat_id])
+                values.append(value)
+
+    matrix = np.full((len(players), len(ids)), np.nan)
+    matrix[np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)] = values
+    return matrix
+
+
+def to_numpy(players, categories=None):
+    """Export the stats of players as a NumPy structured array
+
+    The array has a `key`, `id` and `name` field for each player followed
+    by one float field per stat id, named after the id.
+
+    Parameters
+    ----------
+    players: list
+        The players to export, for example `League.players`,
+        `Team.players` or `League.draft_results`
+    categories: list
+        The `Settings.stat_categories` or `Game.stat_categories` used for
+        the stat columns, if nothing is provided every stat found in the
+        players is used
+    """
+    require(np, "numpy")
+    players = as_players(players)
+    ids = stat_ids(categories, players)
+    keys = np.array([p.key for p in players], dtype=str)
+    names = np.array([p.name for p in players], dtype=str)
+    dtype = [("key", keys.dtype), ("id", np.int64), ("name", names.dtype)]
+    dtype += [(str(stat_id), np.float64) for stat_id in ids]
+
+    array = np.empty(len(players), dtype=dtype)
+    array["key"] = keys
+    array["id"] = [p.id for p in players]
+    array["name"] = names
+    matrix = stats_matrix(players, ids)
+    for c, stat_id in enumerate(ids):
+        array[str(stat_id)] = matrix[:, c]
+    return array
+
+
+def to_pandas(players, categories=None):
+    """Export the stats of players as a pandas DataFrame indexed by player key
+
+    The DataFrame has an `id` and `name` column followed by one float
+    column per stat id, named after the id. See `to_numpy` for the
+    parameters.
+    """
+    try:
+        import pandas as pd
+    except ImportError:  # pragma: no cover
+        pd = None
+    require(pd, "pandas")
+
+    players = as_players(players)
+    ids = stat_ids(categories, players)
+    frame = pd.DataFrame(stats_matrix(players, ids), columns=[str(i) for i in ids])
+    frame.insert(0, "id", [p.id for p in players])
+    frame.insert(1, "name", [p.name for p in players])
+    frame.index = pd.Index([p.key for p in players], name="key")
+    return frame
+
+
+def to_arrow(players, categories=None):
+    """Export the stats of players as an Arrow table
+
+    The table has a `key`, `id` and `name` column followed by one float
+    column per stat id, named after the id. See `to_numpy` for the
+    parameters.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:  # pragma: no cover
+        pa = None
+    require(pa, "arrow")
+
+    players = as_players(players)
+    ids = stat_ids(categories, players)
+    matrix = stats_matrix(players, ids)
+    columns = {
+        "key": pa.array([p.key for p in players], pa.string()),
+        "id": pa.array([p.id for p in players], pa.int64()),
+        "name": pa.array([p.name for p in players], pa.string()),
+    }
+    for c, stat_id in enumerate(ids):
+        columns[str(stat_id)] = pa.array(matrix[:, c], from_pandas=True)
+    return pa.table(columns)
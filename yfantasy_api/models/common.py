@@ -1,91 +1,153 @@
-from yfantasy_api.models.helpers import as_bool, as_float, as_int, flatten_attributes
+from yfantasy_api.models.helpers import (
+    as_bool,
+    as_dict,
+    as_float,
+    as_int,
+    as_shared,
+    field,
+    lazy,
+    Schema,
+)
+
+
+def as_managers(json):
+    return [Manager(m) for m in json]
+
+
+def as_team_logo(json):
+    if not json:
+        return None
+    return json[0]["team_logo"]["url"]
 
 
 class Team:
+    __slots__ = (
+        "key",
+        "id",
+        "name",
+        "priority",
+        "faab",
+        "moves",
+        "trades",
+        "draft_grade",
+        "managers",
+        "clinched_playoffs",
+        "url",
+        "team_logos",
+        "rank",
+        "playoff_seed",
+        "wins",
+        "losses",
+        "ties",
+        "percentage",
+        "points_for",
+        "points_against",
+        "div_wins",
+        "div_losses",
+        "div_ties",
+        "streak_type",
+        "streak_value",
+        "points",
+        "projected_points",
+        "stats",
+        "_raw",
+        "_parsed",
+    )
+
     def __init__(self, json):
-        attributes = self.__flatten_attributes(json)
-        self.key = attributes.get("team_key")
-        self.id = as_int(attributes.get("team_id"))
-        self.name = attributes.get("name")
-        self.priority = as_int(attributes.get("waiver_priority"))
-        self.faab = as_int(attributes.get("faab_balance"))
-        self.moves = as_int(attributes.get("number_of_moves"))
-        self.trades = as_int(attributes.get("number_of_trades"))
-        self.draft_grade = attributes.get("draft_grade")
-        self.managers = self.__parse_managers(attributes)
-        self.clinched_playoffs = as_bool(attributes.get("clinched_playoffs"))
-        self.url = attributes.get("url")
-        self.team_logos = self.__parse_team_logo(attributes)
-
-        self.__parse_sub_resources(json)
+        self._raw = {}
+        self._parsed = {}
+        self.rank = None
+        self.playoff_seed = None
+        self.wins = None
+        self.losses = None
+        self.ties = None
+        self.percentage = None
+        self.points_for = None
+        self.points_against = None
+        self.div_wins = None
+        self.div_losses = None
+        self.div_ties = None
+        self.streak_type = None
+        self.streak_value = None
+        self.points = None
+        self.projected_points = None
+        self.stats = None
+
+        json = json if isinstance(json, list) else [[json]]
+        self.SCHEMA.parse(self, json[0])
+        self.SCHEMA.parse_sub_resources(self, json)
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
-
-    def __flatten_attributes(self, json):
-        json = json[0] if type(json) == list else [json]
-        return flatten_attributes(json)
-
-    def __parse_sub_resources(self, json):
-        for data in json:
-            if "roster" in data:
-                self.__parse_roster(data)
-            if "team_standings" in data:
-                self.__parse_team_standings(data)
-            if "team_points" in data:
-                self.__parse_team_points(data)
-            if "team_projected_points" in data:
-                self.__parse_projected_points(data)
-            if "team_stats" in data:
-                self.__parse_team_stats(data)
-
-    def __parse_roster(self, json):
-        json = json["roster"]["0"]["players"]
-        self.players = [Player(json[p]["player"]) for p in json if p != "count"]
+        return str(as_dict(self))
+
+    @lazy
+    def players(self, json):
+        json = json["0"]["players"]
+        return [Player(json[p]["player"]) for p in json if p != "count"]
+
+    def __collect_roster(self, json):
+        self._raw["players"] = json
 
     def __parse_team_standings(self, json):
-        json = json["team_standings"]
-        self.rank = as_int(json["rank"])
-        self.playoff_seed = as_int(json.get("playoff_seed", 0))
-        self.wins = as_int(json["outcome_totals"]["wins"])
-        self.losses = as_int(json["outcome_totals"]["losses"])
-        self.ties = as_int(json["outcome_totals"]["ties"])
-        self.percentage = as_float(json["outcome_totals"]["percentage"])
-        self.points_for = as_float(json["points_for"])
-        self.points_against = as_float(json["points_against"])
-
-        if "divisional_outcome_totals" in json:
-            self.div_wins = as_int(json["divisional_outcome_totals"]["wins"])
-            self.div_losses = as_int(json["divisional_outcome_totals"]["losses"])
-            self.div_ties = as_int(json["divisional_outcome_totals"]["ties"])
-
-        if "streak" in json:
-            self.streak_type = json["streak"]["type"]
-            self.streak_value = as_int(json["streak"]["value"])
+        self.STANDINGS.parse_dict(self, json)
 
     def __parse_team_points(self, json):
-        self.points = as_float(json["team_points"]["total"])
+        self.points = as_float(json["total"])
 
     def __parse_projected_points(self, json):
-        self.projected_points = as_float(json["team_projected_points"]["total"])
+        self.projected_points = as_float(json["total"])
 
     def __parse_team_stats(self, json):
-        self.stats = {
-            d["stat"]["stat_id"]: d["stat"]["value"]
-            for d in json["team_stats"]["stats"]
-        }
-
-    def __parse_team_logo(self, json):
-        json = json.get("team_logos")
-        if not json:
-            return None
-        return json[0]["team_logo"]["url"]
-
-    def __parse_managers(self, json):
-        return [Manager(m) for m in json.get("managers", [])]
+        self.stats = {d["stat"]["stat_id"]: d["stat"]["value"] for d in json["stats"]}
+
+    # Compiled once, after the sub-resource parsers they dispatch to
+    SCHEMA = Schema(
+        [
+            field("key", "team_key"),
+            field("id", "team_id", as_int),
+            field("name", "name"),
+            field("priority", "waiver_priority", as_int),
+            field("faab", "faab_balance", as_int),
+            field("moves", "number_of_moves", as_int),
+            field("trades", "number_of_trades", as_int),
+            field("draft_grade", "draft_grade"),
+            field("managers", "managers", as_managers, list),
+            field("clinched_playoffs", "clinched_playoffs", as_bool, False),
+            field("url", "url"),
+            field("team_logos", "team_logos", as_team_logo),
+        ],
+        {
+            "roster": __collect_roster,
+            "team_standings": __parse_team_standings,
+            "team_points": __parse_team_points,
+            "team_projected_points": __parse_projected_points,
+            "team_stats": __parse_team_stats,
+        },
+    )
+
+    STANDINGS = Schema(
+        [
+            field("rank", "rank", as_int),
+            field("playoff_seed", "playoff_seed", as_int, 0),
+            field("wins", "outcome_totals/wins", as_int),
+            field("losses", "outcome_totals/losses", as_int),
+            field("ties", "outcome_totals/ties", as_int),
+            field("percentage", "outcome_totals/percentage", as_float),
+            field("points_for", "points_for", as_float),
+            field("points_against", "points_against", as_float),
+            field("div_wins", "divisional_outcome_totals/wins", as_int),
+            field("div_losses", "divisional_outcome_totals/losses", as_int),
+            field("div_ties", "divisional_outcome_totals/ties", as_int),
+            field("streak_type", "streak/type"),
+            field("streak_value", "streak/value", as_int),
+        ]
+    )
 
 
 class Manager:
+    __slots__ = ("manager_id", "name", "felo_score", "felo_tier", "is_commissioner")
+
     def __init__(self, json):
         json = json["manager"]
         self.manager_id = as_int(json["manager_id"])
@@ -95,62 +157,83 @@ class Manager:
         self.is_commissioner = as_bool(json.get("is_commissioner"))
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
+
+
+def as_pro_team(value):
+    return as_shared(value.upper())
+
+
+def as_positions(json):
+    return [as_shared(ep["position"]) for ep in json]
+
+
+def as_image_url(image_url):
+    start = image_url.find("/https") + 1
+    return image_url[start:]
 
 
 class Player:
+    __slots__ = (
+        "key",
+        "id",
+        "name",
+        "first_name",
+        "last_name",
+        "pro_team",
+        "team_name",
+        "number",
+        "position",
+        "is_undroppable",
+        "status",
+        "status_full",
+        "injury_note",
+        "bye_week",
+        "eligible_positions",
+        "image_url",
+        "stats",
+        "points",
+        "team",
+        "percent_owned",
+        "percent_changed",
+        "average_pick",
+        "average_round",
+        "average_cost",
+        "percent_drafted",
+        "selected_position",
+        "is_flex",
+    )
+
     def __init__(self, json):
-        attributes = flatten_attributes(json[0])
-        self.key = attributes["player_key"]
-        self.id = as_int(attributes["player_id"])
-        self.name = attributes["name"]["full"]
-        self.first_name = attributes["name"]["first"]
-        self.last_name = attributes["name"]["last"]
-        self.pro_team = attributes.get("editorial_team_abbr").upper()
-        self.team_name = attributes.get("editorial_team_full_name")
-        self.number = as_int(attributes.get("uniform_number"))
-        self.position = attributes.get("display_position")
-        self.is_undroppable = as_bool(attributes.get("is_undroppable"))
-        self.status = attributes.get("status")
-        self.status_full = attributes.get("status_full")
-        self.injury_note = attributes.get("injury_note")
-        self.bye_week = as_int(attributes.get("bye_weeks", {}).get("week"))
-
-        self.eligible_positions = self.__parse_eligible_positions(attributes)
-        self.image_url = self.__parse_image_url(attributes)
-
-        self.__parse_sub_resources(json)
+        self.stats = None
+        self.points = None
+        self.team = None
+        self.percent_owned = None
+        self.percent_changed = None
+        self.average_pick = None
+        self.average_round = None
+        self.average_cost = None
+        self.percent_drafted = None
+        self.selected_position = None
+        self.is_flex = None
+
+        self.SCHEMA.parse(self, json[0])
+        self.SCHEMA.parse_sub_resources(self, json)
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
-
-    def __parse_sub_resources(self, json):
-        for data in json:
-            if "player_stats" in data:
-                self.__parse_stats(data)
-            if "player_points" in data:
-                self.__parse_points(data)
-            if "ownership" in data:
-                self.__parse_ownership(data)
-            if "percent_owned" in data:
-                self.__parse_percent_owned(data)
-            if "draft_analysis" in data:
-                self.__parse_draft_analysis(data)
-            if "selected_position" in data:
-                self.__parse_selected_position(data)
+        return str(as_dict(self))
 
     def __parse_stats(self, json):
-        json = json["player_stats"]["stats"]
         self.stats = {
-            as_int(s["stat"]["stat_id"]): as_int(s["stat"]["value"]) for s in json
+            as_int(s["stat"]["stat_id"]): as_int(s["stat"]["value"])
+            for s in json["stats"]
         }
 
     def __parse_points(self, json):
-        self.points = as_float(json["player_points"]["total"])
+        self.points = as_float(json["total"])
 
     def __parse_ownership(self, json):
         # TODO
-        json = json["ownership"]
         self.team = (
             None
             if json["ownership_type"] != "team"
@@ -158,26 +241,63 @@ class Player:
         )
 
     def __parse_percent_owned(self, json):
-        json = flatten_attributes(json["percent_owned"])
-        self.percent_owned = as_int(json.get("value"))
-        self.percent_changed = as_int(json.get("delta"))
+        self.PERCENT_OWNED.parse(self, json)
 
     def __parse_draft_analysis(self, json):
-        json = flatten_attributes(json["draft_analysis"])
-        self.average_pick = as_float(json["average_pick"])
-        self.average_round = as_float(json["average_round"])
-        self.average_cost = as_float(json["average_cost"])
-        self.percent_drafted = as_float(json["percent_drafted"])
+        self.DRAFT_ANALYSIS.parse(self, json)
 
     def __parse_selected_position(self, json):
-        json = flatten_attributes(json["selected_position"])
-        self.selected_position = json["position"]
-        self.is_flex = as_bool(json["is_flex"])
-
-    def __parse_eligible_positions(self, json):
-        return [ep["position"] for ep in json.get("eligible_positions", [])]
-
-    def __parse_image_url(self, json):
-        image_url = json.get("image_url", "")
-        start = image_url.find("/https") + 1
-        return image_url[start:]
+        self.SELECTED_POSITION.parse(self, json)
+
+    # Compiled once, after the sub-resource parsers they dispatch to
+    SCHEMA = Schema(
+        [
+            field("key", "player_key"),
+            field("id", "player_id", as_int),
+            field("name", "name/full"),
+            field("first_name", "name/first"),
+            field("last_name", "name/last"),
+            field("pro_team", "editorial_team_abbr", as_pro_team),
+            field("team_name", "editorial_team_full_name", as_shared),
+            field("number", "uniform_number", as_int),
+            field("position", "display_position", as_shared),
+            field("is_undroppable", "is_undroppable", as_bool, False),
+            field("status", "status", as_shared),
+            field("status_full", "status_full", as_shared),
+            field("injury_note", "injury_note"),
+            field("bye_week", "bye_weeks/week", as_int),
+            field("eligible_positions", "eligible_positions", as_positions, list),
+            field("image_url", "image_url", as_image_url, ""),
+        ],
+        {
+            "player_stats": __parse_stats,
+            "player_points": __parse_points,
+            "ownership": __parse_ownership,
+            "percent_owned": __parse_percent_owned,
+            "draft_analysis": __parse_draft_analysis,
+            "selected_position": __parse_selected_position,
+        },
+    )
+
+    PERCENT_OWNED = Schema(
+        [
+            field("percent_owned", "value", as_int),
+            field("percent_changed", "delta", as_int),
+        ]
+    )
+
+    DRAFT_ANALYSIS = Schema(
+        [
+            field("average_pick", "average_pick", as_float),
+            field("average_round", "average_round", as_float),
+            field("average_cost", "average_cost", as_float),
+            field("percent_drafted", "percent_drafted", as_float),
+        ]
+    )
+
+    SELECTED_POSITION = Schema(
+        [
+            field("selected_position", "position", as_shared),
+            field("is_flex", "is_flex", as_bool),
+        ]
+    )
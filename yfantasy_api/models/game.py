@@ -1,7 +1,26 @@
+from yfantasy_api.models.common import Player
+
+
 class Game:
+    __slots__ = (
+        "json",
+        "info",
+        "game_weeks",
+        "position_types",
+        "roster_positions",
+        "stat_categories",
+        "players",
+    )
+
     def __init__(self, json):
         self.json = json
         self.info = self.__parse_game_info(json)
+
+        self.game_weeks = None
+        self.position_types = None
+        self.roster_positions = None
+        self.stat_categories = None
+        self.players = None
         self.__parse_sub_resources(json)
 
     def __parse_game_info(self, json):
@@ -20,6 +39,8 @@ class Game:
                 self.__parse_roster_positions(data["roster_positions"])
             if "stat_categories" in data:
                 self.__parse_stat_categories(data["stat_categories"])
+            if "players" in data:
+                self.__parse_players(data["players"])
 
     def __parse_game_weeks(self, json):
         self.game_weeks = [
@@ -35,8 +56,27 @@ class Game:
     def __parse_stat_categories(self, json):
         self.stat_categories = [StatCategory(d["stat"]) for d in json["stats"]]
 
+    def __parse_players(self, json):
+        if not json:
+            self.players = []
+            return
+        self.players = [Player(json[str(d)]["player"]) for d in range(json["count"])]
+
 
 class GameInfo:
+    __slots__ = (
+        "game_key",
+        "game_id",
+        "name",
+        "code",
+        "type",
+        "url",
+        "season",
+        "is_registration_over",
+        "is_game_over",
+        "is_offseason",
+    )
+
     def __init__(self, json):
         self.game_key = json["game_key"]
         self.game_id = json["game_id"]
@@ -51,6 +91,8 @@ class GameInfo:
 
 
 class GameWeek:
+    __slots__ = ("week", "display_name", "start", "end")
+
     def __init__(self, json):
         self.week = json["week"]
         self.display_name = json["display_name"]
@@ -59,12 +101,23 @@ class GameWeek:
 
 
 class PositionType:
+    __slots__ = ("type", "display_name")
+
     def __init__(self, json):
         self.type = json["type"]
         self.display_name = json["display_name"]
 
 
 class RosterPosition:
+    __slots__ = (
+        "position",
+        "abbreviation",
+        "display_name",
+        "position_type",
+        "is_bench",
+        "is_disabled_list",
+    )
+
     def __init__(self, json):
         self.position = json["position"]
         self.abbreviation = json["abbreviation"]
@@ -75,6 +128,16 @@ class RosterPosition:
 
 
 class StatCategory:
+    __slots__ = (
+        "stat_id",
+        "name",
+        "display_name",
+        "sort_order",
+        "position_types",
+        "is_composite_stat",
+        "base_stats",
+    )
+
     def __init__(self, json):
         self.stat_id = json["stat_id"]
         self.name = json["name"]
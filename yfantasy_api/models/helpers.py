@@ -1,11 +1,4 @@
-def flatten_attributes(json):
-    attributes = {}
-    for d in json:
-        if type(d) == list and len(d) == 0:
-            continue
-        attributes.update(d)
-    return attributes
-
+import sys
 
 EMPTY_VALUES = [None, "-", ""]
 
@@ -26,3 +19,127 @@ def as_bool(value):
     if value in EMPTY_VALUES:
         return False
     return True if as_int(value) else False
+
+
+def as_shared(value):
+    if value is None:
+        return None
+    return sys.intern(value)
+
+
+def field(name, path, convert=None, default=None):
+    return name, path, convert, default
+
+
+MISSING = object()
+
+
+class Schema:
+    """A declarative field spec applied to the attributes in a single pass
+
+    Yahoo encodes the attributes of a resource as a list of small dicts
+    followed by one dict per sub-resource. The paths of a schema are split
+    once, so that parsing a model merges its fragments a single time and
+    reads every field with direct lookups instead of repeated helper calls.
+
+    Attributes
+    ----------
+    fields: list
+        The `(name, path, convert, default)` of every field
+    sub_resources: dict
+        The function called with the model and the json of each
+        sub-resource key
+    """
+
+    def __init__(self, fields, sub_resources=None):
+        """Initialize a new Schema
+
+        Parameters
+        ----------
+        fields: list
+            The `(name, path, convert, default)` of each field, built
+            with `field()`. The path is the `/` separated keys leading to
+            the value, for example `name/full`. A missing key sets the
+            default, or the result of calling it when it is callable.
+        sub_resources: dict
+            The function called with the model and the json of each
+            sub-resource key, for example `{"player_stats": parse_stats}`
+        """
+        self.fields = fields
+        self.sub_resources = sub_resources or {}
+        self.__steps = []
+        for name, path, convert, default in fields:
+            key, *rest = path.split("/")
+            self.__steps.append((name, key, rest, convert, default, callable(default)))
+
+    def parse(self, model, fragments):
+        """Set the fields of a model from a list of attribute fragments"""
+        attributes = {}
+        for fragment in fragments:
+            attributes.update(fragment)
+        self.parse_dict(model, attributes)
+
+    def parse_dict(self, model, attributes):
+        """Set the fields of a model from a single dict of attributes"""
+        get = attributes.get
+        for name, key, rest, convert, default, factory in self.__steps:
+            value = get(key, MISSING)
+            if value is MISSING:
+                value = default() if factory else default
+            else:
+                for k in rest:
+                    value = value.get(k) if value else None
+                if convert:
+                    value = convert(value)
+            setattr(model, name, value)
+
+    def parse_sub_resources(self, model, json):
+        """Call the parser of each sub-resource found after the attributes"""
+        sub_resources = self.sub_resources
+        for data in json:
+            if not isinstance(data, dict):
+                continue
+            for key, value in data.items():
+                parse = sub_resources.get(key)
+                if parse:
+                    parse(model, value)
+
+
+def as_dict(model):
+    attributes = {}
+    for cls in reversed(type(model).__mro__):
+        for slot in getattr(cls, "__slots__", ()):
+            if not slot.startswith("_"):
+                attributes[slot] = getattr(model, slot)
+        for name, value in vars(cls).items():
+            # Reading a sub-resource still held as json would parse it
+            if isinstance(value, lazy) and name not in model._raw:
+                attributes[name] = getattr(model, name)
+    return attributes
+
+
+class lazy:
+    """A sub-resource kept as raw json and only parsed the first time it is read
+
+    The model must have a `_raw` dict holding the json of each sub-resource
+    present in the response and a `_parsed` dict the parsed values are
+    cached in. Sub-resources missing from the response read as `None`.
+    """
+
+    def __init__(self, parse):
+        self.parse = parse
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, model, owner=None):
+        if model is None:
+            return self
+        parsed = model._parsed
+        if self.name not in parsed:
+            json = model._raw.get(self.name)
+            if json is None:
+                return parsed.get(self.name)
+            parsed.setdefault(self.name, self.parse(model, json))
+            model._raw.pop(self.name, None)
+        return parsed[self.name]
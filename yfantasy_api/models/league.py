@@ -1,109 +1,157 @@
 from yfantasy_api.models.common import Player, Team
-from yfantasy_api.models.helpers import as_bool, as_float, as_int, flatten_attributes
-from yfantasy_api.models.transaction import Add, AddDrop, Drop, Trade
+from yfantasy_api.models.helpers import (
+    as_bool,
+    as_dict,
+    as_float,
+    as_int,
+    as_shared,
+    field,
+    lazy,
+    Schema,
+)
+from yfantasy_api.models.transaction import parse_transaction
 
 
 class League:
+    __slots__ = (
+        "key",
+        "id",
+        "name",
+        "url",
+        "logo_url",
+        "draft_status",
+        "num_teams",
+        "scoring_type",
+        "league_type",
+        "add_injured_to_ir",
+        "current_week",
+        "start_week",
+        "start_date",
+        "end_week",
+        "end_date",
+        "game_code",
+        "season",
+        "_raw",
+        "_parsed",
+    )
+
+    # The attribute each sub-resource of the response is parsed into
+    SUB_RESOURCES = {
+        "draft_results": "draft_results",
+        "players": "players",
+        "scoreboard": "matchups",
+        "settings": "settings",
+        "standings": "standings",
+        "teams": "teams",
+        "transactions": "transactions",
+    }
+
+    SCHEMA = Schema(
+        [
+            field("key", "league_key"),
+            field("id", "league_id", as_int),
+            field("name", "name"),
+            field("url", "url"),
+            field("logo_url", "logo_url"),
+            field("draft_status", "draft_status"),
+            field("num_teams", "num_teams", as_int),
+            field("scoring_type", "scoring_type"),
+            field("league_type", "league_type"),
+            field("add_injured_to_ir", "allow_add_to_dl_extra_pos", as_bool, False),
+            field("current_week", "current_week", as_int),
+            field("start_week", "start_week", as_int),
+            field("start_date", "start_date"),
+            field("end_week", "end_week", as_int),
+            field("end_date", "end_date"),
+            field("game_code", "game_code"),
+            field("season", "season", as_int),
+        ]
+    )
+
     def __init__(self, json):
-        attributes = flatten_attributes(json)
-        self.key = attributes.get("league_key")
-        self.id = as_int(attributes.get("league_id"))
-        self.name = attributes.get("name")
-        self.url = attributes.get("url")
-        self.logo_url = attributes.get("logo_url")
-        self.draft_status = attributes.get("draft_status")
-        self.num_teams = as_int(attributes.get("num_teams"))
-        self.scoring_type = attributes.get("scoring_type")
-        self.league_type = attributes.get("league_type")
-        self.add_injured_to_ir = as_bool(attributes.get("allow_add_to_dl_extra_pos"))
-        self.current_week = as_int(attributes.get("current_week"))
-        self.start_week = as_int(attributes.get("start_week"))
-        self.start_date = attributes.get("start_date")
-        self.end_week = as_int(attributes.get("end_week"))
-        self.end_date = attributes.get("end_date")
-        self.game_code = attributes.get("game_code")
-        self.season = as_int(attributes.get("season"))
-        self.__parse_sub_resources(json)
+        self.SCHEMA.parse(self, json)
+
+        self._raw = {}
+        self._parsed = {}
+        self.__collect_sub_resources(json)
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
 
-    def __parse_sub_resources(self, json):
+    def __collect_sub_resources(self, json):
         for data in json:
-            if "draft_results" in data:
-                self.__parse_draft_results(data["draft_results"])
-            if "players" in data:
-                self.__parse_players(data["players"])
-            if "scoreboard" in data:
-                self.__parse_scoreboard(data["scoreboard"])
-            if "settings" in data:
-                self.__parse_settings(data["settings"])
-            if "standings" in data:
-                self.__parse_standings(data["standings"])
-            if "teams" in data:
-                self.__parse_teams(data["teams"])
-            if "transactions" in data:
-                self.__parse_transactions(data["transactions"])
-
-    def __parse_draft_results(self, json):
-        self.draft_results = [
-            DraftResult(json[str(d)]["draft_result"]) for d in range(json["count"])
-        ]
+            for key, name in self.SUB_RESOURCES.items():
+                if key in data:
+                    self._raw[name] = data[key]
 
-    def __parse_players(self, json):
+    @lazy
+    def draft_results(self, json):
+        return [DraftResult(json[str(d)]["draft_result"]) for d in range(json["count"])]
+
+    @lazy
+    def players(self, json):
         if not json:
-            self.players = []
-        else:
-            self.players = [
-                Player(json[str(d)]["player"]) for d in range(json["count"])
-            ]
+            return []
+        return [Player(json[str(d)]["player"]) for d in range(json["count"])]
 
-    def __parse_scoreboard(self, json):
+    @lazy
+    def matchups(self, json):
         json = json["0"]["matchups"]
-        self.matchups = [Matchup(json[str(d)]["matchup"]) for d in range(json["count"])]
+        return [Matchup(json[str(d)]["matchup"]) for d in range(json["count"])]
 
-    def __parse_settings(self, json):
-        self.settings = Settings(json)
+    @lazy
+    def settings(self, json):
+        return Settings(json)
 
-    def __parse_standings(self, json):
+    @lazy
+    def standings(self, json):
         json = json[0]["teams"]
-        self.standings = [Team(json[str(d)]["team"]) for d in range(json["count"])]
-
-    def __parse_teams(self, json):
-        self.teams = [Team(json[str(d)]["team"]) for d in range(json["count"])]
+        return [Team(json[str(d)]["team"]) for d in range(json["count"])]
 
-    def __parse_transactions(self, json):
-        self.transactions = []
+    @lazy
+    def teams(self, json):
+        return [Team(json[str(d)]["team"]) for d in range(json["count"])]
 
+    @lazy
+    def transactions(self, json):
         if not json:
-            return
+            return []
 
-        for t in reversed(range(json["count"])):
-            transaction = json[str(t)]["transaction"]
-            transaction_type = transaction[0]["type"]
-
-            if transaction_type == "add":
-                self.transactions.append(Add(transaction))
-            elif transaction_type == "drop":
-                self.transactions.append(Drop(transaction))
-            elif transaction_type == "add/drop":
-                self.transactions.append(AddDrop(transaction))
-            elif transaction_type == "trade":
-                self.transactions.append(Trade(transaction))
+        transactions = [
+            parse_transaction(json[str(t)]["transaction"])
+            for t in reversed(range(json["count"]))
+        ]
+        return [t for t in transactions if t]
 
 
 class DraftResult:
+    __slots__ = ("pick", "round", "team_key", "player")
+
     def __init__(self, json):
         self.pick = as_int(json["pick"])
         self.round = as_int(json["round"])
-        self.team_key = json["team_key"]
+        self.team_key = as_shared(json["team_key"])
         self.player = Player(json["0"]["players"]["0"]["player"])
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
 
 
 class Matchup:
+    __slots__ = (
+        "week",
+        "week_start",
+        "week_end",
+        "status",
+        "is_current",
+        "is_playoffs",
+        "is_consolation",
+        "is_tied",
+        "teams",
+        "winning_team",
+        "losing_team",
+    )
+
     def __init__(self, json):
         self.week = as_int(json.get("week"))
         self.week_start = json.get("week_start")
@@ -114,6 +162,8 @@ class Matchup:
         self.is_consolation = as_bool(json.get("is_consolation"))
         self.is_tied = as_bool(json.get("is_tied"))
 
+        self.winning_team = None
+        self.losing_team = None
         self.__parse_teams(json)
 
     def __parse_winning_team(self, teams, winning_team_key):
@@ -131,10 +181,43 @@ class Matchup:
             self.losing_team = self.__parse_losing_team(self.teams, winning_team_key)
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
 
 
 class Settings:
+    __slots__ = (
+        "draft_type",
+        "is_auction",
+        "scoring_type",
+        "persistent_url",
+        "has_playoff",
+        "has_consolation",
+        "playoff_start_week",
+        "has_reseeding",
+        "lock_eliminatd_teams",
+        "num_playoff_teams",
+        "num_consolation_teams",
+        "has_multiweek_championship",
+        "waiver_type",
+        "waiver_rule",
+        "uses_faab",
+        "seconds_per_pick",
+        "post_draft_players",
+        "max_teams",
+        "days_on_waivers",
+        "trade_end_date",
+        "trade_ratify_type",
+        "days_to_veto",
+        "player_pool",
+        "cant_cut_list",
+        "trade_draft_picks",
+        "fractional_points",
+        "negative_points",
+        "divisions",
+        "roster_positions",
+        "stat_categories",
+    )
+
     def __init__(self, json):
         json = json[0]
         self.draft_type = json.get("draft_type")
@@ -169,7 +252,7 @@ class Settings:
         self.stat_categories = self.__parse_stat_categories(json)
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
 
     def __parse_roster_positions(self, json):
         json = json.get("roster_positions")
@@ -194,15 +277,19 @@ class Settings:
 
 
 class Division:
+    __slots__ = ("id", "name")
+
     def __init__(self, json):
         self.id = as_int(json["division_id"])
         self.name = json["name"]
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
 
 
 class Stat:
+    __slots__ = ("id", "name", "display_name", "value")
+
     def __init__(self, category, modifiers):
         self.id = category["stat_id"]
         self.name = category["name"]
@@ -210,4 +297,4 @@ class Stat:
         self.value = modifiers.get(self.id)
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
@@ -0,0 +1,88 @@
+from yfantasy_api.models.columnar import (
+    as_players,
+    np,
+    require,
+    stat_ids,
+    stats_matrix,
+)
+
+
+class Scoring:
+    """Scoring: Computes fantasy points from the stat modifiers of a league
+
+    The modifiers of a points league are turned into a vector, so that
+    the points of a whole player pool are a single matrix multiply of its
+    stats matrix by that vector. Stats are matched on the stat ids of
+    the league settings; missing stats and stats without a modifier are
+    worth nothing.
+
+    Attributes
+    ----------
+    stat_ids: list
+        The stat ids of the league, in the order of the stats columns
+    modifiers: numpy.ndarray
+        The points each stat is worth, in the order of `stat_ids`
+    """
+
+    def __init__(self, settings):
+        """Initialize a new Scoring from the league settings
+
+        Parameters
+        ----------
+        settings: Settings
+            The league settings holding the stat categories and modifiers,
+            for example `api.league().settings().get().settings`
+        """
+        require(np, "numpy")
+        self.stat_ids = stat_ids(settings.stat_categories)
+        self.modifiers = np.array(
+            [c.value or 0.0 for c in settings.stat_categories], dtype=np.float64
+        )
+
+    def points(self, stats):
+        """Compute the points of a stats matrix or tensor
+
+        Parameters
+        ----------
+        stats: numpy.ndarray
+            An array whose last axis holds the stats in the order of
+            `stat_ids`, such as a `(players, stats)` matrix or a
+            `(weeks, players, stats)` tensor built with `stats_matrix`.
+            Every leading axis is kept in the result.
+        """
+        return np.nan_to_num(stats) @ self.modifiers
+
+    def player_points(self, players):
+        """Compute the points of each player from their stats
+
+        Parameters
+        ----------
+        players: list
+            The players to score, with the `stats` sub-resource
+        """
+        return self.points(stats_matrix(players, self.stat_ids))
+
+    def period_points(self, periods):
+        """Compute the points of the same players over several periods
+
+        Parameters
+        ----------
+        periods: list
+            One list of players per date or week, for example the result
+            of `players(...).stats(week=w).get_all()` for every week. The
+            lists must hold the same players, the rows of every period are
+            matched on the player keys and follow the order of the first.
+
+        Returns a `(periods, players)` array of points, raises a
+        `ValueError` when a period holds other players than the first.
+        """
+        keys = [player.key for player in as_players(periods[0])]
+        stats = []
+        for players in periods:
+            players = as_players(players)
+            rows = {player.key: row for row, player in enumerate(players)}
+            if len(players) != len(keys) or rows.keys() != set(keys):
+                raise ValueError("Every period must hold the same players")
+            matrix = stats_matrix(players, self.stat_ids)
+            stats.append(matrix[[rows[key] for key in keys]])
+        return self.points(np.stack(stats))
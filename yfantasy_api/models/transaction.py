@@ -1,21 +1,38 @@
 from yfantasy_api.models.common import Player
-from yfantasy_api.models.helpers import as_int
+from yfantasy_api.models.helpers import as_dict, as_int, as_shared
 
 
 class Transaction:
+    __slots__ = (
+        "transaction_key",
+        "transaction_id",
+        "type",
+        "status",
+        "timestamp",
+        "faab_bid",
+    )
+
     def __init__(self, json):
         self.transaction_key = json["transaction_key"]
         self.transaction_id = json["transaction_id"]
-        self.type = json["type"]
-        self.status = json["status"]
+        self.type = as_shared(json["type"])
+        self.status = as_shared(json["status"])
         self.timestamp = json["timestamp"]
         self.faab_bid = json.get("faab_bid")
 
     def __repr__(self):
-        return str(self.__dict__)  # pragma: no cover
+        return str(as_dict(self))
 
 
 class Add(Transaction):
+    __slots__ = (
+        "added_player",
+        "source_type",
+        "destination_type",
+        "destination_team_key",
+        "destination_team_name",
+    )
+
     def __init__(self, json):
         super().__init__(json[0])
         self.added_player = Player(json[1]["players"]["0"]["player"])
@@ -24,13 +41,21 @@ class Add(Transaction):
         )
 
     def __parse_transaction_data(self, json):
-        self.source_type = json["source_type"]
-        self.destination_type = json["destination_type"]
-        self.destination_team_key = json["destination_team_key"]
-        self.destination_team_name = json["destination_team_name"]
+        self.source_type = as_shared(json["source_type"])
+        self.destination_type = as_shared(json["destination_type"])
+        self.destination_team_key = as_shared(json["destination_team_key"])
+        self.destination_team_name = as_shared(json["destination_team_name"])
 
 
 class Drop(Transaction):
+    __slots__ = (
+        "dropped_player",
+        "source_type",
+        "source_team_key",
+        "source_team_name",
+        "destination_type",
+    )
+
     def __init__(self, json):
         super().__init__(json[0])
         self.dropped_player = Player(json[1]["players"]["0"]["player"])
@@ -39,13 +64,22 @@ class Drop(Transaction):
         )
 
     def __parse_transaction_data(self, json):
-        self.source_type = json["source_type"]
-        self.source_team_key = json["source_team_key"]
-        self.source_team_name = json["source_team_name"]
-        self.destination_type = json["destination_type"]
+        self.source_type = as_shared(json["source_type"])
+        self.source_team_key = as_shared(json["source_team_key"])
+        self.source_team_name = as_shared(json["source_team_name"])
+        self.destination_type = as_shared(json["destination_type"])
 
 
 class AddDrop(Transaction):
+    __slots__ = (
+        "added_player",
+        "dropped_player",
+        "source_type",
+        "destination_type",
+        "destination_team_key",
+        "destination_team_name",
+    )
+
     def __init__(self, json):
         super().__init__(json[0])
         self.added_player = Player(json[1]["players"]["0"]["player"])
@@ -55,31 +89,50 @@ class AddDrop(Transaction):
         )
 
     def __parse_transaction_data(self, json):
-        self.source_type = json["source_type"]
-        self.destination_type = json["destination_type"]
-        self.destination_team_key = json["destination_team_key"]
-        self.destination_team_name = json["destination_team_name"]
+        self.source_type = as_shared(json["source_type"])
+        self.destination_type = as_shared(json["destination_type"])
+        self.destination_team_key = as_shared(json["destination_team_key"])
+        self.destination_team_name = as_shared(json["destination_team_name"])
 
 
 class Pick:
+    __slots__ = (
+        "source_team_key",
+        "source_team_name",
+        "destination_team_key",
+        "destination_team_name",
+        "original_team_key",
+        "original_team_name",
+        "round",
+    )
+
     def __init__(self, json):
-        self.source_team_key = json["source_team_key"]
-        self.source_team_name = json["source_team_name"]
-        self.destination_team_key = json["destination_team_key"]
-        self.destination_team_name = json["destination_team_name"]
-        self.original_team_key = json["original_team_key"]
-        self.original_team_name = json["original_team_name"]
+        self.source_team_key = as_shared(json["source_team_key"])
+        self.source_team_name = as_shared(json["source_team_name"])
+        self.destination_team_key = as_shared(json["destination_team_key"])
+        self.destination_team_name = as_shared(json["destination_team_name"])
+        self.original_team_key = as_shared(json["original_team_key"])
+        self.original_team_name = as_shared(json["original_team_name"])
         self.round = as_int(json["round"])
 
 
 class Trade(Transaction):
+    __slots__ = (
+        "trader_team_key",
+        "trader_team_name",
+        "tradee_team_key",
+        "tradee_team_name",
+        "traded_picks",
+        "traded_players",
+    )
+
     def __init__(self, json):
         info = json[0]
         super().__init__(info)
-        self.trader_team_key = info["trader_team_key"]
-        self.trader_team_name = info["trader_team_name"]
-        self.tradee_team_key = info["tradee_team_key"]
-        self.tradee_team_name = info["tradee_team_name"]
+        self.trader_team_key = as_shared(info["trader_team_key"])
+        self.trader_team_name = as_shared(info["trader_team_name"])
+        self.tradee_team_key = as_shared(info["tradee_team_key"])
+        self.tradee_team_name = as_shared(info["tradee_team_name"])
         self.traded_picks = [Pick(d["pick"]) for d in info.get("picks", [])]
         json = json[1]["players"]
 
@@ -89,3 +142,11 @@ class Trade(Transaction):
             self.traded_players = [
                 Player(json[str(d)]["player"]) for d in range(json["count"])
             ]
+
+
+TRANSACTION_TYPES = {"add": Add, "drop": Drop, "add/drop": AddDrop, "trade": Trade}
+
+
+def parse_transaction(json):
+    transaction_type = TRANSACTION_TYPES.get(json[0]["type"])
+    return transaction_type(json) if transaction_type else None
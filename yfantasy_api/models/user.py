@@ -4,9 +4,14 @@ from yfantasy_api.models.league import League
 
 
 class User:
+    __slots__ = ("json", "guid", "games", "teams")
+
     def __init__(self, json):
         self.json = json
         self.guid = json[0]["guid"]
+
+        self.games = None
+        self.teams = None
         self.__parse_sub_resources(json)
 
     def __parse_sub_resources(self, json):